@@ -0,0 +1,326 @@
+"""
+Batch Sales Invoice generation for submitted bookings.
+
+    create_invoices(filters)    queue invoices for every matching booking / stage
+
+Filters:
+
+    project        RE Project (optional)
+    from_date      booking date (or stage due date) from
+    to_date        booking date (or stage due date) to
+    invoice_by     "Booking" — one invoice for the booking's final value
+                   "Stage"   — one invoice per payment schedule stage
+    stage          stage name, for invoice_by = "Stage" (optional)
+
+Company, accounts and the invoice item are resolved once per batch; invoices
+are built in INVOICE_CHUNK-sized jobs on the long queue, each committing on
+its own. Invoices carry re_booking / re_schedule_row (custom fields on Sales
+Invoice), so a booking or stage that already has a non-cancelled invoice is
+skipped — re-running a batch only fills the gaps. A booking-level invoice
+covers all its stages and vice versa.
+
+Progress is pushed to the requesting user over realtime
+("re_batch_invoice_progress" / "re_batch_invoice_done").
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import cint, flt, getdate, nowdate
+
+INVOICE_CHUNK = 50
+INVOICE_ROLES = ["RE Accounts", "RE Admin", "System Manager"]
+INVOICE_BY = ("Booking", "Stage")
+
+PROGRESS_KEY = "re_batch_invoice"
+PROGRESS_TTL = 24 * 3600
+
+
+@frappe.whitelist()
+def create_invoices(filters=None):
+    """
+    Queue Sales Invoices for the bookings / stages matching `filters`.
+    Returns {"batch_id", "total", "chunks"}; total is 0 when everything
+    matching is already invoiced.
+    """
+    frappe.only_for(INVOICE_ROLES)
+    filters = _get_filters(filters)
+    context = get_invoice_context()
+
+    pending = _get_pending(filters)
+    batch_id = frappe.generate_hash(length=10)
+    if not pending:
+        return {"batch_id": batch_id, "total": 0, "chunks": 0}
+
+    chunks = [pending[i : i + INVOICE_CHUNK] for i in range(0, len(pending), INVOICE_CHUNK)]
+    for chunk in chunks:
+        frappe.enqueue(
+            "real_estate_crm.api.re_batch_invoice.run_invoice_chunk",
+            queue="long",
+            timeout=1800,
+            batch_id=batch_id,
+            keys=chunk,
+            context=context,
+            total=len(pending),
+            user=frappe.session.user,
+        )
+    return {"batch_id": batch_id, "total": len(pending), "chunks": len(chunks)}
+
+
+def get_invoice_context(company=None):
+    """Company, currency, accounts, cost center and item shared by every invoice."""
+    company = (
+        company
+        or frappe.defaults.get_user_default("Company")
+        or frappe.db.get_single_value("Global Defaults", "default_company")
+    )
+    if not company:
+        frappe.throw(_("Set a default company before generating invoices."))
+
+    defaults = frappe.get_cached_value(
+        "Company",
+        company,
+        ["abbr", "default_currency", "default_receivable_account", "default_income_account", "cost_center"],
+        as_dict=True,
+    )
+    item_code = frappe.db.get_single_value("RE CRM Settings", "invoice_item")
+    return {
+        "company": company,
+        "currency": defaults.default_currency,
+        "debit_to": _account(f"Accounts Receivable - Real Estate - {defaults.abbr}", defaults.default_receivable_account),
+        "income_account": _account(f"Plot Sales Revenue - {defaults.abbr}", defaults.default_income_account),
+        "cost_center": defaults.cost_center,
+        "item_code": item_code,
+        "uom": (item_code and frappe.get_cached_value("Item", item_code, "stock_uom")) or "Nos",
+    }
+
+
+def run_invoice_chunk(batch_id, keys, context, total, user):
+    """
+    Background job: one draft Sales Invoice per [booking, schedule_row] key.
+    A chunk that fails as a whole is rolled back and its keys counted as
+    failed, so the batch still reaches done.
+    """
+    created, skipped, failed, chunk_failed = [], 0, 0, 0
+    try:
+        context = frappe._dict(context)
+        rows = _load_rows(keys)
+        customer_names = _get_customer_names({r.customer for r in rows.values()})
+
+        for booking, schedule_row in keys:
+            row = rows.get((booking, schedule_row))
+            frappe.db.savepoint("re_batch_invoice")
+            try:
+                # Lock the booking so concurrent batches cannot both invoice it.
+                frappe.db.get_value("RE Booking", booking, "name", for_update=True)
+                if row is None or _is_invoiced(booking, schedule_row):
+                    skipped += 1
+                    continue
+                created.append(make_invoice(row, context, customer_names.get(row.customer)))
+            except Exception:
+                frappe.db.rollback(save_point="re_batch_invoice")
+                frappe.log_error(title=_("RE CRM — Batch Invoice Failed for {0}").format(booking))
+                failed += 1
+        frappe.db.commit()
+    except Exception:
+        frappe.db.rollback()
+        created, failed, chunk_failed = [], len(keys) - skipped, 1
+        raise
+    finally:
+        progress = _add_progress(
+            batch_id,
+            created=len(created),
+            skipped=skipped,
+            failed=failed,
+            failed_chunks=chunk_failed,
+            done=len(keys),
+        )
+        progress.update(batch_id=batch_id, total=total)
+        if progress.pop("failed_chunks"):
+            progress["error"] = _("Some invoice jobs failed; see the Error Log.")
+        _publish(user, "re_batch_invoice_progress", **progress)
+        if progress["done"] >= total:
+            _publish(user, "re_batch_invoice_done", **progress)
+
+
+def make_invoice(row, context, customer_name=None):
+    """Insert a draft Sales Invoice for a booking (or one stage of it)."""
+    if row.schedule_row:
+        description = _("{0} — Plot {1}, Project: {2}\nBooking Ref: {3}").format(
+            row.stage_name, row.plot, row.project, row.booking
+        )
+    else:
+        description = _("Sale of Plot {0}, Project: {1}\nBooking Ref: {2}").format(
+            row.plot, row.project, row.booking
+        )
+
+    si = frappe.get_doc(
+        {
+            "doctype": "Sales Invoice",
+            "company": context.company,
+            "customer": row.customer,
+            "customer_name": customer_name or row.customer,
+            "currency": context.currency,
+            "conversion_rate": 1,
+            "debit_to": context.debit_to,
+            "posting_date": nowdate(),
+            "set_posting_time": 1,
+            "due_date": max(getdate(row.due_date or nowdate()), getdate(nowdate())),
+            "re_booking": row.booking,
+            "re_schedule_row": row.schedule_row or "",
+            "items": [
+                {
+                    "item_code": context.item_code,
+                    "item_name": _("Plot {0}").format(row.plot),
+                    "description": description,
+                    "uom": context.uom,
+                    "qty": 1,
+                    "rate": flt(row.amount),
+                    "amount": flt(row.amount),
+                    "income_account": context.income_account,
+                    "cost_center": context.cost_center,
+                }
+            ],
+        }
+    )
+    si.flags.ignore_permissions = True
+    si.insert()
+    return si.name
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _get_filters(filters):
+    filters = frappe._dict(frappe.parse_json(filters) or {})
+    filters.invoice_by = filters.invoice_by or "Booking"
+    if filters.invoice_by not in INVOICE_BY:
+        frappe.throw(_("Invoice By must be one of {0}").format(", ".join(INVOICE_BY)))
+    if filters.from_date and filters.to_date and getdate(filters.from_date) > getdate(filters.to_date):
+        frappe.throw(_("From Date cannot be after To Date"))
+    return filters
+
+
+def _get_pending(filters):
+    """[booking, schedule_row] keys matching `filters` that have no invoice yet."""
+    conditions = ["b.docstatus = 1", "b.booking_status != 'Cancelled'"]
+    if filters.project:
+        conditions.append("b.project = %(project)s")
+
+    if filters.invoice_by == "Stage":
+        date_field = "ps.due_date"
+        if filters.stage:
+            conditions.append("ps.stage_name = %(stage)s")
+        conditions.append("ps.status != 'Cancelled'")
+        conditions.append("ps.amount_due > 0")
+        conditions.append(_NOT_INVOICED.format(schedule_row="ps.name"))
+        query = """
+            SELECT b.name, ps.name
+            FROM `tabRE Booking Payment Schedule` ps
+            INNER JOIN `tabRE Booking` b ON b.name = ps.parent
+            WHERE {conditions}
+            ORDER BY b.name, ps.stage_order
+        """
+    else:
+        date_field = "b.booking_date"
+        conditions.append("b.final_value > 0")
+        conditions.append(_NOT_INVOICED.format(schedule_row="''"))
+        query = """
+            SELECT b.name, ''
+            FROM `tabRE Booking` b
+            WHERE {conditions}
+            ORDER BY b.name
+        """
+
+    if filters.from_date:
+        conditions.append(f"{date_field} >= %(from_date)s")
+    if filters.to_date:
+        conditions.append(f"{date_field} <= %(to_date)s")
+
+    return [list(key) for key in frappe.db.sql(query.format(conditions=" AND ".join(conditions)), filters)]
+
+
+# A booking-level invoice (re_schedule_row = '') covers every stage, and any
+# stage invoice rules out a booking-level one.
+_NOT_INVOICED = """
+    NOT EXISTS (
+        SELECT 1 FROM `tabSales Invoice` si
+        WHERE si.re_booking = b.name
+            AND si.docstatus < 2
+            AND ({schedule_row} = '' OR IFNULL(si.re_schedule_row, '') IN ('', {schedule_row}))
+    )
+"""
+
+
+def _is_invoiced(booking, schedule_row):
+    return bool(
+        frappe.db.sql(
+            """
+            SELECT 1 FROM `tabSales Invoice`
+            WHERE re_booking = %(booking)s
+                AND docstatus < 2
+                AND (%(schedule_row)s = '' OR IFNULL(re_schedule_row, '') IN ('', %(schedule_row)s))
+            LIMIT 1
+            """,
+            {"booking": booking, "schedule_row": schedule_row or ""},
+        )
+    )
+
+
+def _load_rows(keys):
+    """Invoice lines for a chunk, keyed by (booking, schedule_row)."""
+    bookings = list({booking for booking, _row in keys})
+    rows = {}
+    for b in frappe.db.sql(
+        """
+        SELECT name AS booking, customer, project, plot, final_value AS amount
+        FROM `tabRE Booking`
+        WHERE name IN %s AND docstatus = 1
+        """,
+        [bookings],
+        as_dict=True,
+    ):
+        rows[(b.booking, "")] = frappe._dict(b, schedule_row="", stage_name=None, due_date=None)
+
+    stage_names = [row for _booking, row in keys if row]
+    if stage_names:
+        for ps in frappe.db.sql(
+            """
+            SELECT parent AS booking, name AS schedule_row, stage_name, due_date, amount_due AS amount
+            FROM `tabRE Booking Payment Schedule`
+            WHERE name IN %s
+            """,
+            [stage_names],
+            as_dict=True,
+        ):
+            booking = rows.get((ps.booking, ""))
+            if booking:
+                rows[(ps.booking, ps.schedule_row)] = frappe._dict(booking, **ps)
+    return rows
+
+
+def _get_customer_names(customers):
+    if not customers:
+        return {}
+    return dict(
+        frappe.db.sql("SELECT name, customer_name FROM `tabCustomer` WHERE name IN %s", [list(customers)])
+    )
+
+
+def _account(preferred, fallback):
+    return preferred if frappe.db.exists("Account", preferred) else fallback
+
+
+def _add_progress(batch_id, **counts):
+    """Add this chunk's counts to the batch totals shared by all its jobs."""
+    cache = frappe.cache()
+    keys = {field: cache.make_key(f"{PROGRESS_KEY}:{batch_id}:{field}") for field in counts}
+    pipe = cache.pipeline()
+    for field, count in counts.items():
+        pipe.incrby(keys[field], count)
+        pipe.expire(keys[field], PROGRESS_TTL)
+    results = pipe.execute()
+    return {field: cint(results[2 * i]) for i, field in enumerate(counts)}
+
+
+def _publish(user, event, **message):
+    frappe.publish_realtime(event, message, user=user, after_commit=False)
@@ -0,0 +1,31 @@
+"""
+Cash-flow forecast API — expected collections by month for the next
+24 months, by project and RM, under optional what-if scenarios.
+See utils/cash_flow_forecast.py for the engine and scenario keys.
+"""
+
+import frappe
+
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.cash_flow_forecast import get_forecast, get_scenario
+from real_estate_crm.utils.replica import use_replica
+
+FORECAST_ROLES = ["RE Accounts", "RE Admin", "RE Sales Manager", "System Manager"]
+
+
+@frappe.whitelist()
+@use_replica()
+@instrument()
+def get_cash_flow_forecast(scenario=None):
+    """
+    Forecast for `scenario` ({"possession_delay_months", "payment_delay_days",
+    "collection_efficiency"}). For anything but the default scenario the
+    as-scheduled monthly totals come back too, as `baseline_total`.
+    """
+    frappe.only_for(FORECAST_ROLES)
+
+    scenario = get_scenario(scenario)
+    forecast = get_forecast(scenario)
+    if scenario != get_scenario():
+        forecast = dict(forecast, baseline_total=get_forecast()["total"])
+    return forecast
@@ -0,0 +1,291 @@
+"""
+Batch customer statements: ledger and schedule status per customer, as PDF.
+
+    generate_statements(project=None, customers=None, from_date=None,
+                        to_date=None, output="Zip")
+
+Runs on the long queue. Ledgers are streamed from the Customer Ledger's
+batch mode (iter_ledgers, one query over its own connection) and gathered
+STATEMENT_BATCH customers at a time; customers without receipts follow.
+Each batch loads its schedule rows in one query, is rendered to HTML in
+this process, and converted HTML → PDF by wkhtmltopdf in a process pool —
+one worker per core, or `re_statement_workers` in site_config.json. The
+pool uses spawned processes that never touch the database.
+
+output = "Zip"     one zip of every PDF, attached to the job's owner
+                   (private file), link pushed on completion
+output = "Attach"  each PDF is attached to its Customer (private file)
+
+Progress and throughput (pages per second, peak memory of the job and its
+PDF workers) are pushed to the requesting user over realtime
+("re_statement_progress" / "re_statement_done").
+"""
+
+import io
+import os
+import resource
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from multiprocessing import get_context
+
+import frappe
+from frappe import _
+from frappe.utils import cint, flt, fmt_money, getdate, now_datetime, nowdate
+
+from real_estate_crm.real_estate_crm.report.customer_ledger.customer_ledger import iter_ledgers
+
+STATEMENT_ROLES = ["RE Accounts", "RE Admin", "System Manager"]
+OUTPUTS = ("Zip", "Attach")
+STATEMENT_BATCH = 200
+TEMPLATE = "real_estate_crm/templates/customer_statement.html"
+
+PDF_OPTIONS = {
+    "page-size": "A4",
+    "encoding": "UTF-8",
+    "margin-top": "15mm",
+    "margin-bottom": "15mm",
+    "margin-left": "12mm",
+    "margin-right": "12mm",
+    "disable-javascript": "",
+    "disable-local-file-access": "",
+    "quiet": "",
+}
+
+
+@frappe.whitelist()
+def generate_statements(project=None, customers=None, from_date=None, to_date=None, output="Zip"):
+    """Queue statements for `customers`, or every customer of `project` (or of all projects)."""
+    frappe.only_for(STATEMENT_ROLES)
+    if output not in OUTPUTS:
+        frappe.throw(_("Output must be one of {0}").format(", ".join(OUTPUTS)))
+
+    customers = frappe.parse_json(customers) or []
+    if project and not frappe.db.exists("RE Project", project):
+        frappe.throw(_("Project {0} not found").format(project))
+
+    frappe.enqueue(
+        "real_estate_crm.api.re_customer_statements.run_statements",
+        queue="long",
+        timeout=4 * 3600,
+        project=project,
+        customers=customers,
+        from_date=from_date,
+        to_date=to_date or nowdate(),
+        output=output,
+        user=frappe.session.user,
+    )
+    return {"queued": True}
+
+
+def run_statements(project, customers, from_date, to_date, output, user):
+    """Background job: render every statement and report throughput to `user`."""
+    started = time.monotonic()
+    ledger_filters = frappe._dict(project=project, from_date=from_date, to_date=to_date)
+    # A whole project streams by project; explicit lists (and all projects) by customer.
+    if customers or not project:
+        customers = customers or _get_customers(project)
+        ledger_filters.customers = tuple(customers)
+    else:
+        customers = _get_customers(project)
+    company = frappe.db.get_single_value("Global Defaults", "default_company")
+    currency = company and frappe.get_cached_value("Company", company, "default_currency")
+    template = frappe.get_jenv().get_template(TEMPLATE)
+    names = _get_customer_names(customers)
+
+    zip_name = "customer-statements-{0}.zip".format(now_datetime().strftime("%Y%m%d-%H%M%S"))
+    zip_path = frappe.get_site_path("private", "files", zip_name)
+    archive = zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) if output == "Zip" else None
+
+    done = pages = 0
+    workers = cint(frappe.conf.get("re_statement_workers")) or os.cpu_count() or 1
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            for batch, ledgers in _iter_batches(customers, iter_ledgers(ledger_filters) if customers else ()):
+                schedules = _load_schedules(batch, project)
+
+                html = [
+                    template.render(
+                        _get_context(
+                            customer,
+                            names.get(customer, customer),
+                            schedules.get(customer, []),
+                            ledgers.get(customer, []),
+                            from_date,
+                            to_date,
+                            company,
+                            currency,
+                        )
+                    )
+                    for customer in batch
+                ]
+                for customer, (pdf, page_count) in zip(batch, pool.map(render_pdf, html, chunksize=4)):
+                    file_name = f"{frappe.scrub(customer)}-statement-{to_date}.pdf"
+                    if archive:
+                        archive.writestr(file_name, pdf)
+                    else:
+                        _attach(customer, file_name, pdf)
+                    pages += page_count
+
+                if not archive:
+                    frappe.db.commit()
+                done += len(batch)
+                _publish(user, "re_statement_progress", done=done, total=len(customers), pages=pages)
+    finally:
+        if archive:
+            archive.close()
+
+    file_url = None
+    if archive:
+        file_url = _save_zip(zip_name, zip_path, user)
+        frappe.db.commit()
+
+    seconds = time.monotonic() - started
+    _publish(
+        user,
+        "re_statement_done",
+        customers=done,
+        pages=pages,
+        seconds=round(seconds, 1),
+        pages_per_second=round(pages / seconds, 2) if seconds else 0,
+        peak_memory_mb=_peak_memory_mb(),
+        file_url=file_url,
+    )
+
+
+def render_pdf(html):
+    """Process-pool worker: HTML → (PDF bytes, page count). No Frappe context."""
+    import pdfkit
+    from pypdf import PdfReader
+
+    pdf = pdfkit.from_string(html, False, options=PDF_OPTIONS)
+    return pdf, len(PdfReader(io.BytesIO(pdf)).pages)
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _get_customers(project):
+    return frappe.db.sql_list(
+        """
+        SELECT DISTINCT customer
+        FROM `tabRE Booking`
+        WHERE docstatus = 1 {project_cond}
+        ORDER BY customer
+        """.format(project_cond="AND project = %(project)s" if project else ""),
+        {"project": project},
+    )
+
+
+def _get_customer_names(customers):
+    if not customers:
+        return {}
+    return dict(
+        frappe.db.sql("SELECT name, customer_name FROM `tabCustomer` WHERE name IN %s", [tuple(customers)])
+    )
+
+
+def _load_schedules(customers, project):
+    rows = frappe.db.sql(
+        """
+        SELECT
+            b.customer, b.name AS booking, b.plot, ps.stage_name, ps.due_date,
+            ps.amount_due, ps.amount_received, ps.balance, ps.status
+        FROM `tabRE Booking Payment Schedule` ps
+        INNER JOIN `tabRE Booking` b ON b.name = ps.parent
+        WHERE b.docstatus = 1
+            AND b.booking_status != 'Cancelled'
+            AND b.customer IN %(customers)s
+            {project_cond}
+        ORDER BY b.customer, b.name, ps.stage_order
+        """.format(project_cond="AND b.project = %(project)s" if project else ""),
+        {"customers": tuple(customers), "project": project},
+        as_dict=True,
+    )
+    return _group_by_customer(rows)
+
+
+def _iter_batches(customers, ledgers):
+    """
+    (batch, {customer: ledger rows}) of up to STATEMENT_BATCH customers: those
+    in the ledger stream first, as they arrive, then the ones without receipts.
+    """
+    pending, batch = set(customers), {}
+    for customer, rows in ledgers:
+        if customer not in pending:
+            continue
+        pending.discard(customer)
+        batch[customer] = rows
+        if len(batch) == STATEMENT_BATCH:
+            yield list(batch), batch
+            batch = {}
+    if batch:
+        yield list(batch), batch
+
+    rest = [customer for customer in customers if customer in pending]
+    for start in range(0, len(rest), STATEMENT_BATCH):
+        yield rest[start : start + STATEMENT_BATCH], {}
+
+
+def _group_by_customer(rows):
+    return {customer: list(group) for customer, group in groupby(rows, key=lambda row: row.customer)}
+
+
+def _get_context(customer, customer_name, schedule, ledger, from_date, to_date, company, currency):
+    return {
+        "customer": customer,
+        "customer_name": customer_name,
+        "schedule": schedule,
+        "ledger": ledger,
+        "from_date": getdate(from_date) if from_date else None,
+        "to_date": getdate(to_date),
+        "company": company or "",
+        "total_due": sum(flt(r.amount_due) for r in schedule),
+        "total_received": sum(flt(r.amount_received) for r in schedule),
+        "overdue": sum(flt(r.balance) for r in schedule if r.status == "Overdue"),
+        "fmt": lambda value: fmt_money(flt(value), currency=currency),
+    }
+
+
+def _attach(customer, file_name, pdf):
+    file_doc = frappe.get_doc(
+        {
+            "doctype": "File",
+            "file_name": file_name,
+            "attached_to_doctype": "Customer",
+            "attached_to_name": customer,
+            "is_private": 1,
+            "content": pdf,
+        }
+    )
+    file_doc.flags.ignore_permissions = True
+    file_doc.insert()
+
+
+def _save_zip(zip_name, zip_path, user):
+    file_doc = frappe.get_doc(
+        {
+            "doctype": "File",
+            "file_name": zip_name,
+            "file_url": "/private/files/" + zip_name,
+            "is_private": 1,
+            "attached_to_doctype": "User",
+            "attached_to_name": user,
+            "file_size": os.path.getsize(zip_path),
+        }
+    )
+    file_doc.flags.ignore_permissions = True
+    file_doc.insert()
+    return file_doc.file_url
+
+
+def _peak_memory_mb():
+    # ru_maxrss is in KiB on Linux; children = the PDF workers (largest one).
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {"job": round(own / 1024, 1), "pdf_worker": round(workers / 1024, 1)}
+
+
+def _publish(user, event, **message):
+    frappe.publish_realtime(event, message, user=user, after_commit=False)
@@ -8,6 +8,10 @@ Relationship Managers, and Customers. Returns max 5 results per category.
 import frappe
 from frappe.utils import cstr
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.replica import use_replica
+
+RESULTS_PER_CATEGORY = 5
 
 SEARCH_CONFIG = [
     {
@@ -69,8 +73,17 @@ SEARCH_CONFIG = [
 
 
 @frappe.whitelist()
+@use_replica()
+@instrument()
 def global_search(query):
-    """Search across all RE CRM doctypes. Returns categorized results."""
+    """
+    Search across all RE CRM doctypes. Returns categorized results.
+
+    A category is `complete` when it returned fewer than RESULTS_PER_CATEGORY
+    items, i.e. it holds every match. Items carry their searched field values
+    (`match`), so the client can answer narrower queries from a complete
+    result set without another call.
+    """
     query = cstr(query).strip()
     if len(query) < 2:
         return []
@@ -87,12 +100,13 @@ def global_search(query):
                 "icon": config["icon"],
                 "doctype": config["doctype"],
                 "items": items,
+                "complete": len(items) < RESULTS_PER_CATEGORY,
             })
 
     return results
 
 
-def _search_doctype(query, config, limit=5):
+def _search_doctype(query, config, limit=RESULTS_PER_CATEGORY):
     """Run LIKE search on a single doctype, exact matches first."""
     or_conditions = []
     params = {}
@@ -138,6 +152,7 @@ def _search_doctype(query, config, limit=5):
             "title": row.get(config["title_field"]) or row.get("name"),
             "subtitle": " · ".join(subtitle_parts),
             "route": config["route_template"].format(**row),
+            "match": [cstr(row.get(f)) for f in config["search_fields"]],
         }
         if config["badge_field"] and row.get(config["badge_field"]):
             item["badge"] = row.get(config["badge_field"])
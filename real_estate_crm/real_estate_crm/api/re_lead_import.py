@@ -0,0 +1,387 @@
+"""
+Bulk lead import from portal / campaign exports (CSV or XLSX).
+
+    import_leads(file_url, project=None, source=None, on_duplicate="Skip")
+
+Runs on the long queue and reads the file as a stream, IMPORT_CHUNK rows at
+a time. For each chunk:
+
+  1. rows are normalized (phone → last 10 digits, email → lower case) and
+     hashed like existing records (utils/lead_dedupe.py);
+  2. duplicates within the file, and against existing Leads and Customers,
+     are found with one indexed hash query;
+  3. new leads are written with one multi-row INSERT, named from a block
+     of the Lead naming series reserved in one statement, then committed.
+
+Duplicates of a Lead are skipped, or with on_duplicate="Merge" fill that
+Lead's empty project / budget / phone / email (rows of a chunk that match
+the same Lead by different keys are folded into one merge). Duplicates of
+a Customer are always skipped. Header names are matched loosely (COLUMNS). Validation
+hooks do not run for imported leads; auto-assignment to RMs does
+(utils/lead_assignment.py), when it is enabled.
+
+Every input row gets a line in a CSV report (Inserted / Merged / Skipped /
+Invalid, with the matched record), attached to the importing user and
+linked in the "re_lead_import_done" realtime event.
+"""
+
+import csv
+import os
+from itertools import islice
+
+import frappe
+from frappe import _
+from frappe.model.naming import parse_naming_series
+from frappe.utils import cint, cstr, flt, now, now_datetime
+
+from real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact import mark_dirty, week_start
+from real_estate_crm.utils.lead_assignment import pick_rm
+from real_estate_crm.utils.lead_dedupe import find_matches, get_keys, normalize_email, normalize_phone
+from real_estate_crm.utils.version_stamps import bump as bump_versions
+
+IMPORT_ROLES = ["RE Admin", "RE Sales Manager", "System Manager"]
+IMPORT_CHUNK = 2000
+ON_DUPLICATE = ("Skip", "Merge")
+
+# Lead field → accepted header names (compared lower-cased, spaces → "_").
+COLUMNS = {
+    "lead_name": ("lead_name", "name", "full_name", "customer_name"),
+    "email_id": ("email_id", "email", "email_address"),
+    "mobile_no": ("mobile_no", "mobile", "phone", "phone_number", "contact_number"),
+    "re_interested_in_project": ("re_interested_in_project", "project", "interested_in_project"),
+    "re_budget": ("re_budget", "budget"),
+    "source": ("source", "lead_source"),
+    "re_lead_source_detail": ("re_lead_source_detail", "campaign", "source_detail"),
+}
+
+REPORT_HEADER = ("Row", "Lead Name", "Email", "Mobile", "Action", "Matched DocType", "Matched Name", "Note")
+
+
+@frappe.whitelist()
+def import_leads(file_url, project=None, source=None, on_duplicate="Skip"):
+    """Queue an import of the uploaded CSV / XLSX at `file_url`."""
+    frappe.only_for(IMPORT_ROLES)
+    if on_duplicate not in ON_DUPLICATE:
+        frappe.throw(_("On Duplicate must be one of {0}").format(", ".join(ON_DUPLICATE)))
+    if project and not frappe.db.exists("RE Project", project):
+        frappe.throw(_("Project {0} not found").format(project))
+
+    file_doc = frappe.get_doc("File", {"file_url": file_url})
+    if file_doc.get_extension()[1].lower() not in (".csv", ".xlsx"):
+        frappe.throw(_("Upload a CSV or XLSX file."))
+
+    frappe.enqueue(
+        "real_estate_crm.api.re_lead_import.run_import",
+        queue="long",
+        timeout=4 * 3600,
+        file_url=file_url,
+        project=project,
+        source=source,
+        on_duplicate=on_duplicate,
+        user=frappe.session.user,
+    )
+    return {"queued": True}
+
+
+def run_import(file_url, project, source, on_duplicate, user):
+    """Background job: import the file chunk by chunk and write the report."""
+    file_doc = frappe.get_doc("File", {"file_url": file_url})
+    context = frappe._dict(
+        project=project,
+        source=source,
+        merge=on_duplicate == "Merge",
+        projects=get_projects(),
+        seen={},
+        auto_assign=frappe.db.get_single_value("RE CRM Settings", "auto_assign_leads"),
+        strategy=frappe.db.get_single_value("RE CRM Settings", "lead_assignment_strategy"),
+    )
+
+    report_name = "lead-import-{0}.csv".format(now_datetime().strftime("%Y%m%d-%H%M%S"))
+    report_path = frappe.get_site_path("private", "files", report_name)
+    counts = {"Inserted": 0, "Merged": 0, "Skipped": 0, "Invalid": 0}
+
+    row_no = 1
+    try:
+        with open(report_path, "w", newline="", encoding="utf-8") as report_file:
+            report = csv.writer(report_file)
+            report.writerow(REPORT_HEADER)
+
+            rows = read_rows(file_doc, COLUMNS)
+            while True:
+                chunk = list(islice(rows, IMPORT_CHUNK))
+                if not chunk:
+                    break
+                for line in _import_chunk(chunk, row_no, context):
+                    counts[line[4]] += 1
+                    report.writerow(line)
+                frappe.db.commit()
+                row_no += len(chunk)
+                _publish(user, "re_lead_import_progress", rows=row_no - 1, **counts)
+
+        file_url = _save_report(report_name, report_path, user)
+        frappe.db.commit()
+    except Exception:
+        # Chunks already committed stay imported; their counts are reported.
+        frappe.db.rollback()
+        if os.path.exists(report_path):
+            os.remove(report_path)
+        _publish(
+            user,
+            "re_lead_import_done",
+            rows=row_no - 1,
+            error=_("The lead import failed after {0} rows; see the Error Log.").format(row_no - 1),
+            **counts,
+        )
+        raise
+
+    _publish(user, "re_lead_import_done", rows=row_no - 1, report_url=file_url, **counts)
+
+
+# ─── Chunk processing ────────────────────────────────────────────────────────
+
+
+def _import_chunk(chunk, first_row_no, context):
+    """Import one chunk; returns its report lines, in input order."""
+    leads, lines = [], {}
+    for row_no, raw in enumerate(chunk, start=first_row_no):
+        lead, note = _normalize(raw, context)
+        if not lead:
+            lines[row_no] = [
+                row_no, raw.get("lead_name"), raw.get("email_id"), raw.get("mobile_no"), "Invalid", "", "", note
+            ]
+            continue
+        lead.row_no = row_no
+        leads.append(lead)
+
+    matches = _get_matches(leads)
+    new_leads, merges = [], {}
+    for lead in leads:
+        line = [lead.row_no, lead.lead_name, lead.email_id, lead.mobile_no]
+        earlier = context.seen.get(lead.phone_hash) or context.seen.get(lead.email_hash)
+        match = matches.get(lead.phone_hash) or matches.get(lead.email_hash)
+
+        if earlier:
+            lines[lead.row_no] = line + ["Skipped", "", "", _("Duplicate of row {0}").format(earlier)]
+        elif match and match.doctype == "Lead" and context.merge:
+            note = ""
+            if match.name in merges:
+                # Another row of this chunk matched the same Lead by a different key.
+                _fold_merge(merges[match.name], lead)
+                note = _("Merged together with row {0}").format(merges[match.name].row_no)
+            else:
+                merges[match.name] = lead
+            lines[lead.row_no] = line + ["Merged", "Lead", match.name, note]
+        elif match:
+            lines[lead.row_no] = line + ["Skipped", match.doctype, match.name, _("Already exists")]
+        else:
+            new_leads.append(lead)
+            lines[lead.row_no] = line + ["Inserted", "Lead", None, ""]
+
+        for key in (lead.phone_hash, lead.email_hash):
+            if key:
+                context.seen.setdefault(key, lead.row_no)
+
+    for name, lead in zip(_insert_leads(new_leads, context), new_leads):
+        lines[lead.row_no][6] = name
+    _merge_leads(merges)
+    return [lines[row_no] for row_no in sorted(lines)]
+
+
+def _normalize(raw, context):
+    lead = frappe._dict({field: cstr(raw.get(field)).strip() for field in COLUMNS})
+    lead.email_id = normalize_email(lead.email_id)
+    lead.mobile_no = normalize_phone(lead.mobile_no)
+    if not (lead.email_id or lead.mobile_no):
+        return None, _("No valid email or mobile number")
+
+    lead.lead_name = lead.lead_name or lead.email_id or lead.mobile_no
+    lead.re_budget = flt(lead.re_budget.replace(",", "")) if lead.re_budget else 0
+
+    project = lead.re_interested_in_project or context.project
+    lead.re_interested_in_project = context.projects.get(project.lower()) if project else None
+    if project and not lead.re_interested_in_project:
+        return None, _("Unknown project {0}").format(project)
+
+    lead.source = lead.source or context.source
+    lead.phone_hash, lead.email_hash = get_keys("Lead", lead)
+    return lead, None
+
+
+def _get_matches(leads):
+    """hash → first matching record; Customers take precedence over Leads."""
+    matches = {}
+    if not leads:
+        return matches
+
+    rows = find_matches({lead.phone_hash for lead in leads}, {lead.email_hash for lead in leads})
+    for row in rows:
+        for key in (row.phone_hash, row.email_hash):
+            if key:
+                matches.setdefault(key, row)
+    return matches
+
+
+def _insert_leads(leads, context):
+    if not leads:
+        return []
+
+    names = reserve_names("Lead", len(leads))
+    timestamp, user = now(), frappe.session.user
+    fields = [
+        "name", "creation", "modified", "owner", "modified_by", "docstatus", "naming_series",
+        "status", "lead_name", "first_name", "email_id", "mobile_no", "source",
+        "re_interested_in_project", "re_budget", "re_lead_source_detail", "re_assigned_rm",
+        "re_phone_hash", "re_email_hash",
+    ]
+    values, cells = [], set()
+    for name, lead in zip(names, leads):
+        rm = None
+        if context.auto_assign and lead.re_interested_in_project:
+            rm = pick_rm(lead.re_interested_in_project, context.strategy)
+        cells.add((lead.re_interested_in_project, rm, week_start(timestamp)))
+        values.append(
+            (
+                name, timestamp, timestamp, user, user, 0, naming_series("Lead"),
+                "Lead", lead.lead_name, lead.lead_name, lead.email_id or None, lead.mobile_no or None,
+                lead.source or None, lead.re_interested_in_project, lead.re_budget,
+                lead.re_lead_source_detail or None, rm, lead.phone_hash, lead.email_hash,
+            )
+        )
+    frappe.db.bulk_insert("Lead", fields, values, chunk_size=IMPORT_CHUNK)
+    # Bulk inserts skip the Lead hooks that keep RE Funnel Fact and the RM
+    # dashboard lead counts current.
+    mark_dirty(cells)
+    bump_versions(("lead",), rms={rm for _project, rm, _week in cells})
+    return names
+
+
+def _fold_merge(pending, lead):
+    """Fill what a pending merge leaves empty from a later row for the same Lead."""
+    for field, key in (
+        ("re_interested_in_project", None),
+        ("re_budget", None),
+        ("mobile_no", "phone_hash"),
+        ("email_id", "email_hash"),
+    ):
+        if not pending.get(field) and lead.get(field):
+            pending[field] = lead[field]
+            if key:
+                pending[key] = lead[key]
+
+
+def _merge_leads(merges):
+    """Fill empty fields of existing Leads; never overwrite what is there."""
+    for name, lead in merges.items():
+        frappe.db.sql(
+            """
+            UPDATE `tabLead`
+            SET
+                re_interested_in_project = IFNULL(NULLIF(re_interested_in_project, ''), %(project)s),
+                re_budget = IF(IFNULL(re_budget, 0) = 0, %(budget)s, re_budget),
+                mobile_no = IFNULL(NULLIF(mobile_no, ''), %(mobile_no)s),
+                email_id = IFNULL(NULLIF(email_id, ''), %(email_id)s),
+                re_phone_hash = IF(IFNULL(re_phone_hash, '') = '', %(phone_hash)s, re_phone_hash),
+                re_email_hash = IF(IFNULL(re_email_hash, '') = '', %(email_hash)s, re_email_hash),
+                modified = %(modified)s
+            WHERE name = %(name)s
+            """,
+            {
+                "name": name,
+                "project": lead.re_interested_in_project,
+                "budget": lead.re_budget,
+                "mobile_no": lead.mobile_no or None,
+                "email_id": lead.email_id or None,
+                "phone_hash": lead.phone_hash,
+                "email_hash": lead.email_hash,
+                "modified": now(),
+            },
+        )
+
+
+# ─── Helpers (shared with re_rm_import) ──────────────────────────────────────
+
+
+def naming_series(doctype):
+    return frappe.get_meta(doctype).get_field("naming_series").options.split("\n")[0]
+
+
+def reserve_names(doctype, count):
+    """`count` consecutive names from `doctype`'s default naming series, in one UPDATE."""
+    series = naming_series(doctype)
+    prefix = parse_naming_series(series.replace("#", "").rstrip("."))
+    digits = series.count("#") or 5
+
+    frappe.db.sql("INSERT IGNORE INTO `tabSeries` (name, current) VALUES (%s, 0)", prefix)
+    frappe.db.sql(
+        "UPDATE `tabSeries` SET current = LAST_INSERT_ID(current + %s) WHERE name = %s", (count, prefix)
+    )
+    last = cint(frappe.db.sql("SELECT LAST_INSERT_ID()")[0][0])
+    return [f"{prefix}{n:0{digits}d}" for n in range(last - count + 1, last + 1)]
+
+
+def get_projects():
+    """lower-cased project name / title → RE Project name."""
+    projects = {}
+    for name, title in frappe.db.sql("SELECT name, project_name FROM `tabRE Project`"):
+        projects[name.lower()] = name
+        if title:
+            projects.setdefault(title.lower(), name)
+    return projects
+
+
+def read_rows(file_doc, columns):
+    """Yield input rows as {field: value}, streaming from disk; `columns` is field → header names."""
+    path = file_doc.get_full_path()
+    rows = _iter_xlsx(path) if path.lower().endswith(".xlsx") else _iter_csv(path)
+
+    header = next(rows, None) or []
+    fields = [_match_column(h, columns) for h in header]
+    for values in rows:
+        if any(cstr(v).strip() for v in values):
+            yield {f: v for f, v in zip(fields, values) if f}
+
+
+def _iter_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        yield from csv.reader(handle)
+
+
+def _iter_xlsx(path):
+    from openpyxl import load_workbook
+
+    book = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for values in book.active.iter_rows(values_only=True):
+            # Phone numbers typed into Excel come back as floats.
+            yield ["" if v is None else int(v) if isinstance(v, float) and v.is_integer() else v for v in values]
+    finally:
+        book.close()
+
+
+def _match_column(header, columns):
+    key = cstr(header).strip().lower().replace(" ", "_")
+    for field, aliases in columns.items():
+        if key in aliases:
+            return field
+    return None
+
+
+def _save_report(file_name, path, user):
+    file_doc = frappe.get_doc(
+        {
+            "doctype": "File",
+            "file_name": file_name,
+            "file_url": "/private/files/" + file_name,
+            "is_private": 1,
+            "attached_to_doctype": "User",
+            "attached_to_name": user,
+            "file_size": os.path.getsize(path),
+        }
+    )
+    file_doc.flags.ignore_permissions = True
+    file_doc.insert()
+    return file_doc.file_url
+
+
+def _publish(user, event, **message):
+    frappe.publish_realtime(event, message, user=user, after_commit=False)
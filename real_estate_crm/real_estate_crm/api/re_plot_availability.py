@@ -0,0 +1,167 @@
+"""
+Compact plot availability for offline / low-bandwidth clients.
+
+    get_plot_snapshot(project)            full snapshot + version
+    get_plot_changes(project, since)      plots modified since `since`
+
+Plots are packed as column arrays (one list per field, same order), and
+status / facing are sent as indexes into the STATUSES / FACINGS lists:
+
+    {
+        "project": "PRJ-001",
+        "version": "2026-10-19 10:12:03.120442",
+        "statuses": ["Available", "Booked", ...],
+        "facings": ["North", "South", ...],
+        "plots": {
+            "plot_number": ["A-1", "A-2"],
+            "status": [0, 1],
+            "area": [200.0, 240.0],
+            "rate": [2500.0, 2500.0],
+            "facing": [0, 4],
+            "sector": ["A", "A"],
+        },
+    }
+
+A client keeps the snapshot keyed by plot_number and calls get_plot_changes
+with the last version: changed plots are upserted, `removed` plot numbers
+dropped. The version is the latest RE Plot `modified` in the project;
+booking / cancellation set_value calls touch it like form edits do. The
+delta re-sends plots modified up to OVERLAP_SECONDS before `since`, so a
+transaction that committed after a later one was read is not missed —
+upserts are idempotent. Past FULL_RESYNC_DAYS, a full snapshot comes back
+instead (with "full": 1).
+"""
+
+import json
+
+import frappe
+from frappe import _
+from frappe.utils import add_days, add_to_date, cstr, flt, get_datetime, now_datetime
+
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.replica import use_replica
+
+STATUSES = ("Available", "Booked", "Registered", "On Hold")
+FACINGS = ("North", "South", "East", "West", "Corner", "Other")
+COLUMNS = ("plot_number", "status", "area", "rate", "facing", "sector")
+
+OVERLAP_SECONDS = 60
+FULL_RESYNC_DAYS = 7
+
+
+@frappe.whitelist()
+@use_replica()
+@instrument()
+def get_plot_snapshot(project):
+    """Every plot of `project`, packed as column arrays."""
+    _validate(project)
+    return _pack(project, _get_version(project), _get_plots(project))
+
+
+@frappe.whitelist()
+@use_replica()
+@instrument()
+def get_plot_changes(project, since):
+    """
+    Plots of `project` modified since version `since` (plus the overlap
+    window), and plot numbers deleted since then. Returns
+    {"not_modified": 1, "version"} when nothing changed.
+    """
+    _validate(project)
+    version = _get_version(project)
+    since_dt = _parse_version(since)
+
+    if since_dt is None or since_dt < add_days(now_datetime(), -FULL_RESYNC_DAYS):
+        snapshot = _pack(project, version, _get_plots(project))
+        snapshot["full"] = 1
+        return snapshot
+
+    window_start = add_to_date(since_dt, seconds=-OVERLAP_SECONDS)
+    removed = _get_removed(project, window_start)
+
+    # Once the overlap window has passed, nothing older than `since` can
+    # still commit — an unchanged version really means unchanged.
+    settled = since_dt < add_to_date(now_datetime(), seconds=-OVERLAP_SECONDS)
+    if version == cstr(since) and settled and not removed:
+        return {"project": project, "version": version, "not_modified": 1}
+
+    changes = _pack(project, version, _get_plots(project, modified_after=window_start))
+    changes["removed"] = removed
+    return changes
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _validate(project):
+    frappe.has_permission("RE Plot", "read", throw=True)
+    if not frappe.db.exists("RE Project", project):
+        frappe.throw(_("Project {0} not found").format(project))
+
+
+def _get_version(project):
+    # Served by the (project, modified) index.
+    latest = frappe.db.sql(
+        "SELECT MAX(modified) FROM `tabRE Plot` WHERE project = %s", project
+    )[0][0]
+    return cstr(latest) if latest else ""
+
+
+def _parse_version(version):
+    try:
+        return get_datetime(version) if version else None
+    except Exception:
+        return None
+
+
+def _get_plots(project, modified_after=None):
+    return frappe.db.sql(
+        """
+        SELECT plot_number, status, plot_area, rate_per_unit, facing, sector
+        FROM `tabRE Plot`
+        WHERE project = %(project)s
+            {modified_cond}
+        ORDER BY plot_number
+        """.format(modified_cond="AND modified >= %(modified_after)s" if modified_after else ""),
+        {"project": project, "modified_after": modified_after},
+        as_list=True,
+    )
+
+
+def _get_removed(project, since):
+    rows = frappe.db.sql(
+        """
+        SELECT data
+        FROM `tabDeleted Document`
+        WHERE deleted_doctype = 'RE Plot' AND creation >= %s
+        """,
+        since,
+    )
+    removed = []
+    for (data,) in rows:
+        doc = json.loads(data or "{}")
+        if doc.get("project") == project:
+            removed.append(doc.get("plot_number"))
+    return removed
+
+
+def _pack(project, version, rows):
+    status_index = {s: i for i, s in enumerate(STATUSES)}
+    facing_index = {f: i for i, f in enumerate(FACINGS)}
+
+    columns = {c: [] for c in COLUMNS}
+    for plot_number, status, area, rate, facing, sector in rows:
+        columns["plot_number"].append(plot_number)
+        columns["status"].append(status_index.get(status))
+        columns["area"].append(flt(area))
+        columns["rate"].append(flt(rate))
+        columns["facing"].append(facing_index.get(facing))
+        columns["sector"].append(sector or "")
+
+    return {
+        "project": project,
+        "version": version,
+        "statuses": STATUSES,
+        "facings": FACINGS,
+        "plots": columns,
+    }
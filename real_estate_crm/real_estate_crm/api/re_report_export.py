@@ -0,0 +1,220 @@
+"""
+Background CSV/XLSX export for Real Estate CRM script reports.
+
+Exports run on the long queue and stream rows from an unbuffered cursor
+straight into the output file, so memory stays flat regardless of row count.
+A report opts in by exposing `get_columns(filters)` and `get_query(filters)`
+→ (query, values) — query is None when there is nothing to read — plus
+optionally:
+
+    get_row_processor(filters) → process_row(row)   per-row derived columns
+    get_total_row(filters) → dict                     summary row, SQL-computed
+
+The file is a private attachment of the requesting User. Progress and
+completion are pushed to that user over realtime
+("re_report_export_progress" / "re_report_export_done").
+"""
+
+import csv
+import json
+import os
+import re
+
+import frappe
+from frappe import _
+from frappe.utils import cint, cstr, flt, now_datetime
+
+MODULE = "Real Estate CRM"
+FORMATS = ("CSV", "XLSX")
+PROGRESS_EVERY = 5000
+XLSX_MAX_ROWS = 1048575
+
+_TAGS = re.compile(r"<[^>]+>")
+
+
+@frappe.whitelist()
+def export_report(report_name, filters=None, file_format="CSV"):
+    """Queue an export of `report_name`; the file is attached to the requesting User."""
+    file_format = cstr(file_format).upper()
+    if file_format not in FORMATS:
+        frappe.throw(_("Unsupported export format: {0}").format(file_format))
+
+    report = frappe.get_doc("Report", report_name)
+    if report.module != MODULE or report.report_type != "Script Report":
+        frappe.throw(_("{0} cannot be exported in the background.").format(report_name))
+    if not report.is_permitted():
+        frappe.throw(_("You do not have access to {0}.").format(report_name), frappe.PermissionError)
+
+    if isinstance(filters, str):
+        filters = json.loads(filters or "{}")
+
+    # Validate filters (and the report's export interface) before queueing.
+    module = _get_report_module(report_name)
+    query, _values = module.get_query(frappe._dict(filters or {}))
+    if not query:
+        frappe.throw(_("There is no data to export for these filters."))
+
+    frappe.enqueue(
+        "real_estate_crm.api.re_report_export.run_export",
+        queue="long",
+        timeout=3600,
+        report_name=report_name,
+        filters=filters or {},
+        file_format=file_format,
+        user=frappe.session.user,
+    )
+    return {"queued": True}
+
+
+def run_export(report_name, filters, file_format, user):
+    """
+    Background job: stream the report into a private file and notify `user`.
+    On failure the partial file is removed and the user is told, so the
+    client never waits on a progress bar that will not finish.
+    """
+    path = None
+    try:
+        filters = frappe._dict(filters or {})
+        module = _get_report_module(report_name)
+        columns = [frappe._dict(c) for c in module.get_columns(filters)]
+
+        query, values = module.get_query(filters)
+        total = _count_rows(query, values)
+        if file_format == "XLSX" and total > XLSX_MAX_ROWS:
+            error = _("{0} rows exceed the XLSX sheet limit; export as CSV instead.").format(total)
+            _publish(user, "re_report_export_done", report_name=report_name, error=error)
+            return
+
+        # Prelude queries must run before the unbuffered cursor is opened.
+        process_row = module.get_row_processor(filters) if hasattr(module, "get_row_processor") else None
+        total_row = module.get_total_row(filters) if hasattr(module, "get_total_row") else None
+
+        file_name = "{0}-{1}.{2}".format(
+            frappe.scrub(report_name), now_datetime().strftime("%Y%m%d-%H%M%S"), file_format.lower()
+        )
+        path = frappe.get_site_path("private", "files", file_name)
+        writer = _CSVWriter(path) if file_format == "CSV" else _XLSXWriter(path)
+
+        try:
+            writer.write_header([_(c.label) for c in columns])
+            written = 0
+            with frappe.db.unbuffered_cursor():
+                for row in frappe.db.sql(query, values, as_dict=True, as_iterator=True):
+                    if process_row:
+                        process_row(row)
+                    writer.write_row(_to_cells(row, columns))
+                    written += 1
+                    if written % PROGRESS_EVERY == 0:
+                        _publish(
+                            user,
+                            "re_report_export_progress",
+                            report_name=report_name,
+                            written=written,
+                            total=total,
+                        )
+
+            if total_row and written:
+                writer.write_row(_to_cells(total_row, columns))
+        finally:
+            writer.close()
+
+        file_doc = frappe.get_doc(
+            {
+                "doctype": "File",
+                "file_name": file_name,
+                "file_url": "/private/files/" + file_name,
+                "is_private": 1,
+                # Private to the requester: exports hold permission-scoped data,
+                # and a Report attachment would follow Report read permission.
+                "attached_to_doctype": "User",
+                "attached_to_name": user,
+                "file_size": os.path.getsize(path),
+            }
+        )
+        file_doc.flags.ignore_permissions = True
+        file_doc.insert()
+        frappe.db.commit()
+    except Exception:
+        frappe.db.rollback()
+        if path and os.path.exists(path):
+            os.remove(path)
+        _publish(
+            user,
+            "re_report_export_done",
+            report_name=report_name,
+            error=_("The export of {0} failed; see the Error Log.").format(report_name),
+        )
+        raise
+
+    _publish(user, "re_report_export_done", report_name=report_name, rows=written, file_url=file_doc.file_url)
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _get_report_module(report_name):
+    scrubbed = frappe.scrub(report_name)
+    module = frappe.get_module(f"real_estate_crm.real_estate_crm.report.{scrubbed}.{scrubbed}")
+    if not hasattr(module, "get_query"):
+        frappe.throw(_("{0} does not support background export.").format(report_name))
+    return module
+
+
+def _count_rows(query, values):
+    return cint(frappe.db.sql("SELECT COUNT(*) FROM ({0}) AS export_rows".format(query), values)[0][0])
+
+
+def _to_cells(row, columns):
+    cells = []
+    for col in columns:
+        value = row.get(col.fieldname)
+        if value is None:
+            cells.append("")
+        elif col.fieldtype in ("Currency", "Float", "Percent"):
+            cells.append(flt(value))
+        elif col.fieldtype == "Int":
+            cells.append(cint(value))
+        elif col.fieldtype in ("Date", "Datetime"):
+            cells.append(value)
+        else:
+            cells.append(_TAGS.sub("", cstr(value)))
+    return cells
+
+
+def _publish(user, event, **message):
+    frappe.publish_realtime(event, message, user=user, after_commit=False)
+
+
+class _CSVWriter:
+    def __init__(self, path):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+
+    def write_header(self, labels):
+        self._writer.writerow(labels)
+
+    def write_row(self, cells):
+        self._writer.writerow(cells)
+
+    def close(self):
+        self._file.close()
+
+
+class _XLSXWriter:
+    """openpyxl write-only mode: rows are flushed to disk, not kept in memory."""
+
+    def __init__(self, path):
+        from openpyxl import Workbook
+
+        self._path = path
+        self._book = Workbook(write_only=True)
+        self._sheet = self._book.create_sheet("Report")
+
+    def write_header(self, labels):
+        self._sheet.append(labels)
+
+    def write_row(self, cells):
+        self._sheet.append(cells)
+
+    def close(self):
+        self._book.save(self._path)
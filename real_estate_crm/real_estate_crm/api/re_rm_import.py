@@ -0,0 +1,209 @@
+"""
+Bulk RM onboarding from an HR export (CSV or XLSX).
+
+    import_rms(file_url)
+
+Rows are validated against existing RMs and Employees with a handful of set
+queries, rm_codes are allocated for the whole batch in memory (one query per
+distinct set of initials, allocate_rm_codes), and RMs and their project rows
+are written with multi-row INSERTs, named from a block of the RM naming
+series reserved in one statement.
+
+Rows are skipped when an RM with the same email or Employee already exists
+(or appeared earlier in the file), and are invalid when they have no name,
+an unknown project or Employee, or an rm_code that is already taken. The
+RM controller does not run for imported rows; its on_update side effects
+(report cache, version stamps, lead assignment cache) are applied once for
+the batch.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import cstr, getdate, now
+
+from real_estate_crm.api.re_lead_import import get_projects, naming_series, read_rows, reserve_names
+from real_estate_crm.real_estate_crm.doctype.re_relationship_manager.re_relationship_manager import (
+    allocate_rm_codes,
+    rm_code_prefix,
+)
+from real_estate_crm.utils.lead_assignment import clear_project_rms
+from real_estate_crm.utils.lead_dedupe import normalize_email
+from real_estate_crm.utils.report_cache import invalidate as invalidate_report_cache
+from real_estate_crm.utils.version_stamps import bump as bump_versions
+
+IMPORT_ROLES = ["RE Admin", "System Manager"]
+INSERT_CHUNK = 1000
+
+# RM field → accepted header names (compared lower-cased, spaces → "_").
+COLUMNS = {
+    "rm_name": ("rm_name", "name", "full_name", "employee_name"),
+    "rm_code": ("rm_code", "code"),
+    "mobile": ("mobile", "mobile_no", "phone", "cell_number"),
+    "email": ("email", "email_id", "company_email", "work_email"),
+    "designation": ("designation",),
+    "joining_date": ("joining_date", "date_of_joining"),
+    "employee": ("employee", "employee_id"),
+    "status": ("status",),
+    "projects": ("projects", "assigned_projects", "project"),
+}
+
+
+@frappe.whitelist()
+def import_rms(file_url):
+    """
+    Import RMs from the uploaded CSV / XLSX at `file_url`. Returns the counts
+    and one {row, rm_name, rm_code, action, note} line per input row.
+    """
+    frappe.only_for(IMPORT_ROLES)
+    file_doc = frappe.get_doc("File", {"file_url": file_url})
+    if file_doc.get_extension()[1].lower() not in (".csv", ".xlsx"):
+        frappe.throw(_("Upload a CSV or XLSX file."))
+
+    rows = [_normalize(row_no, raw) for row_no, raw in enumerate(read_rows(file_doc, COLUMNS), start=1)]
+    _validate(rows)
+
+    new_rms = [rm for rm in rows if not rm.action]
+    codes = allocate_rm_codes(
+        [rm_code_prefix(rm.rm_name) for rm in new_rms if not rm.rm_code],
+        reserved=[rm.rm_code for rm in new_rms if rm.rm_code],
+    )
+    for rm in new_rms:
+        if not rm.rm_code:
+            rm.rm_code = codes.pop(0)
+        rm.action = "Inserted"
+
+    _insert_rms(new_rms)
+
+    counts = {"Inserted": 0, "Skipped": 0, "Invalid": 0}
+    for rm in rows:
+        counts[rm.action] += 1
+    return {
+        **counts,
+        "rows": [
+            {"row": rm.row_no, "rm_name": rm.rm_name, "rm_code": rm.rm_code, "action": rm.action, "note": rm.note}
+            for rm in rows
+        ],
+    }
+
+
+def _normalize(row_no, raw):
+    rm = frappe._dict({field: cstr(raw.get(field)).strip() for field in COLUMNS})
+    rm.update(row_no=row_no, action=None, note="")
+    rm.email = normalize_email(rm.email)
+    rm.rm_code = rm.rm_code.upper()
+    rm.status = rm.status.title() or "Active"
+    rm.projects = [p.strip() for p in rm.projects.split(",") if p.strip()]
+
+    if not rm_code_prefix(rm.rm_name):
+        _mark(rm, "Invalid", _("Name is required"))
+    elif rm.status not in ("Active", "Inactive"):
+        _mark(rm, "Invalid", _("Status must be Active or Inactive"))
+    elif rm.joining_date:
+        try:
+            rm.joining_date = getdate(rm.joining_date)
+        except Exception:
+            _mark(rm, "Invalid", _("Invalid joining date {0}").format(rm.joining_date))
+    return rm
+
+
+def _validate(rows):
+    """Mark duplicates and bad references — one query per check, for the whole file."""
+    rows = [rm for rm in rows if not rm.action]
+    projects = get_projects()
+    emails, employees, codes = _existing_rms()
+    known_employees = _existing_employees({rm.employee for rm in rows if rm.employee})
+
+    for rm in rows:
+        unknown = [p for p in rm.projects if p.lower() not in projects]
+        if unknown:
+            _mark(rm, "Invalid", _("Unknown project {0}").format(", ".join(unknown)))
+        elif rm.employee and rm.employee not in known_employees:
+            _mark(rm, "Invalid", _("Employee {0} not found").format(rm.employee))
+        elif rm.email and rm.email in emails:
+            _mark(rm, "Skipped", _("Email already used by {0}").format(emails[rm.email]))
+        elif rm.employee and rm.employee in employees:
+            _mark(rm, "Skipped", _("Employee already linked to {0}").format(employees[rm.employee]))
+        elif rm.rm_code and rm.rm_code in codes:
+            _mark(rm, "Invalid", _("RM Code already used by {0}").format(codes[rm.rm_code]))
+        else:
+            rm.projects = list(dict.fromkeys(projects[p.lower()] for p in rm.projects))
+            # Later rows with the same email / Employee / code are duplicates of this one.
+            seen = _("row {0}").format(rm.row_no)
+            for taken, key in ((emails, rm.email), (employees, rm.employee), (codes, rm.rm_code)):
+                if key:
+                    taken[key] = seen
+
+
+def _existing_rms():
+    """email → RM, employee → RM, upper-cased rm_code → RM, for existing RMs."""
+    emails, employees, codes = {}, {}, {}
+    for name, email, employee, rm_code in frappe.db.sql(
+        "SELECT name, email, employee, rm_code FROM `tabRE Relationship Manager`"
+    ):
+        if email:
+            emails[email.lower()] = name
+        if employee:
+            employees[employee] = name
+        if rm_code:
+            codes[rm_code.upper()] = name
+    return emails, employees, codes
+
+
+def _existing_employees(employees):
+    if not employees:
+        return set()
+    return set(frappe.get_all("Employee", filters={"name": ("in", list(employees))}, pluck="name"))
+
+
+def _insert_rms(rms):
+    if not rms:
+        return
+
+    names = reserve_names("RE Relationship Manager", len(rms))
+    timestamp, user = now(), frappe.session.user
+    series = naming_series("RE Relationship Manager")
+    rm_values, project_values = [], []
+    for name, rm in zip(names, rms):
+        rm_values.append(
+            (
+                name, timestamp, timestamp, user, user, 0, series,
+                rm.rm_name, rm.rm_code, rm.status, rm.mobile or None, rm.email or None,
+                rm.designation or None, rm.joining_date or None, rm.employee or None,
+            )
+        )
+        project_values += [
+            (
+                frappe.generate_hash(length=10), timestamp, timestamp, user, user, 0,
+                name, "RE Relationship Manager", "assigned_projects", idx, project,
+            )
+            for idx, project in enumerate(rm.projects, start=1)
+        ]
+
+    frappe.db.bulk_insert(
+        "RE Relationship Manager",
+        [
+            "name", "creation", "modified", "owner", "modified_by", "docstatus", "naming_series",
+            "rm_name", "rm_code", "status", "mobile", "email", "designation", "joining_date", "employee",
+        ],
+        rm_values,
+        chunk_size=INSERT_CHUNK,
+    )
+    frappe.db.bulk_insert(
+        "RE RM Project",
+        [
+            "name", "creation", "modified", "owner", "modified_by", "docstatus",
+            "parent", "parenttype", "parentfield", "idx", "project",
+        ],
+        project_values,
+        chunk_size=INSERT_CHUNK,
+    )
+
+    # What RERelationshipManager.on_update would have done, once for the batch.
+    # All three take effect when the request commits, not before.
+    invalidate_report_cache()
+    bump_versions(("rm",), projects={project for rm in rms for project in rm.projects})
+    clear_project_rms()
+
+
+def _mark(rm, action, note):
+    rm.action, rm.note = action, note
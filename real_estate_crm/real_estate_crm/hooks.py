@@ -14,14 +14,11 @@ required_apps = ["frappe", "erpnext"]
 default_route = "/app/re-dashboard"
 
 # ─── Global Assets ────────────────────────────────────────────────────────────
-# Loaded on every page — used for the persistent CRM sidebar and styling.
-app_include_js = [
-    "/assets/real_estate_crm/js/re_sidebar.js",
-    "/assets/real_estate_crm/js/re_global_search.js",
-]
-app_include_css = [
-    "/assets/real_estate_crm/css/re_crm.css",
-]
+# Loaded on every page, so kept to a small bootstrap: it registers the search
+# shortcut and loads the sidebar / search bundles on first use. Dashboard
+# pages load re_dashboard.bundle.css themselves. Bundles are built (hashed,
+# minified) by `bench build`.
+app_include_js = ["re_crm.bundle.js"]
 
 # ─── Install / Migrate ───────────────────────────────────────────────────────
 
@@ -37,9 +34,30 @@ scheduler_events = {
     # Marks overdue payment schedule rows and emails assigned RMs (PRD §7.4)
     "daily": [
         "real_estate_crm.tasks.mark_overdue_schedules",
+        "real_estate_crm.utils.lead_assignment.reconcile",
+    ],
+    # Lead funnel fact table: dirty cells every 5 minutes, full rebuild weekly
+    "cron": {
+        "*/5 * * * *": [
+            "real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact.refresh_dirty",
+        ],
+    },
+    "weekly": [
+        "real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact.rebuild",
+    ],
+    # Last month's RM commission, as Draft RE Commission Entries
+    "monthly": [
+        "real_estate_crm.real_estate_crm.doctype.re_commission_entry.re_commission_entry.calculate_last_month",
     ],
 }
 
+# ─── Request / Job Lifecycle ────────────────────────────────────────────────
+# The replica connection opened by utils/replica.use_replica() is reused for
+# the rest of the request or job, and closed here.
+
+after_request = ["real_estate_crm.utils.replica.close_replica"]
+after_job = ["real_estate_crm.utils.replica.close_replica"]
+
 # ─── Document Events ─────────────────────────────────────────────────────────
 # Note: events on OUR OWN doctypes (RE Booking, RE Plot, etc.) are handled
 # inside their controller classes — no registration needed here.
@@ -49,9 +67,57 @@ scheduler_events = {
 doctype_js = {
     "Customer": "public/js/customer_custom.js",
 }
+doctype_list_js = {
+    "Lead": "public/js/lead_list.js",
+}
 
 doc_events = {
-    # Reserved for future use (e.g., Payment Entry hooks if needed)
+    # Payments booked or reversed outside receive_payment() still change
+    # collection figures — drop cached report results and bump the
+    # dashboard / Customer 360 version stamps.
+    "Payment Entry": {
+        "on_submit": [
+            "real_estate_crm.utils.report_cache.invalidate",
+            "real_estate_crm.utils.version_stamps.on_doc_change",
+        ],
+        "on_cancel": [
+            "real_estate_crm.utils.report_cache.invalidate",
+            "real_estate_crm.utils.version_stamps.on_doc_change",
+        ],
+    },
+    # Customer 360 reads the customer master, its contact / address and
+    # comments on the customer and its bookings.
+    "Customer": {
+        "validate": "real_estate_crm.utils.lead_dedupe.set_keys",
+        "on_update": "real_estate_crm.utils.version_stamps.on_doc_change",
+    },
+    "Contact": {"on_update": "real_estate_crm.utils.version_stamps.on_doc_change"},
+    "Address": {"on_update": "real_estate_crm.utils.version_stamps.on_doc_change"},
+    "Comment": {
+        "on_update": "real_estate_crm.utils.version_stamps.on_doc_change",
+        "on_trash": "real_estate_crm.utils.version_stamps.on_doc_change",
+    },
+    # Duplicate keys (utils/lead_dedupe.py), auto-assignment and per-RM
+    # open-lead counters (utils/lead_assignment.py), RM dashboard lead counts.
+    "Lead": {
+        "validate": "real_estate_crm.utils.lead_dedupe.set_keys",
+        "before_insert": "real_estate_crm.utils.lead_assignment.on_lead_before_insert",
+        "on_update": [
+            "real_estate_crm.utils.lead_assignment.on_lead_update",
+            "real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact.on_lead_change",
+            "real_estate_crm.utils.version_stamps.on_doc_change",
+        ],
+        "on_trash": [
+            "real_estate_crm.utils.lead_assignment.on_lead_trash",
+            "real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact.on_lead_change",
+            "real_estate_crm.utils.version_stamps.on_doc_change",
+        ],
+    },
+    # Funnel fact table (RE Funnel Fact).
+    "Opportunity": {
+        "on_update": "real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact.on_opportunity_change",
+        "on_trash": "real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact.on_opportunity_change",
+    },
 }
 
 # ─── Fixtures ────────────────────────────────────────────────────────────────
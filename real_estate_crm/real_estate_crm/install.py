@@ -15,6 +15,7 @@ from frappe.custom.doctype.custom_field.custom_field import create_custom_field
 
 def after_install():
     create_custom_fields()
+    create_indexes()
     create_chart_of_accounts()
     hide_default_workspaces()
     frappe.db.commit()
@@ -23,6 +24,9 @@ def after_install():
 def after_migrate():
     """Re-apply custom fields so they survive ERPNext core upgrades."""
     create_custom_fields()
+    create_indexes()
+    backfill_dedupe_keys()
+    backfill_payment_links()
     hide_default_workspaces()
     frappe.db.commit()
 
@@ -34,7 +38,10 @@ def create_custom_fields():
     """
     Adds RE-specific fields to native ERPNext doctypes.
     Idempotent — checks existence before creating.
-    PRD §5.1 (Lead, Opportunity) and §8.3 (Customer Document Cabinet).
+    PRD §5.1 (Lead, Opportunity), §8.3 (Customer Document Cabinet),
+    §10.3 (Sales Invoice → booking / stage, for batch invoicing), Payment
+    Entry → booking / stage / RM (RM commission) and the Lead / Customer
+    duplicate keys (utils/lead_dedupe.py).
     """
     _CUSTOM_FIELDS = {
         "Lead": [
@@ -44,6 +51,7 @@ def create_custom_fields():
                 "fieldtype": "Link",
                 "options": "RE Project",
                 "insert_after": "lead_name",
+                "search_index": 1,
             },
             {
                 "fieldname": "re_plot_preference",
@@ -64,6 +72,7 @@ def create_custom_fields():
                 "fieldtype": "Link",
                 "options": "RE Relationship Manager",
                 "insert_after": "re_budget",
+                "search_index": 1,
             },
             {
                 "fieldname": "re_lead_source_detail",
@@ -71,6 +80,26 @@ def create_custom_fields():
                 "fieldtype": "Data",
                 "insert_after": "re_assigned_rm",
             },
+            {
+                "fieldname": "re_phone_hash",
+                "label": "Phone Hash",
+                "fieldtype": "Data",
+                "insert_after": "re_lead_source_detail",
+                "hidden": 1,
+                "read_only": 1,
+                "no_copy": 1,
+                "search_index": 1,
+            },
+            {
+                "fieldname": "re_email_hash",
+                "label": "Email Hash",
+                "fieldtype": "Data",
+                "insert_after": "re_phone_hash",
+                "hidden": 1,
+                "read_only": 1,
+                "no_copy": 1,
+                "search_index": 1,
+            },
         ],
         "Opportunity": [
             {
@@ -79,6 +108,7 @@ def create_custom_fields():
                 "fieldtype": "Link",
                 "options": "RE Project",
                 "insert_after": "opportunity_from",
+                "search_index": 1,
             },
             {
                 "fieldname": "re_plot_shortlisted",
@@ -93,9 +123,30 @@ def create_custom_fields():
                 "fieldtype": "Link",
                 "options": "RE Relationship Manager",
                 "insert_after": "re_plot_shortlisted",
+                "search_index": 1,
             },
         ],
         "Customer": [
+            {
+                "fieldname": "re_phone_hash",
+                "label": "Phone Hash",
+                "fieldtype": "Data",
+                "insert_after": "re_documents",
+                "hidden": 1,
+                "read_only": 1,
+                "no_copy": 1,
+                "search_index": 1,
+            },
+            {
+                "fieldname": "re_email_hash",
+                "label": "Email Hash",
+                "fieldtype": "Data",
+                "insert_after": "re_phone_hash",
+                "hidden": 1,
+                "read_only": 1,
+                "no_copy": 1,
+                "search_index": 1,
+            },
             {
                 "fieldname": "re_document_cabinet_section",
                 "label": "Document Cabinet",
@@ -110,6 +161,57 @@ def create_custom_fields():
                 "insert_after": "re_document_cabinet_section",
             },
         ],
+        "Payment Entry": [
+            {
+                "fieldname": "re_booking",
+                "label": "RE Booking",
+                "fieldtype": "Link",
+                "options": "RE Booking",
+                "insert_after": "party_name",
+                "read_only": 1,
+                "no_copy": 1,
+                "search_index": 1,
+            },
+            {
+                "fieldname": "re_schedule_row",
+                "label": "RE Payment Schedule Row",
+                "fieldtype": "Data",
+                "insert_after": "re_booking",
+                "read_only": 1,
+                "no_copy": 1,
+                "hidden": 1,
+            },
+            {
+                "fieldname": "re_assigned_rm",
+                "label": "Assigned RM",
+                "fieldtype": "Link",
+                "options": "RE Relationship Manager",
+                "insert_after": "re_schedule_row",
+                "read_only": 1,
+                "no_copy": 1,
+            },
+        ],
+        "Sales Invoice": [
+            {
+                "fieldname": "re_booking",
+                "label": "RE Booking",
+                "fieldtype": "Link",
+                "options": "RE Booking",
+                "insert_after": "customer",
+                "read_only": 1,
+                "no_copy": 1,
+                "search_index": 1,
+            },
+            {
+                "fieldname": "re_schedule_row",
+                "label": "RE Payment Schedule Row",
+                "fieldtype": "Data",
+                "insert_after": "re_booking",
+                "read_only": 1,
+                "no_copy": 1,
+                "hidden": 1,
+            },
+        ],
     }
 
     for doctype, fields in _CUSTOM_FIELDS.items():
@@ -120,6 +222,56 @@ def create_custom_fields():
                 create_custom_field(doctype, field_def)
 
 
+# ─── Indexes ─────────────────────────────────────────────────────────────────
+
+
+def create_indexes():
+    """
+    Ensures indexes on the RE custom fields of native doctypes.
+    search_index on the field definitions only applies to fresh installs;
+    this covers sites whose custom fields predate it. Also indexes the
+    native Lead → Opportunity / Customer links followed by RE Funnel Fact.
+    Idempotent.
+    """
+    _INDEXES = {
+        "Lead": [["re_assigned_rm"], ["re_interested_in_project"], ["re_phone_hash"], ["re_email_hash"]],
+        "Opportunity": [["re_assigned_rm"], ["re_project"], ["opportunity_from", "party_name"]],
+        "Sales Invoice": [["re_booking", "re_schedule_row"]],
+        "Payment Entry": [["posting_date", "re_booking"]],
+        "Customer": [["re_phone_hash"], ["re_email_hash"], ["lead_name"]],
+    }
+
+    for doctype, indexes in _INDEXES.items():
+        for fields in indexes:
+            frappe.db.add_index(doctype, fields)
+
+
+# ─── Duplicate keys ──────────────────────────────────────────────────────────
+
+
+def backfill_dedupe_keys():
+    """Hash Leads / Customers created before the dedupe keys existed."""
+    from real_estate_crm.utils.lead_dedupe import backfill_keys
+
+    backfill_keys()
+
+
+def backfill_payment_links():
+    """
+    Stamp booking / stage / RM on Payment Entries recorded before those
+    fields existed, from the schedule rows that link them. Idempotent.
+    """
+    frappe.db.sql(
+        """
+        UPDATE `tabPayment Entry` pe
+        INNER JOIN `tabRE Booking Payment Schedule` ps ON ps.payment_entry = pe.name
+        INNER JOIN `tabRE Booking` b ON b.name = ps.parent
+        SET pe.re_booking = b.name, pe.re_schedule_row = ps.name, pe.re_assigned_rm = b.assigned_rm
+        WHERE IFNULL(pe.re_booking, '') = ''
+        """
+    )
+
+
 # ─── Chart of Accounts ────────────────────────────────────────────────────────
 
 
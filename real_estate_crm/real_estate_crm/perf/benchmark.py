@@ -0,0 +1,149 @@
+"""
+Scale benchmark for Real Estate CRM read paths and the daily overdue job.
+
+    bench --site <bench-site> execute real_estate_crm.perf.benchmark.run --kwargs "{'tiers': ['10k', '100k']}"
+
+For each tier (see synthetic_data.TIERS) the synthetic dataset is generated,
+every target is called once to warm caches and then timed `iterations` times.
+Results — p50/p95 latency, DB time, query count and rows read per call — are
+written as JSON (for diffing between releases) and as a markdown table to
+sites/<site>/re_benchmarks/.
+
+Never run this against a production site: it replaces all SYN- data.
+"""
+
+import json
+import os
+import statistics
+import time
+
+import frappe
+from frappe.utils import now
+
+import real_estate_crm
+from real_estate_crm.perf import synthetic_data
+from real_estate_crm.perf.instrumentation import percentile
+from real_estate_crm.perf.query_log import capture_queries
+from real_estate_crm.perf.targets import get_context, get_read_targets
+
+
+def run(tiers=("10k",), iterations=10, seed=42, output_dir=None, keep_data=False):
+    """Benchmark every target across `tiers`; returns the result dict."""
+    if isinstance(tiers, str):
+        tiers = [t.strip() for t in tiers.split(",") if t.strip()]
+
+    results = {
+        "app_version": real_estate_crm.__version__,
+        "generated_at": now(),
+        "seed": seed,
+        "iterations": iterations,
+        "tiers": {},
+    }
+
+    try:
+        for tier in tiers:
+            volumes = synthetic_data.generate(bookings=synthetic_data.TIERS[tier], seed=seed)
+            results["tiers"][tier] = {
+                "volumes": volumes,
+                "targets": _benchmark_tier(iterations),
+            }
+    finally:
+        if not keep_data:
+            synthetic_data.purge()
+
+    json_path, md_path = _write_results(results, output_dir)
+    print(to_markdown(results))
+    print(f"\nWritten to {json_path} and {md_path}")
+    return results
+
+
+def to_markdown(results):
+    lines = [
+        f"# RE CRM benchmark — v{results['app_version']} — {results['generated_at']}",
+        "",
+        "| Tier | Target | p50 ms | p95 ms | DB ms (p50) | Queries | Rows |",
+        "|---|---|---:|---:|---:|---:|---:|",
+    ]
+    for tier, data in results["tiers"].items():
+        for label, m in data["targets"].items():
+            lines.append(
+                f"| {tier} | {label} | {m['p50_ms']:.1f} | {m['p95_ms']:.1f} | "
+                f"{m['db_p50_ms']:.1f} | {m['queries']} | {m['rows']} |"
+            )
+    return "\n".join(lines)
+
+
+# ─── Measurement ─────────────────────────────────────────────────────────────
+
+
+def _benchmark_tier(iterations):
+    # Measure the compute path, not the report result cache.
+    frappe.flags.re_skip_report_cache = True
+    ctx = get_context()
+    targets = [(label, fn, None) for label, fn in get_read_targets(ctx)]
+    targets.append(("mark_overdue_schedules", _mark_overdue, _reset_overdue))
+
+    return {label: _measure(fn, iterations, setup) for label, fn, setup in targets}
+
+
+def _measure(fn, iterations, setup=None):
+    """Time `fn` after one warm-up call; `setup` runs untimed before each call."""
+    wall, db, queries, rows = [], [], [], []
+    for i in range(iterations + 1):
+        if setup:
+            setup()
+        with capture_queries() as log:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+        if i == 0:
+            continue
+        wall.append(elapsed)
+        db.append(log.db_time)
+        queries.append(log.count)
+        rows.append(log.rows)
+
+    return {
+        "p50_ms": percentile(wall, 50) * 1000,
+        "p95_ms": percentile(wall, 95) * 1000,
+        "db_p50_ms": percentile(db, 50) * 1000,
+        "queries": int(statistics.median(queries)),
+        "rows": int(statistics.median(rows)),
+    }
+
+
+def _mark_overdue():
+    from real_estate_crm.tasks import mark_overdue_schedules
+
+    mark_overdue_schedules()
+
+
+def _reset_overdue():
+    """Put synthetic Overdue rows back to Pending/Partial so every run has work to do."""
+    frappe.db.sql(
+        """
+        UPDATE `tabRE Booking Payment Schedule`
+        SET status = IF(amount_received > 0, 'Partial', 'Pending')
+        WHERE status = 'Overdue' AND parent LIKE %s
+        """,
+        (synthetic_data.PREFIX + "%",),
+    )
+    frappe.db.commit()
+
+
+# ─── Output ──────────────────────────────────────────────────────────────────
+
+
+def _write_results(results, output_dir=None):
+    output_dir = output_dir or frappe.get_site_path("re_benchmarks")
+    os.makedirs(output_dir, exist_ok=True)
+
+    stem = f"benchmark-v{results['app_version']}-{results['generated_at'][:19].replace(' ', '_').replace(':', '')}"
+    json_path = os.path.join(output_dir, stem + ".json")
+    md_path = os.path.join(output_dir, stem + ".md")
+
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=1, default=str)
+    with open(md_path, "w") as f:
+        f.write(to_markdown(results) + "\n")
+    return json_path, md_path
@@ -0,0 +1,176 @@
+"""
+Per-call timing and query-count instrumentation.
+
+    @frappe.whitelist()
+    @instrument()
+    def get_dashboard_data(): ...
+
+    @section()
+    def _get_kpi_cards(): ...
+
+Every instrumented call records wall time, DB time, query count and rows read.
+Calls nested inside another instrumented call are folded into the outer
+call's "sections"; only outermost calls are pushed, as compact JSON, onto a
+capped Redis list (RING_KEY) read by the RE Performance page.
+
+Off by default; set `"re_perf_instrumentation": 1` in site_config.json to turn it on.
+`@frappe.whitelist()` must stay the outermost decorator.
+"""
+
+import functools
+import json
+import time
+from contextlib import contextmanager
+
+import frappe
+from frappe.utils import now
+
+from real_estate_crm.perf.query_log import capture_queries
+
+RING_KEY = "re_perf_calls"
+RING_SIZE = 5000
+
+# name → "endpoint" | "report" | "section"
+REGISTRY = {}
+
+
+def instrument(name=None, kind="endpoint"):
+    """Decorator for whitelisted methods and report execute functions."""
+
+    def decorator(fn):
+        call_name = name or _default_name(fn)
+        REGISTRY[call_name] = kind
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not is_enabled():
+                return fn(*args, **kwargs)
+            return _run_instrumented(call_name, kind, fn, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def section(name=None):
+    """Decorator for internal sections (`_get_kpi_cards`, …) of an endpoint."""
+    return instrument(name, kind="section")
+
+
+@contextmanager
+def collect_sections():
+    """
+    For worker threads of an instrumented call: sections run inside are
+    gathered into the yielded dict instead of being pushed as calls of
+    their own. Hand the dict to fold_sections() on the calling thread.
+    """
+    holder = {"sections": {}}
+    frappe.local.re_perf_stack = [holder]
+    try:
+        yield holder["sections"]
+    finally:
+        frappe.local.re_perf_stack = []
+
+
+def fold_sections(sections):
+    """Add sections gathered by collect_sections() to the current call."""
+    stack = getattr(frappe.local, "re_perf_stack", None)
+    if not stack:
+        return
+    for name, stats in sections.items():
+        _add_section(stack[-1]["sections"], name, stats, calls=stats["calls"])
+
+
+def is_enabled():
+    return bool(frappe.conf.get("re_perf_instrumentation"))
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; 0 for no values."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def get_recent_calls(limit=RING_SIZE):
+    """Most recent outermost calls, newest first."""
+    try:
+        raw = frappe.cache().lrange(RING_KEY, 0, limit - 1) or []
+    except Exception:
+        return []
+    return [json.loads(r) for r in raw]
+
+
+def clear():
+    frappe.cache().delete_value(RING_KEY)
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _run_instrumented(call_name, kind, fn, args, kwargs):
+    stack = getattr(frappe.local, "re_perf_stack", None)
+    if stack is None:
+        stack = frappe.local.re_perf_stack = []
+    record = {"endpoint": call_name, "kind": kind, "sections": {}}
+    stack.append(record)
+
+    error = None
+    try:
+        with capture_queries() as log:
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                record["wall_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    finally:
+        stack.pop()
+        record.update(
+            {
+                "db_ms": round(log.db_time * 1000, 2),
+                "queries": log.count,
+                "rows": log.rows,
+            }
+        )
+        if error:
+            record["error"] = error
+        if stack:
+            _fold_into_parent(stack[-1], record)
+        else:
+            _push(record)
+
+
+def _fold_into_parent(parent, record):
+    _add_section(parent["sections"], record["endpoint"], record, calls=1)
+    # Sections of sections are flattened onto the outer call.
+    for name, sub in record["sections"].items():
+        _add_section(parent["sections"], name, sub, calls=sub["calls"])
+
+
+def _add_section(sections, name, stats, calls):
+    entry = sections.setdefault(name, {"calls": 0, "wall_ms": 0, "db_ms": 0, "queries": 0, "rows": 0})
+    entry["calls"] += calls
+    for key in ("wall_ms", "db_ms", "queries", "rows"):
+        entry[key] = round(entry[key] + stats[key], 2)
+
+
+def _push(record):
+    record["ts"] = now()
+    record["user"] = frappe.session.user if getattr(frappe.local, "session", None) else None
+    try:
+        cache = frappe.cache()
+        cache.lpush(RING_KEY, json.dumps(record, separators=(",", ":")))
+        cache.ltrim(RING_KEY, 0, RING_SIZE - 1)
+    except Exception:
+        # Instrumentation must never break the call it measures.
+        pass
+
+
+def _default_name(fn):
+    module = fn.__module__.rsplit(".", 1)[-1]
+    return f"{module}.{fn.__qualname__}"
@@ -0,0 +1,69 @@
+"""
+SQL capture for Real Estate CRM performance tooling.
+
+    with capture_queries() as log:
+        get_dashboard_data()
+    log.count, log.db_time, log.selects()
+
+Wraps ``frappe.db.sql`` on the current connection for the duration of the
+block and records every statement with its parameters, wall time and row
+count. Captures nest — an inner block sees only its own statements, the
+outer block sees everything.
+"""
+
+import time
+from contextlib import contextmanager
+
+import frappe
+
+
+class QueryLog:
+    def __init__(self):
+        self.queries = []
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def db_time(self):
+        """Total seconds spent inside frappe.db.sql."""
+        return sum(q["duration"] for q in self.queries)
+
+    @property
+    def rows(self):
+        return sum(q["rows"] for q in self.queries)
+
+    def selects(self):
+        """Captured read statements, in execution order."""
+        return [q for q in self.queries if q["query"].lstrip().upper().startswith(("SELECT", "WITH"))]
+
+
+@contextmanager
+def capture_queries():
+    db = frappe.db
+    had_override = "sql" in db.__dict__
+    original = db.sql
+    log = QueryLog()
+
+    def _sql(query, values=(), *args, **kwargs):
+        start = time.perf_counter()
+        result = original(query, values, *args, **kwargs)
+        log.queries.append(
+            {
+                "query": str(query),
+                "values": values,
+                "duration": time.perf_counter() - start,
+                "rows": len(result) if isinstance(result, (list, tuple)) else 0,
+            }
+        )
+        return result
+
+    db.sql = _sql
+    try:
+        yield log
+    finally:
+        if had_override:
+            db.sql = original
+        else:
+            del db.sql
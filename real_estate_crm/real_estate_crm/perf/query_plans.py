@@ -0,0 +1,121 @@
+"""
+EXPLAIN-based query plan regression check for reports and dashboards.
+
+    bench --site <test-site> execute real_estate_crm.perf.query_plans.run
+
+Seeds the synthetic dataset, runs every hot read path with representative
+filters while capturing its SQL, EXPLAINs each SELECT and fails when a large
+table is read with a full table scan (EXPLAIN type = ALL). The command raises
+QueryPlanRegression — and bench exits non-zero — so CI fails on a regressed
+plan.
+
+Scans that are inherent to a query (site-wide aggregates, leading-wildcard
+LIKE) are listed in ALLOWED_FULL_SCANS with the reason; anything else that
+scans needs an index or a rewrite, not an allowlist entry.
+"""
+
+import re
+
+import frappe
+
+from real_estate_crm.perf import synthetic_data
+from real_estate_crm.perf.query_log import capture_queries
+from real_estate_crm.perf.targets import get_context, get_read_targets
+
+# Tables that grow with the business — a full scan on these is a regression.
+LARGE_TABLES = ("RE Booking Payment Schedule", "RE Booking", "RE Plot", "Lead")
+
+# (check label, doctype) → why the scan is acceptable
+ALLOWED_FULL_SCANS = {
+    ("re_dashboard", "RE Booking"): "Site-wide KPI totals aggregate every booking.",
+    ("re_dashboard", "RE Booking Payment Schedule"): "Site-wide received/outstanding totals aggregate every stage.",
+    ("global_search", "RE Plot"): "Leading-wildcard LIKE cannot use a B-tree index.",
+    ("global_search", "RE Booking"): "Leading-wildcard LIKE cannot use a B-tree index.",
+}
+
+# Volume large enough that the optimizer prefers indexes over scans.
+SEED_BOOKINGS = 5000
+
+_SQL_KEYWORDS = "ON|WHERE|JOIN|LEFT|RIGHT|INNER|CROSS|STRAIGHT_JOIN|GROUP|ORDER|LIMIT|HAVING|UNION|USE|FORCE|IGNORE|SET|FOR"
+_TABLE_ALIAS_RE = re.compile(rf"`tab([^`]+)`(?:\s+(?:AS\s+)?(?!(?:{_SQL_KEYWORDS})\b)(\w+))?", re.I)
+
+
+class QueryPlanRegression(Exception):
+    pass
+
+
+def run(seed=True, bookings=SEED_BOOKINGS):
+    """Entry point for CI. Raises QueryPlanRegression on any unexpected scan."""
+    if seed:
+        synthetic_data.generate(bookings=bookings)
+    _analyze_tables()
+
+    checks = get_read_targets(get_context())
+    try:
+        violations = check(checks)
+    finally:
+        if seed:
+            synthetic_data.purge()
+
+    if violations:
+        raise QueryPlanRegression(
+            "Full table scans on large tables:\n"
+            + "\n".join(
+                f"- [{v['check']}] {v['doctype']} (~{v['rows']} rows)\n    {_one_line(v['query'])}"
+                for v in violations
+            )
+        )
+    print(f"Query plans OK — {len(checks)} hot paths checked.")
+
+
+def check(checks=None):
+    """EXPLAIN every SELECT issued by the hot paths; returns violations."""
+    # A cached report result issues no queries to check.
+    frappe.flags.re_skip_report_cache = True
+    violations = []
+    for label, fn in checks or get_read_targets(get_context()):
+        with capture_queries() as log:
+            fn()
+        for q in log.selects():
+            violations.extend(_scan_violations(label, q))
+    return violations
+
+
+# ─── EXPLAIN ─────────────────────────────────────────────────────────────────
+
+
+def _scan_violations(label, q):
+    aliases = _table_aliases(q["query"])
+    plan = frappe.db.sql("EXPLAIN " + q["query"], q["values"], as_dict=True)
+
+    violations = []
+    for step in plan:
+        doctype = aliases.get(step.get("table"))
+        if doctype not in LARGE_TABLES or step.get("type") != "ALL":
+            continue
+        if (label.split(":")[0], doctype) in ALLOWED_FULL_SCANS:
+            continue
+        violations.append(
+            {"check": label, "doctype": doctype, "rows": step.get("rows"), "query": q["query"]}
+        )
+    return violations
+
+
+def _table_aliases(query):
+    """Map EXPLAIN's `table` column (alias or table name) back to doctypes."""
+    aliases = {}
+    for doctype, alias in _TABLE_ALIAS_RE.findall(query):
+        aliases[f"tab{doctype}"] = doctype
+        if alias:
+            aliases[alias] = doctype
+    return aliases
+
+
+def _analyze_tables():
+    """Refresh index statistics so plans reflect the freshly seeded volume."""
+    for doctype in LARGE_TABLES:
+        frappe.db.sql(f"ANALYZE TABLE `tab{doctype}`")
+
+
+def _one_line(query):
+    return " ".join(query.split())[:300]
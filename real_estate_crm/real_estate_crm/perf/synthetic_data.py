@@ -0,0 +1,496 @@
+"""
+Deterministic synthetic dataset for query-plan checks and benchmarks.
+
+    bench --site <site> execute real_estate_crm.perf.synthetic_data.generate --kwargs "{'bookings': 5000}"
+    bench --site <site> execute real_estate_crm.perf.synthetic_data.purge
+
+Rows are written in chunks with frappe.db.bulk_insert — controllers and
+validations are bypassed on purpose, so the data only approximates what the
+booking workflow would produce. Every generated name starts with SYN- so
+purge() can remove it again. Same seed, volume and anchor date always yield
+identical rows.
+
+Never run this against a production site.
+"""
+
+import random
+from datetime import datetime, time, timedelta
+
+import frappe
+from frappe.utils import add_days, flt, getdate, nowdate
+
+PREFIX = "SYN-"
+CHUNK_SIZE = 5000
+
+CITIES = ["Jaipur", "Pune", "Indore", "Lucknow", "Nagpur", "Surat", "Mysuru", "Coimbatore"]
+FACINGS = ["North", "South", "East", "West", "Corner", "Other"]
+SECTORS = ["A", "B", "C", "D", "E", "F"]
+FIRST_NAMES = ["Rahul", "Priya", "Amit", "Sneha", "Vikram", "Anita", "Rohan", "Kavita", "Arjun", "Meera"]
+LAST_NAMES = ["Sharma", "Verma", "Gupta", "Patel", "Reddy", "Iyer", "Singh", "Mehta", "Nair", "Joshi"]
+LEAD_STATUSES = ["Lead", "Open", "Replied", "Interested", "Opportunity", "Converted", "Do Not Contact"]
+
+# plan_code → (plan_name, [(stage_name, percentage, due_trigger, due_days, is_possession_stage)])
+PAYMENT_PLANS = {
+    "SYN-CLP": (
+        "Synthetic Construction Linked",
+        [
+            ("Booking Amount", 10, "On Booking", 0, 0),
+            ("Agreement", 20, "Days from Booking", 30, 0),
+            ("Development", 30, "Days from Booking", 180, 0),
+            ("Pre-Possession", 30, "Days from Booking", 365, 0),
+            ("Possession", 10, "On Possession", 0, 1),
+        ],
+    ),
+    "SYN-DP": (
+        "Synthetic Down Payment",
+        [
+            ("Down Payment", 90, "Days from Booking", 15, 0),
+            ("Possession", 10, "On Possession", 0, 1),
+        ],
+    ),
+}
+
+OPPORTUNITY_STATUSES = ["Open", "Replied", "Quotation", "Converted", "Lost", "Closed"]
+PAYMENT_MODES = ["Cash", "Bank Draft", "Wire Transfer", "Cheque"]
+
+# Scale tiers for benchmarks, by booking count.
+TIERS = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Tables holding synthetic rows (generated, or derived by the jobs the
+# benchmarks run), in delete order for purge().
+_TABLES = [
+    ("RE Interest Accrual", "booking"),
+    ("RE Funnel Fact", "project"),
+    ("RE Commission Entry", "project"),
+    ("RE Commission Slab", "parent"),
+    ("RE Aging Snapshot", "project"),
+    ("Payment Entry", "name"),
+    ("Opportunity", "name"),
+    ("RE Booking Payment Schedule", "parent"),
+    ("RE Booking", "name"),
+    ("RE Plot", "name"),
+    ("Lead", "name"),
+    ("Customer", "name"),
+    ("RE RM Project", "parent"),
+    ("RE Relationship Manager", "name"),
+    ("RE Payment Plan Stage", "parent"),
+    ("RE Payment Plan Template", "name"),
+    ("RE Project", "name"),
+]
+
+
+def volumes(bookings):
+    """Row counts for every generated doctype, derived from the booking count."""
+    bookings = int(bookings)
+    plots = bookings * 3 // 2
+    return {
+        "bookings": bookings,
+        "plots": plots,
+        "projects": max(5, plots // 400),
+        "rms": max(10, bookings // 100),
+        "customers": max(1, bookings * 4 // 5),
+        "leads": bookings * 5,
+        "opportunities": bookings * 2,
+    }
+
+
+def generate(bookings=5000, seed=42, anchor=None):
+    """
+    Seed a synthetic dataset sized by `bookings`.
+    `anchor` is the "today" the data is generated against (defaults to today);
+    stage rows due before it are Paid or Overdue, later ones Pending.
+    """
+    purge()
+
+    rng = random.Random(seed)
+    anchor = getdate(anchor or nowdate())
+    vol = volumes(bookings)
+
+    projects = _generate_projects(rng, vol, anchor)
+    _generate_payment_plans()
+    rms_by_project = _generate_rms(rng, vol, projects)
+    _generate_customers(vol)
+    _generate_plots_and_bookings(rng, vol, projects, rms_by_project, anchor)
+    _generate_leads(rng, vol, projects, rms_by_project, anchor)
+    _generate_opportunities(rng, vol, projects, rms_by_project, anchor)
+
+    frappe.db.commit()
+    return vol
+
+
+def purge():
+    """Remove every SYN- row written by generate()."""
+    for doctype, key in _TABLES:
+        frappe.db.sql(
+            f"DELETE FROM `tab{doctype}` WHERE `{key}` LIKE %s",
+            (PREFIX + "%",),
+        )
+    frappe.db.commit()
+
+
+# ─── Generators ──────────────────────────────────────────────────────────────
+
+
+def _generate_projects(rng, vol, anchor):
+    projects = []
+    rows = []
+    for i in range(vol["projects"]):
+        code = f"{PREFIX}P{i + 1:04d}"
+        start = add_days(anchor, -rng.randint(365, 365 * 4))
+        possession = add_days(start, rng.randint(365 * 3, 365 * 5))
+        city = rng.choice(CITIES)
+        projects.append({"name": code, "possession_date": getdate(possession)})
+        rows.append(
+            {
+                **_std(code, start),
+                "project_name": f"Synthetic Project {i + 1}",
+                "project_code": code,
+                "status": rng.choice(["Active", "Active", "Active", "Completed", "On Hold"]),
+                "location": f"Phase {rng.randint(1, 4)}",
+                "city": city,
+                "state": "",
+                "total_plots": 0,
+                "project_start_date": start,
+                "expected_possession_date": possession,
+            }
+        )
+    _bulk_insert("RE Project", rows)
+    return projects
+
+
+def _generate_payment_plans():
+    templates, stages = [], []
+    for code, (plan_name, plan_stages) in PAYMENT_PLANS.items():
+        templates.append(
+            {
+                **_std(code, None),
+                "plan_name": plan_name,
+                "plan_code": code,
+                "total_percentage": sum(s[1] for s in plan_stages),
+            }
+        )
+        for order, (stage_name, pct, trigger, days, is_possession) in enumerate(plan_stages, 1):
+            stages.append(
+                {
+                    **_child(f"{code}-S{order}", code, "RE Payment Plan Template", "stages", order),
+                    "stage_order": order,
+                    "stage_name": stage_name,
+                    "percentage": pct,
+                    "due_trigger": trigger,
+                    "due_days": days,
+                    "is_possession_stage": is_possession,
+                }
+            )
+    _bulk_insert("RE Payment Plan Template", templates)
+    _bulk_insert("RE Payment Plan Stage", stages)
+
+
+def _generate_rms(rng, vol, projects):
+    """Each RM covers two neighbouring projects; returns project → [rm]."""
+    rms_by_project = {p["name"]: [] for p in projects}
+    rms, links = [], []
+    for i in range(vol["rms"]):
+        name = f"{PREFIX}RM-{i + 1:05d}"
+        rm_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        rms.append(
+            {
+                **_std(name, None),
+                "rm_name": rm_name,
+                "rm_code": f"{PREFIX}{i + 1:05d}",
+                "status": "Active" if rng.random() < 0.9 else "Inactive",
+                "mobile": f"9{rng.randint(100000000, 999999999)}",
+                "email": f"rm{i + 1}@synthetic.example",
+                "designation": "Relationship Manager",
+            }
+        )
+        for idx, offset in enumerate((0, 1), 1):
+            project = projects[(i + offset) % len(projects)]["name"]
+            rms_by_project[project].append(name)
+            links.append(
+                {
+                    **_child(f"{name}-P{idx}", name, "RE Relationship Manager", "assigned_projects", idx),
+                    "project": project,
+                }
+            )
+    _bulk_insert("RE Relationship Manager", rms)
+    _bulk_insert("RE RM Project", links)
+
+    # Projects left without an RM (more projects than RMs×2) borrow the first one.
+    for project, rm_list in rms_by_project.items():
+        if not rm_list:
+            rm_list.append(rms[0]["name"])
+    return rms_by_project
+
+
+def _generate_customers(vol):
+    for start in range(0, vol["customers"], CHUNK_SIZE):
+        rows = []
+        for j in range(start, min(start + CHUNK_SIZE, vol["customers"])):
+            name = _customer_name(j)
+            rows.append(
+                {
+                    **_std(name, None),
+                    "customer_name": f"Synthetic Customer {j + 1}",
+                    "customer_type": "Individual",
+                }
+            )
+        _bulk_insert("Customer", rows)
+
+
+def _generate_plots_and_bookings(rng, vol, projects, rms_by_project, anchor):
+    """
+    Plot k belongs to project k % projects; the first `bookings` plots are
+    booked by booking k. Generated chunk by chunk so memory stays flat.
+    """
+    n_projects = len(projects)
+    for start in range(0, vol["plots"], CHUNK_SIZE):
+        plots, bookings, schedule, payments = [], [], [], []
+        for k in range(start, min(start + CHUNK_SIZE, vol["plots"])):
+            project = projects[k % n_projects]
+            plot_number = f"{k // n_projects + 1:05d}"
+            plot_name = f"{project['name']}-{plot_number}"
+            plot_area = rng.choice([100, 120, 150, 200, 240, 300])
+            rate = rng.choice([8000, 12000, 15000, 18000, 25000])
+            plot = {
+                **_std(plot_name, None),
+                "plot_number": plot_number,
+                "project": project["name"],
+                "status": "Available" if rng.random() < 0.95 else "On Hold",
+                "booking": None,
+                "sector": rng.choice(SECTORS),
+                "plot_type": "Residential" if rng.random() < 0.85 else "Commercial",
+                "facing": rng.choice(FACINGS),
+                "plot_area": plot_area,
+                "area_unit": "Sqyd",
+                "rate_per_unit": rate,
+                "total_value": plot_area * rate,
+            }
+
+            if k < vol["bookings"]:
+                booking, rows = _make_booking(rng, k, vol, project, plot, rms_by_project, anchor)
+                bookings.append(booking)
+                schedule.extend(rows)
+                payments.extend(_make_payment_entries(rng, booking, rows))
+                if booking["docstatus"] == 1:
+                    plot["status"] = "Registered" if booking["booking_status"] == "Completed" else "Booked"
+                    plot["booking"] = booking["name"]
+
+            plots.append(plot)
+
+        _bulk_insert("RE Plot", plots)
+        _bulk_insert("RE Booking", bookings)
+        _bulk_insert("RE Booking Payment Schedule", schedule)
+        _bulk_insert("Payment Entry", payments)
+
+
+def _make_booking(rng, k, vol, project, plot, rms_by_project, anchor):
+    name = f"{PREFIX}BK-{k + 1:07d}"
+    booking_date = getdate(add_days(anchor, -rng.randint(0, 365 * 3)))
+    plan_code = "SYN-CLP" if rng.random() < 0.7 else "SYN-DP"
+    discount = flt(plot["total_value"] * rng.choice([0, 0, 0.02, 0.05]))
+    final_value = flt(plot["total_value"] - discount)
+    cancelled = rng.random() < 0.05
+
+    rows = []
+    for order, (stage_name, pct, trigger, days, is_possession) in enumerate(PAYMENT_PLANS[plan_code][1], 1):
+        due_date = _due_date(trigger, days, booking_date, project["possession_date"])
+        amount_due = flt(final_value * pct / 100.0)
+        received, status, receipt_date = _stage_state(rng, amount_due, due_date, anchor, cancelled)
+        rows.append(
+            {
+                **_child(f"{name}-{order}", name, "RE Booking", "payment_schedule", order),
+                "docstatus": 2 if cancelled else 1,
+                "stage_order": order,
+                "stage_name": stage_name,
+                "percentage": pct,
+                "amount_due": amount_due,
+                "due_date": due_date,
+                "status": status,
+                "amount_received": received,
+                "balance": flt(amount_due - received),
+                "receipt_date": receipt_date,
+                "payment_entry": f"{PREFIX}PE-{k + 1:07d}-{order}" if received else None,
+                "is_possession_stage": is_possession,
+            }
+        )
+
+    booking = {
+        **_std(name, booking_date),
+        "docstatus": 2 if cancelled else 1,
+        "booking_date": booking_date,
+        "project": project["name"],
+        "plot": plot["name"],
+        "customer": _customer_name(rng.randrange(vol["customers"])),
+        "assigned_rm": rng.choice(rms_by_project[project["name"]]),
+        "payment_plan_type": plan_code,
+        "booking_status": "Cancelled" if cancelled else _booking_status(rows),
+        "possession_date": project["possession_date"],
+        "plot_value": plot["total_value"],
+        "discount": discount,
+        "final_value": final_value,
+    }
+    return booking, rows
+
+
+def _make_payment_entries(rng, booking, rows):
+    """One submitted Payment Entry per stage row that has received money."""
+    entries = []
+    for row in rows:
+        if not row["payment_entry"]:
+            continue
+        entries.append(
+            {
+                **_std(row["payment_entry"], row["receipt_date"]),
+                "docstatus": 1,
+                "payment_type": "Receive",
+                "posting_date": row["receipt_date"],
+                "mode_of_payment": rng.choice(PAYMENT_MODES),
+                "party_type": "Customer",
+                "party": booking["customer"],
+                "paid_amount": row["amount_received"],
+                "received_amount": row["amount_received"],
+                "base_paid_amount": row["amount_received"],
+                "base_received_amount": row["amount_received"],
+                "source_exchange_rate": 1,
+                "target_exchange_rate": 1,
+                "reference_no": f"REF{rng.randint(100000, 999999)}",
+                "reference_date": row["receipt_date"],
+                "remarks": f"Payment for RE Booking {booking['name']} — {row['stage_name']}",
+            }
+        )
+    return entries
+
+
+def _generate_leads(rng, vol, projects, rms_by_project, anchor):
+    for start in range(0, vol["leads"], CHUNK_SIZE):
+        rows = []
+        for i in range(start, min(start + CHUNK_SIZE, vol["leads"])):
+            project = rng.choice(projects)["name"]
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            created = add_days(anchor, -rng.randint(0, 365 * 3))
+            rows.append(
+                {
+                    **_std(f"{PREFIX}LEAD-{i + 1:08d}", created),
+                    "first_name": first,
+                    "last_name": last,
+                    "lead_name": f"{first} {last}",
+                    "status": rng.choice(LEAD_STATUSES),
+                    "email_id": f"lead{i + 1}@synthetic.example",
+                    "mobile_no": f"9{rng.randint(100000000, 999999999)}",
+                    "re_interested_in_project": project,
+                    "re_assigned_rm": rng.choice(rms_by_project[project]) if rng.random() < 0.85 else None,
+                    "re_budget": rng.choice([2, 3, 5, 8, 12]) * 1000000,
+                }
+            )
+        _bulk_insert("Lead", rows)
+
+
+def _generate_opportunities(rng, vol, projects, rms_by_project, anchor):
+    """Opportunities from synthetic leads, each shortlisting a plot of its project."""
+    n_projects = len(projects)
+    plots_per_project = max(1, vol["plots"] // n_projects)
+    for start in range(0, vol["opportunities"], CHUNK_SIZE):
+        rows = []
+        for i in range(start, min(start + CHUNK_SIZE, vol["opportunities"])):
+            p = rng.randrange(n_projects)
+            project = projects[p]["name"]
+            created = add_days(anchor, -rng.randint(0, 365 * 3))
+            rows.append(
+                {
+                    **_std(f"{PREFIX}OPP-{i + 1:08d}", created),
+                    "opportunity_from": "Lead",
+                    "party_name": f"{PREFIX}LEAD-{rng.randrange(vol['leads']) + 1:08d}",
+                    "status": rng.choice(OPPORTUNITY_STATUSES),
+                    "transaction_date": getdate(created),
+                    "re_project": project,
+                    "re_plot_shortlisted": f"{project}-{rng.randrange(plots_per_project) + 1:05d}",
+                    "re_assigned_rm": rng.choice(rms_by_project[project]),
+                }
+            )
+        _bulk_insert("Opportunity", rows)
+
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+
+def _due_date(trigger, days, booking_date, possession_date):
+    if trigger == "On Booking":
+        return booking_date
+    if trigger == "Days from Booking":
+        return getdate(add_days(booking_date, days))
+    if trigger == "On Possession":
+        return possession_date
+    return getdate(add_days(possession_date, days))
+
+
+def _stage_state(rng, amount_due, due_date, anchor, cancelled):
+    """(amount_received, status, receipt_date) for one schedule row."""
+    if due_date <= anchor:
+        roll = rng.random()
+        if roll < 0.75:
+            received, status = amount_due, "Paid"
+        elif roll < 0.85:
+            received, status = flt(amount_due * rng.choice([0.25, 0.5])), "Overdue"
+        else:
+            received, status = 0.0, "Overdue"
+    else:
+        received, status = (amount_due, "Paid") if rng.random() < 0.05 else (0.0, "Pending")
+
+    receipt_date = None
+    if received:
+        receipt_date = getdate(add_days(min(due_date, anchor), -rng.randint(0, 10)))
+    if cancelled and status != "Paid":
+        status = "Cancelled"
+    return received, status, receipt_date
+
+
+def _booking_status(rows):
+    """Same transitions as re_booking._refresh_booking_status."""
+    statuses = [r["status"] for r in rows]
+    non_possession = [r["status"] for r in rows if not r["is_possession_stage"]]
+    if all(s == "Paid" for s in statuses):
+        return "Completed"
+    if non_possession and all(s == "Paid" for s in non_possession):
+        return "Possession Due"
+    if any(r["amount_received"] for r in rows):
+        return "Payment In Progress"
+    return "Booked"
+
+
+def _customer_name(index):
+    return f"{PREFIX}CUST-{index + 1:07d}"
+
+
+def _std(name, on_date):
+    ts = datetime.combine(getdate(on_date), time(10, 0)) if on_date else datetime(2024, 1, 1, 10, 0)
+    return {
+        "name": name,
+        "creation": ts,
+        "modified": ts + timedelta(minutes=5),
+        "owner": "Administrator",
+        "modified_by": "Administrator",
+        "docstatus": 0,
+        "idx": 0,
+    }
+
+
+def _child(name, parent, parenttype, parentfield, idx):
+    return {
+        **_std(name, None),
+        "parent": parent,
+        "parenttype": parenttype,
+        "parentfield": parentfield,
+        "idx": idx,
+    }
+
+
+def _bulk_insert(doctype, rows):
+    if not rows:
+        return
+    fields = list(rows[0])
+    frappe.db.bulk_insert(
+        doctype,
+        fields,
+        [tuple(row[f] for f in fields) for row in rows],
+        chunk_size=CHUNK_SIZE,
+    )
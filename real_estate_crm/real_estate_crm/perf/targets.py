@@ -0,0 +1,95 @@
+"""
+Hot read paths exercised by the performance tooling.
+
+Shared by query_plans (EXPLAIN checks) and benchmark (latency tiers) so both
+always cover the same endpoints with the same representative filters.
+"""
+
+import frappe
+from frappe.utils import add_days, getdate, now_datetime
+
+
+def get_context():
+    """Representative filter values picked from the (synthetic) data."""
+    project = frappe.db.sql(
+        "SELECT project FROM `tabRE Booking` WHERE docstatus = 1 GROUP BY project ORDER BY COUNT(*) DESC LIMIT 1"
+    )
+    project = project[0][0] if project else None
+    booking = frappe.db.get_value(
+        "RE Booking",
+        {"docstatus": 1, "project": project},
+        ["customer", "assigned_rm", "booking_date"],
+        as_dict=True,
+    ) or frappe._dict()
+    booking_date = booking.booking_date or getdate()
+    return frappe._dict(
+        project=project,
+        rm=booking.assigned_rm,
+        customer=booking.customer,
+        search_query="Sharma",
+        from_date=add_days(booking_date, -90),
+        to_date=booking_date,
+    )
+
+
+def get_read_targets(ctx):
+    """(label, callable) for every read path, with representative filters."""
+    from real_estate_crm.api.re_global_search import global_search
+    from real_estate_crm.api.re_plot_availability import get_plot_changes, get_plot_snapshot
+    from real_estate_crm.real_estate_crm.page.customer_360.customer_360 import get_customer_360_data
+    from real_estate_crm.real_estate_crm.page.re_dashboard.re_dashboard import SECTION_DOMAINS, get_dashboard_data
+    from real_estate_crm.real_estate_crm.page.re_project_dashboard.re_project_dashboard import (
+        get_project_dashboard_data,
+    )
+    from real_estate_crm.real_estate_crm.report.booking_register import booking_register
+    from real_estate_crm.real_estate_crm.report.customer_ledger import customer_ledger
+    from real_estate_crm.real_estate_crm.report.overdue_payment_report import overdue_payment_report
+    from real_estate_crm.real_estate_crm.report.payment_collection_report import payment_collection_report
+    from real_estate_crm.real_estate_crm.report.plot_inventory_status import plot_inventory_status
+    from real_estate_crm.real_estate_crm.report.receivables_aging import receivables_aging
+    from real_estate_crm.real_estate_crm.report.rm_performance_report import rm_performance_report
+    from real_estate_crm.utils.cash_flow_forecast import compute_forecast, get_scenario, load_schedule
+    from real_estate_crm.utils.version_stamps import get_versions
+
+    project, rm, customer = ctx.project, ctx.rm, ctx.customer
+    date_range = {"from_date": ctx.from_date, "to_date": ctx.to_date}
+
+    return [
+        ("re_dashboard", get_dashboard_data),
+        ("re_project_dashboard", lambda: get_project_dashboard_data(project)),
+        ("re_dashboard:parallel", lambda: get_dashboard_data(parallel=1)),
+        ("re_project_dashboard:parallel", lambda: get_project_dashboard_data(project, parallel=1)),
+        (
+            "re_dashboard:not_modified",
+            lambda: get_dashboard_data(client_versions=get_versions(SECTION_DOMAINS)),
+        ),
+        ("customer_360", lambda: get_customer_360_data(customer)),
+        ("global_search", lambda: global_search(ctx.search_query)),
+        (
+            "cash_flow_forecast",
+            lambda: compute_forecast(load_schedule(), get_scenario({"possession_delay_months": 6})),
+        ),
+        ("plot_snapshot", lambda: get_plot_snapshot(project)),
+        ("plot_changes", lambda: get_plot_changes(project, str(add_days(now_datetime(), -1)))),
+        ("booking_register", lambda: booking_register.execute(frappe._dict(project=project, **date_range))),
+        ("booking_register:dates", lambda: booking_register.execute(frappe._dict(**date_range))),
+        ("customer_ledger", lambda: customer_ledger.execute(frappe._dict(customer=customer, **date_range))),
+        ("customer_ledger:project", lambda: customer_ledger.execute(frappe._dict(project=project, **date_range))),
+        ("overdue_payment_report", lambda: overdue_payment_report.execute(frappe._dict(project=project))),
+        ("overdue_payment_report:rm", lambda: overdue_payment_report.execute(frappe._dict(rm=rm))),
+        (
+            "overdue_payment_report:rm_summary",
+            lambda: overdue_payment_report.execute(frappe._dict(view="RM Summary", min_days_overdue=30)),
+        ),
+        (
+            "payment_collection_report",
+            lambda: payment_collection_report.execute(frappe._dict(project=project, **date_range)),
+        ),
+        ("plot_inventory_status", lambda: plot_inventory_status.execute(frappe._dict(project=project))),
+        ("rm_performance_report", lambda: rm_performance_report.execute(frappe._dict(rm=rm))),
+        ("receivables_aging", lambda: receivables_aging.execute(frappe._dict(view="Summary", group_by="RM"))),
+        (
+            "receivables_aging:trend",
+            lambda: receivables_aging.execute(frappe._dict(view="Trend", project=project, **date_range)),
+        ),
+    ]
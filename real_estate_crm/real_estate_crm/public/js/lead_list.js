@@ -0,0 +1,98 @@
+// Extends the native Lead list with the bulk lead import.
+// Injected via doctype_list_js in hooks.py; keeps ERPNext's own list settings.
+
+(function () {
+	const settings = (frappe.listview_settings["Lead"] = frappe.listview_settings["Lead"] || {});
+	const base_onload = settings.onload;
+
+	settings.onload = function (listview) {
+		if (base_onload) base_onload.call(this, listview);
+		if (!frappe.user.has_role(["RE Admin", "RE Sales Manager", "System Manager"])) return;
+
+		listview.page.add_inner_button(__("Bulk Import"), open_import_dialog);
+	};
+
+	function open_import_dialog() {
+		const dialog = new frappe.ui.Dialog({
+			title: __("Bulk Lead Import"),
+			fields: [
+				{
+					fieldname: "file_url",
+					fieldtype: "Attach",
+					label: __("CSV / XLSX File"),
+					reqd: 1,
+					description: __(
+						"Columns: Lead Name, Email, Mobile, Project, Budget, Source, Campaign."
+					),
+				},
+				{
+					fieldname: "project",
+					fieldtype: "Link",
+					label: __("Default Project"),
+					options: "RE Project",
+				},
+				{ fieldname: "source", fieldtype: "Link", label: __("Default Source"), options: "Lead Source" },
+				{
+					fieldname: "on_duplicate",
+					fieldtype: "Select",
+					label: __("On Duplicate Lead"),
+					options: "Skip\nMerge",
+					default: "Skip",
+					description: __("Merge fills the existing Lead's empty fields."),
+				},
+			],
+			primary_action_label: __("Import"),
+			primary_action(values) {
+				dialog.hide();
+				listen();
+				frappe.call({
+					method: "real_estate_crm.api.re_lead_import.import_leads",
+					args: values,
+					callback(r) {
+						if (r.message && r.message.queued) {
+							frappe.show_alert({
+								message: __("Import queued — you will be notified when it is done."),
+								indicator: "blue",
+							});
+						}
+					},
+				});
+			},
+		});
+		dialog.show();
+	}
+
+	let listening = false;
+
+	function listen() {
+		if (listening) return;
+		listening = true;
+
+		frappe.realtime.on("re_lead_import_progress", (data) => {
+			frappe.show_alert({ message: __("Lead import: {0} rows processed", [data.rows]), indicator: "blue" });
+		});
+
+		frappe.realtime.on("re_lead_import_done", (data) => {
+			if (data.error) {
+				frappe.msgprint({
+					title: __("Lead Import Failed"),
+					indicator: "red",
+					message: __("{0} {1} inserted, {2} merged before the failure.", [
+						data.error,
+						data.Inserted,
+						data.Merged,
+					]),
+				});
+				return;
+			}
+			frappe.msgprint({
+				title: __("Lead Import Finished"),
+				indicator: "green",
+				message: __(
+					"{0} rows: {1} inserted, {2} merged, {3} skipped, {4} invalid. <a href='{5}' target='_blank'>Download report</a>",
+					[data.rows, data.Inserted, data.Merged, data.Skipped, data.Invalid, data.report_url]
+				),
+			});
+		});
+	}
+})();
@@ -0,0 +1,78 @@
+/**
+ * Real Estate CRM — Desk bootstrap
+ * The only CRM bundle loaded on every desk page (app_include_js). Registers
+ * the Ctrl+K search shortcut and pulls in the sidebar the first time a CRM
+ * page is opened; the search modal loads on first use. Each lazy part is its
+ * own hashed bundle, so browsers cache it until the next build.
+ */
+
+import "./re_report_export.js";
+import "./re_version_cache.js";
+
+(function () {
+	const SIDEBAR_ASSETS = ["re_sidebar.bundle.css", "re_sidebar.bundle.js"];
+	const SEARCH_ASSETS = ["re_global_search.bundle.css", "re_global_search.bundle.js"];
+
+	const CRM_PAGES = ["re-dashboard", "re-project-dashboard", "re-performance", "customer-360"];
+	const CRM_REPORTS = [
+		"Plot Inventory Status",
+		"Booking Register",
+		"Payment Collection Report",
+		"Overdue Payment Report",
+		"Receivables Aging",
+		"RM Performance Report",
+		"Lead Funnel",
+		"Customer Ledger",
+	];
+
+	let sidebar_requested = false;
+
+	function is_crm_route() {
+		let [view, target] = frappe.get_route() || [];
+		if (CRM_PAGES.includes(view)) return true;
+		if (view === "query-report") return CRM_REPORTS.includes(target);
+		if (view === "Workspaces") return target === "Real Estate";
+		return Boolean(target) && (target.startsWith("RE ") || target === "Customer");
+	}
+
+	function show_sidebar() {
+		if (sidebar_requested) {
+			if (real_estate_crm.sidebar) real_estate_crm.sidebar.refresh();
+			return;
+		}
+		if (!is_crm_route()) return;
+
+		sidebar_requested = true;
+		frappe.require(SIDEBAR_ASSETS, () => real_estate_crm.sidebar.refresh());
+	}
+
+	frappe.provide("real_estate_crm");
+	real_estate_crm.open_global_search = function () {
+		frappe.require(SEARCH_ASSETS, () => real_estate_crm.global_search.open());
+	};
+
+	// First-paint timings of this page load, for comparing asset changes.
+	real_estate_crm.paint_timings = function () {
+		let timings = {};
+		performance.getEntriesByType("paint").forEach((entry) => {
+			timings[entry.name] = Math.round(entry.startTime);
+		});
+		return timings;
+	};
+
+	$(document).on("keydown", function (e) {
+		if ((e.ctrlKey || e.metaKey) && e.key === "k") {
+			e.preventDefault();
+			e.stopPropagation();
+			real_estate_crm.open_global_search();
+		}
+	});
+
+	$(document).on("startup", function () {
+		// startup fires after frappe.boot is loaded and desk is ready
+		if (frappe.session.user === "Guest") return;
+
+		show_sidebar();
+		frappe.router.on("change", show_sidebar);
+	});
+})();
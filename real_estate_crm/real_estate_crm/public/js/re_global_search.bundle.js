@@ -1,10 +1,13 @@
 /**
  * Real Estate CRM — Global Search Modal
- * Triggered by Ctrl+K or sidebar search icon.
- * Searches across Projects, Plots, Bookings, RMs, and Customers.
+ * Loaded on demand by re_crm.bundle.js on the first Ctrl+K or sidebar
+ * search click. Searches across Projects, Plots, Bookings, RMs, and Customers.
  */
 
 (function () {
+	const CACHE_SIZE = 50;
+	const CACHE_TTL_MS = 60 * 1000;
+
 	let $modal = null;
 	let $input = null;
 	let $results = null;
@@ -12,6 +15,11 @@
 	let selected_index = -1;
 	let all_items = [];
 
+	// query → {categories, at}; Map keeps insertion order, oldest first.
+	let cache = new Map();
+	let inflight = null;
+	let request_seq = 0;
+
 	function ensure_modal() {
 		if ($modal) return;
 
@@ -42,6 +50,7 @@
 			clearTimeout(debounce_timer);
 
 			if (query.length < 2) {
+				abort_inflight();
 				$results.empty();
 				selected_index = -1;
 				all_items = [];
@@ -68,20 +77,97 @@
 	}
 
 	function do_search(query) {
+		let key = query.toLowerCase();
+		let cached = cache_get(key) || narrow_from_cache(key);
+		if (cached) {
+			abort_inflight();
+			render_results(cached);
+			return;
+		}
+
 		$results.html('<div class="re-search-loading"><div class="spinner-border spinner-border-sm text-primary"></div></div>');
 
-		frappe.call({
+		// Only the latest query may render; older requests are aborted and
+		// anything that still arrives late is ignored.
+		abort_inflight();
+		let seq = ++request_seq;
+		inflight = frappe.call({
 			method: "real_estate_crm.api.re_global_search.global_search",
 			args: { query: query },
 			callback: function (r) {
-				render_results(r.message || []);
+				if (seq !== request_seq) return;
+				inflight = null;
+				let categories = r.message || [];
+				cache_set(key, categories);
+				render_results(categories);
 			},
 			error: function () {
+				if (seq !== request_seq) return;
+				inflight = null;
 				$results.html('<div class="re-search-empty">Search failed. Please try again.</div>');
 			},
 		});
 	}
 
+	function abort_inflight() {
+		request_seq++;
+		if (inflight && inflight.abort) {
+			inflight.abort();
+		}
+		inflight = null;
+	}
+
+	/* ---------------- result cache ---------------- */
+
+	function cache_get(key) {
+		let entry = cache.get(key);
+		if (!entry) return null;
+		if (Date.now() - entry.at > CACHE_TTL_MS) {
+			cache.delete(key);
+			return null;
+		}
+		// Refresh LRU position.
+		cache.delete(key);
+		cache.set(key, entry);
+		return entry.categories;
+	}
+
+	function cache_set(key, categories) {
+		cache.delete(key);
+		cache.set(key, { categories: categories, at: Date.now() });
+		while (cache.size > CACHE_SIZE) {
+			cache.delete(cache.keys().next().value);
+		}
+	}
+
+	// A narrower query ("sharm") is answered from a broader cached one
+	// ("sha") when every category of it was complete (server-side
+	// LIKE %sharm% matches are a subset of LIKE %sha%).
+	function narrow_from_cache(key) {
+		let broader = Array.from(cache.keys())
+			.filter((cached_key) => key.includes(cached_key))
+			.sort((a, b) => b.length - a.length)
+			.map((cached_key) => cache_get(cached_key))
+			.find((categories) => categories && categories.every((cat) => cat.complete));
+		if (!broader) return null;
+
+		let categories = broader
+			.map((cat) => {
+				let items = cat.items
+					.filter((item) => (item.match || []).some((v) => (v || "").toLowerCase().includes(key)))
+					.sort((a, b) => exact_rank(b, key) - exact_rank(a, key));
+				return Object.assign({}, cat, { items: items });
+			})
+			.filter((cat) => cat.items.length);
+
+		cache_set(key, categories);
+		return categories;
+	}
+
+	function exact_rank(item, key) {
+		return (item.match || []).some((v) => (v || "").toLowerCase() === key) ? 1 : 0;
+	}
+
 	function render_results(categories) {
 		$results.empty();
 		selected_index = -1;
@@ -185,13 +271,6 @@
 		}
 	}
 
-	$(document).on("keydown", function (e) {
-		if ((e.ctrlKey || e.metaKey) && e.key === "k") {
-			e.preventDefault();
-			e.stopPropagation();
-			open_search();
-		}
-	});
-
-	window.re_open_global_search = open_search;
+	frappe.provide("real_estate_crm.global_search");
+	real_estate_crm.global_search.open = open_search;
 })();
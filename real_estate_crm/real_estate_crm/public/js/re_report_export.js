@@ -0,0 +1,82 @@
+/**
+ * Real Estate CRM — Background Report Export
+ * Adds an "Export (Background)" button to RE script reports. The file is
+ * built by a worker and attached to the Report; progress is shown live.
+ */
+
+(function () {
+	const METHOD = "real_estate_crm.api.re_report_export.export_report";
+	let listening = false;
+
+	function listen() {
+		if (listening) return;
+		listening = true;
+
+		frappe.realtime.on("re_report_export_progress", (data) => {
+			frappe.show_progress(
+				__("Exporting {0}", [data.report_name]),
+				data.written,
+				data.total,
+				__("{0} of {1} rows", [data.written, data.total])
+			);
+		});
+
+		frappe.realtime.on("re_report_export_done", (data) => {
+			frappe.hide_progress();
+			if (data.error) {
+				frappe.msgprint({ title: __("Export Failed"), message: data.error, indicator: "red" });
+				return;
+			}
+			frappe.msgprint({
+				title: __("Export Ready"),
+				indicator: "green",
+				message: __("{0} rows exported. <a href='{1}' target='_blank'>Download</a>", [
+					data.rows,
+					data.file_url,
+				]),
+			});
+		});
+	}
+
+	function export_report(report) {
+		const dialog = new frappe.ui.Dialog({
+			title: __("Export {0}", [report.report_name]),
+			fields: [
+				{
+					fieldname: "file_format",
+					label: __("Format"),
+					fieldtype: "Select",
+					options: "CSV\nXLSX",
+					default: "CSV",
+				},
+			],
+			primary_action_label: __("Export"),
+			primary_action: (values) => {
+				dialog.hide();
+				listen();
+				frappe.call({
+					method: METHOD,
+					args: {
+						report_name: report.report_name,
+						filters: report.get_filter_values(),
+						file_format: values.file_format,
+					},
+					callback: (r) => {
+						if (r.message && r.message.queued) {
+							frappe.show_alert({
+								message: __("Export queued — you will be notified when it is ready."),
+								indicator: "blue",
+							});
+						}
+					},
+				});
+			},
+		});
+		dialog.show();
+	}
+
+	frappe.provide("real_estate_crm");
+	real_estate_crm.add_background_export = function (report) {
+		report.page.add_inner_button(__("Export (Background)"), () => export_report(report));
+	};
+})();
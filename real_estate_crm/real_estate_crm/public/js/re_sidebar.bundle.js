@@ -1,21 +1,15 @@
 /**
  * Real Estate CRM — Persistent Sidebar
- * Injected on all pages via app_include_js in hooks.py.
- * Provides consistent CRM navigation across the entire app.
+ * Loaded on demand by re_crm.bundle.js the first time a CRM page is opened;
+ * stays in place from then on. Provides consistent CRM navigation.
  */
 
-$(document).on("startup", function () {
-	// startup event fires after frappe.boot is loaded and desk is ready
-	if (frappe.session.user === "Guest") return;
+frappe.provide("real_estate_crm.sidebar");
 
+real_estate_crm.sidebar.refresh = function () {
 	build_sidebar();
-
-	// Update active state on route change
-	frappe.router.on("change", function () {
-		build_sidebar();
-		update_active_item();
-	});
-});
+	update_active_item();
+};
 
 function build_sidebar() {
 	// Don't create duplicate
@@ -68,9 +62,15 @@ function build_sidebar() {
 		<a class="re-sidebar-item" data-route="/app/query-report/Overdue Payment Report">
 			<i class="fa fa-exclamation-circle"></i> Overdue
 		</a>
+		<a class="re-sidebar-item" data-route="/app/query-report/Receivables Aging">
+			<i class="fa fa-clock-o"></i> Aging
+		</a>
 		<a class="re-sidebar-item" data-route="/app/query-report/RM Performance Report">
 			<i class="fa fa-line-chart"></i> RM Performance
 		</a>
+		<a class="re-sidebar-item" data-route="/app/query-report/Lead Funnel">
+			<i class="fa fa-filter"></i> Lead Funnel
+		</a>
 		<a class="re-sidebar-item" data-route="/app/query-report/Customer Ledger">
 			<i class="fa fa-book"></i> Customer Ledger
 		</a>
@@ -109,9 +109,7 @@ function build_sidebar() {
 	// Search icon handler
 	$(".re-crm-sidebar .re-sidebar-search").on("click", function (e) {
 		e.preventDefault();
-		if (window.re_open_global_search) {
-			window.re_open_global_search();
-		}
+		real_estate_crm.open_global_search();
 	});
 
 	update_active_item();
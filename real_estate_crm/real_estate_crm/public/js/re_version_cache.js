@@ -0,0 +1,98 @@
+/**
+ * Real Estate CRM — Versioned page data cache
+ * Keeps the last payload of a versioned endpoint (dashboards, Customer 360)
+ * in sessionStorage. The cached copy renders immediately; the server is then
+ * asked with the cached version and answers "not_modified" or fresh data.
+ * Entries live only as long as the tab, and entries of any other user (an
+ * earlier login in the same tab) are dropped when the desk loads.
+ */
+
+(function () {
+	const PREFIX = "re_vc:";
+
+	function storage_key(key) {
+		return PREFIX + frappe.session.user + ":" + key;
+	}
+
+	function read(key) {
+		try {
+			let raw = sessionStorage.getItem(storage_key(key));
+			return raw ? JSON.parse(raw) : null;
+		} catch (e) {
+			return null;
+		}
+	}
+
+	function write(key, version, data) {
+		let value = JSON.stringify({ version: version, data: data });
+		try {
+			sessionStorage.setItem(storage_key(key), value);
+		} catch (e) {
+			// Quota exceeded — drop our entries and try once more.
+			clear();
+			try {
+				sessionStorage.setItem(storage_key(key), value);
+			} catch (e2) {
+				// Give up; the page still works uncached.
+			}
+		}
+	}
+
+	function remove(key) {
+		try {
+			sessionStorage.removeItem(storage_key(key));
+		} catch (e) {
+			// ignore
+		}
+	}
+
+	function clear(except_user) {
+		let own = except_user ? PREFIX + except_user + ":" : null;
+		try {
+			Object.keys(sessionStorage)
+				.filter((k) => k.startsWith(PREFIX) && !(own && k.startsWith(own)))
+				.forEach((k) => sessionStorage.removeItem(k));
+		} catch (e) {
+			// ignore
+		}
+	}
+
+	/**
+	 * opts: { method, args, cache_key, render(data), error() }
+	 * `method` must accept `client_version` and return
+	 * {version, data} or {version, not_modified: 1}.
+	 */
+	function call(opts) {
+		let cached = read(opts.cache_key);
+		if (cached) {
+			opts.render(cached.data);
+		}
+
+		return frappe.call({
+			method: opts.method,
+			args: Object.assign({}, opts.args, { client_version: cached ? cached.version : "" }),
+			callback: function (r) {
+				let message = r.message || {};
+				if (message.not_modified) return;
+
+				// No version: the server could not vouch for freshness
+				// (replica catching up) — render but do not keep it.
+				if (message.version) {
+					write(opts.cache_key, message.version, message.data);
+				} else {
+					remove(opts.cache_key);
+				}
+				opts.render(message.data);
+			},
+			error: function () {
+				if (!cached && opts.error) opts.error();
+			},
+		});
+	}
+
+	// Nothing cached for one user may outlive their session in this tab.
+	clear(frappe.session && frappe.session.user);
+
+	frappe.provide("real_estate_crm.version_cache");
+	Object.assign(real_estate_crm.version_cache, { call, read, write, remove, clear });
+})();
@@ -0,0 +1,102 @@
+"""
+RE Aging Snapshot — nightly receivables aging, one row per
+(snapshot_date, project, RM, customer, bucket).
+
+Built by build_snapshot() right after mark_overdue_schedules. Reports read
+the snapshot instead of re-aggregating the payment schedule, and aging
+trends are a range scan on snapshot_date.
+"""
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import getdate, today
+
+BUCKETS = ("0-30", "31-60", "61-90", "90+")
+
+
+class REAgingSnapshot(Document):
+    pass
+
+
+def on_doctype_update():
+    # Per-project trend scans in the Receivables Aging report.
+    frappe.db.add_index("RE Aging Snapshot", ["project", "snapshot_date"])
+
+
+def build_snapshot(snapshot_date=None):
+    """
+    (Re)build the snapshot for `snapshot_date` (default today) with a single
+    INSERT … SELECT. Overdue = unpaid balance on a submitted booking whose
+    due_date has passed; days overdue are bucketed in SQL.
+    """
+    snapshot_date = getdate(snapshot_date or today())
+    values = {"snapshot_date": snapshot_date, "user": frappe.session.user}
+
+    frappe.db.sql("DELETE FROM `tabRE Aging Snapshot` WHERE snapshot_date = %(snapshot_date)s", values)
+    frappe.db.sql(
+        """
+        INSERT INTO `tabRE Aging Snapshot`
+            (name, creation, modified, owner, modified_by, docstatus,
+             snapshot_date, project, assigned_rm, customer, bucket, outstanding, schedule_rows)
+        SELECT
+            MD5(CONCAT_WS('|', %(snapshot_date)s, a.project, IFNULL(a.assigned_rm, ''), a.customer, a.bucket)),
+            NOW(), NOW(), %(user)s, %(user)s, 0,
+            %(snapshot_date)s, a.project, a.assigned_rm, a.customer, a.bucket,
+            SUM(a.balance), COUNT(*)
+        FROM (
+            SELECT
+                b.project,
+                b.assigned_rm,
+                b.customer,
+                ps.balance,
+                CASE
+                    WHEN DATEDIFF(%(snapshot_date)s, ps.due_date) <= 30 THEN '0-30'
+                    WHEN DATEDIFF(%(snapshot_date)s, ps.due_date) <= 60 THEN '31-60'
+                    WHEN DATEDIFF(%(snapshot_date)s, ps.due_date) <= 90 THEN '61-90'
+                    ELSE '90+'
+                END AS bucket
+            FROM `tabRE Booking Payment Schedule` ps
+            INNER JOIN `tabRE Booking` b ON b.name = ps.parent
+            WHERE b.docstatus = 1
+                AND ps.status NOT IN ('Paid', 'Cancelled')
+                AND ps.balance > 0
+                AND ps.due_date < %(snapshot_date)s
+        ) a
+        GROUP BY a.project, a.assigned_rm, a.customer, a.bucket
+        """,
+        values,
+    )
+    frappe.db.commit()
+
+
+def get_latest_snapshot_date(on_or_before=None):
+    return frappe.db.sql(
+        "SELECT MAX(snapshot_date) FROM `tabRE Aging Snapshot` WHERE snapshot_date <= %s",
+        (getdate(on_or_before or today()),),
+    )[0][0]
+
+
+def get_bucket_totals(project=None, rm=None, snapshot_date=None):
+    """{bucket: outstanding} from the latest snapshot on or before `snapshot_date`."""
+    snapshot_date = get_latest_snapshot_date(snapshot_date)
+    totals = dict.fromkeys(BUCKETS, 0)
+    if not snapshot_date:
+        return totals
+
+    conditions = ""
+    if project:
+        conditions += " AND project = %(project)s"
+    if rm:
+        conditions += " AND assigned_rm = %(rm)s"
+
+    rows = frappe.db.sql(
+        """
+        SELECT bucket, SUM(outstanding)
+        FROM `tabRE Aging Snapshot`
+        WHERE snapshot_date = %(snapshot_date)s {conditions}
+        GROUP BY bucket
+        """.format(conditions=conditions),
+        {"snapshot_date": snapshot_date, "project": project, "rm": rm},
+    )
+    totals.update({bucket: amount for bucket, amount in rows})
+    return totals
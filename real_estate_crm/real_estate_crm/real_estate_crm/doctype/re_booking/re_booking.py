@@ -10,6 +10,12 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.utils import add_days, flt, cint, getdate, nowdate
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact import on_booking_change
+from real_estate_crm.real_estate_crm.doctype.re_plot.re_plot import publish_plot_status
+from real_estate_crm.utils.report_cache import invalidate as invalidate_report_cache
+from real_estate_crm.utils.version_stamps import bump as bump_versions
+
 
 class REBooking(Document):
 
@@ -23,14 +29,34 @@ class REBooking(Document):
         self._validate_possession_date_if_needed()
         self._generate_payment_schedule()
 
+    def on_update(self):
+        # Drafts show up on Customer 360.
+        bump_versions(("booking",), project=self.project, customer=self.customer, rms=self._rms())
+
     def on_submit(self):
         self._lock_plot()
         frappe.db.set_value("RE Booking", self.name, "booking_status", "Booked")
+        invalidate_report_cache()
+        bump_versions(("booking", "payment"), project=self.project, customer=self.customer, rms=self._rms())
+        on_booking_change(self)
 
     def on_cancel(self):
         self._release_plot()
         self._cancel_pending_schedule_rows()
         frappe.db.set_value("RE Booking", self.name, "booking_status", "Cancelled")
+        invalidate_report_cache()
+        bump_versions(("booking", "payment"), project=self.project, customer=self.customer, rms=self._rms())
+        on_booking_change(self)
+
+    def on_update_after_submit(self):
+        invalidate_report_cache()
+        bump_versions(("booking",), project=self.project, customer=self.customer, rms=self._rms())
+        on_booking_change(self)
+
+    def _rms(self):
+        """This booking's RM, and the previous one if it was reassigned (RM dashboard stats)."""
+        before = self.get_doc_before_save()
+        return (self.assigned_rm, before.assigned_rm if before else None)
 
     # ── Validation helpers ────────────────────────────────────────────────────
 
@@ -126,19 +152,26 @@ class REBooking(Document):
 
     def _lock_plot(self):
         """Mark the plot as Booked and link it to this booking. (PRD §5.2 on_submit)"""
+        previous_status = frappe.db.get_value("RE Plot", self.plot, "status")
         frappe.db.set_value(
             "RE Plot",
             self.plot,
             {"status": "Booked", "booking": self.name},
         )
+        publish_plot_status(
+            self.plot, self.project, "Booked",
+            previous_status=previous_status, booking=self.name, customer=self.customer,
+        )
 
     def _release_plot(self):
         """Revert plot to Available on booking cancellation. (PRD §5.2 on_cancel)"""
+        previous_status = frappe.db.get_value("RE Plot", self.plot, "status")
         frappe.db.set_value(
             "RE Plot",
             self.plot,
             {"status": "Available", "booking": None},
         )
+        publish_plot_status(self.plot, self.project, "Available", previous_status=previous_status)
 
     def _cancel_pending_schedule_rows(self):
         """Mark all non-Paid schedule rows as Cancelled."""
@@ -152,10 +185,16 @@ class REBooking(Document):
         )
 
 
+def on_doctype_update():
+    # RM dashboard: bookings and value per status, from the index alone.
+    frappe.db.add_index("RE Booking", ["assigned_rm", "booking_status", "final_value"])
+
+
 # ── Whitelisted server methods ────────────────────────────────────────────────
 
 
 @frappe.whitelist()
+@instrument()
 def receive_payment(
     booking_name,
     schedule_row_name,
@@ -244,6 +283,10 @@ def receive_payment(
             "remarks": (
                 f"Payment for RE Booking {booking_name} — {row.stage_name}"
             ),
+            # Collection event for RM commission (RE Commission Entry).
+            "re_booking": booking_name,
+            "re_schedule_row": row.name,
+            "re_assigned_rm": booking.assigned_rm,
         }
     )
     pe.insert(ignore_permissions=True)
@@ -267,14 +310,20 @@ def receive_payment(
     )
 
     _refresh_booking_status(booking_name)
+    invalidate_report_cache()
+    bump_versions(
+        ("booking", "payment"), project=booking.project, customer=booking.customer, rms=(booking.assigned_rm,)
+    )
     return pe.name
 
 
 @frappe.whitelist()
+@instrument()
 def generate_invoice(booking_name):
     """
     Creates a native ERPNext Sales Invoice for the booking. (PRD §10.3)
     Visible to RE Accounts / RE Admin only (enforced in JS).
+    For many bookings at once, see api/re_batch_invoice.py.
     """
     frappe.only_for(["RE Accounts", "RE Admin", "System Manager"])
 
@@ -282,6 +331,12 @@ def generate_invoice(booking_name):
     if booking.docstatus != 1:
         frappe.throw(_("Invoice can only be generated for a submitted booking."))
 
+    existing = frappe.db.get_value(
+        "Sales Invoice", {"re_booking": booking_name, "docstatus": ["<", 2]}, "name"
+    )
+    if existing:
+        frappe.throw(_("Booking {0} is already invoiced in {1}.").format(booking_name, existing))
+
     company = (
         frappe.defaults.get_user_default("Company")
         or frappe.db.get_single_value("Global Defaults", "default_company")
@@ -292,10 +347,12 @@ def generate_invoice(booking_name):
     si.posting_date = nowdate()
     si.due_date = nowdate()
     si.company = company
+    si.re_booking = booking_name
 
     si.append(
         "items",
         {
+            "item_code": frappe.db.get_single_value("RE CRM Settings", "invoice_item"),
             "item_name": f"Plot {booking.plot}",
             "description": (
                 f"Sale of Plot {booking.plot}, Project: {booking.project}\n"
@@ -304,8 +361,6 @@ def generate_invoice(booking_name):
             "qty": 1,
             "rate": flt(booking.final_value),
             "amount": flt(booking.final_value),
-            # item_code intentionally omitted — set a default item in ERPNext
-            # (e.g. "Plot Sale") or extend this method as needed.
         },
     )
 
@@ -350,4 +405,12 @@ def _refresh_booking_status(booking_name):
     else:
         new_status = "Booked"
 
+    booking = frappe.db.get_value(
+        "RE Booking",
+        booking_name,
+        ["booking_status", "project", "assigned_rm", "customer", "booking_date"],
+        as_dict=True,
+    )
     frappe.db.set_value("RE Booking", booking_name, "booking_status", new_status)
+    if "Completed" in (booking.booking_status, new_status) and booking.booking_status != new_status:
+        on_booking_change(booking)
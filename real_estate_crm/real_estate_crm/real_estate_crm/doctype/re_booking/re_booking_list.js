@@ -0,0 +1,86 @@
+// RE Booking — list view
+// Batch invoicing (PRD §10.3): queues Sales Invoices for every matching
+// booking or stage; progress arrives over realtime.
+
+frappe.listview_settings["RE Booking"] = {
+	onload(listview) {
+		if (!frappe.user.has_role(["RE Accounts", "RE Admin", "System Manager"])) return;
+
+		listview.page.add_inner_button(__("Batch Invoice"), open_batch_invoice_dialog);
+	},
+};
+
+function open_batch_invoice_dialog() {
+	const dialog = new frappe.ui.Dialog({
+		title: __("Batch Invoice"),
+		fields: [
+			{
+				fieldname: "project",
+				fieldtype: "Link",
+				label: __("Project"),
+				options: "RE Project",
+			},
+			{
+				fieldname: "invoice_by",
+				fieldtype: "Select",
+				label: __("Invoice By"),
+				options: "Booking\nStage",
+				default: "Booking",
+				description: __("Date range applies to the booking date, or the stage due date."),
+			},
+			{
+				fieldname: "stage",
+				fieldtype: "Data",
+				label: __("Stage Name"),
+				depends_on: "eval:doc.invoice_by === 'Stage'",
+			},
+			{ fieldtype: "Column Break" },
+			{ fieldname: "from_date", fieldtype: "Date", label: __("From Date") },
+			{ fieldname: "to_date", fieldtype: "Date", label: __("To Date") },
+		],
+		primary_action_label: __("Create Invoices"),
+		primary_action(values) {
+			frappe.call({
+				method: "real_estate_crm.api.re_batch_invoice.create_invoices",
+				args: { filters: values },
+				freeze: true,
+				callback(r) {
+					dialog.hide();
+					if (!r.message) return;
+					if (!r.message.total) {
+						frappe.msgprint(__("Every matching booking is already invoiced."));
+						return;
+					}
+					watch_batch(r.message);
+				},
+			});
+		},
+	});
+	dialog.show();
+}
+
+function watch_batch(batch) {
+	const title = __("Creating Sales Invoices");
+	frappe.show_progress(title, 0, batch.total, __("Queued {0} invoices", [batch.total]));
+
+	const on_progress = (data) => {
+		if (data.batch_id !== batch.batch_id) return;
+		frappe.show_progress(title, data.done, data.total, __("{0} of {1}", [data.done, data.total]));
+	};
+	const on_done = (data) => {
+		if (data.batch_id !== batch.batch_id) return;
+		frappe.realtime.off("re_batch_invoice_progress", on_progress);
+		frappe.realtime.off("re_batch_invoice_done", on_done);
+		frappe.hide_progress();
+		let message = __("Created {0}, skipped {1} already invoiced, {2} failed (see Error Log).", [
+			data.created,
+			data.skipped,
+			data.failed,
+		]);
+		if (data.error) message += "<br>" + data.error;
+		frappe.msgprint(message, __("Batch Invoice"));
+	};
+
+	frappe.realtime.on("re_batch_invoice_progress", on_progress);
+	frappe.realtime.on("re_batch_invoice_done", on_done);
+}
@@ -1,5 +1,15 @@
+import frappe
 from frappe.model.document import Document
 
 
 class REBookingPaymentSchedule(Document):
     pass
+
+
+def on_doctype_update():
+    """
+    Composite index backing the overdue / upcoming-dues access path
+    (status = X AND due_date <range>) used by dashboards, reports and the
+    daily overdue job.
+    """
+    frappe.db.add_index("RE Booking Payment Schedule", ["status", "due_date"])
@@ -0,0 +1,131 @@
+"""
+RE Commission Entry — RM commission ledger, one row per
+(period, RM, project).
+
+Commission is paid on collections, not booked value. Collections are the
+submitted Payment Entries made by receive_payment() (re_booking,
+re_schedule_row and re_assigned_rm are stamped on them), attributed to the
+RM assigned when the payment was received. Each project's RE Commission
+Slab rows apply marginally to an RM's total for the period, like tax
+brackets:
+
+    slabs 0–10L @ 1%, 10L+ @ 1.5%;  collected 14L  →  10L × 1% + 4L × 1.5%
+
+calculate_commissions() computes a whole period in one INSERT … SELECT.
+Re-running a period replaces its Draft entries; Approved entries are kept
+untouched, and their (RM, project) pairs are not recomputed.
+"""
+
+import frappe
+from frappe import _
+from frappe.model.document import Document
+from frappe.utils import add_months, get_first_day, get_last_day, getdate, today
+
+COMMISSION_ROLES = ["RE Admin", "RE Accounts", "System Manager"]
+
+
+class RECommissionEntry(Document):
+    pass
+
+
+def on_doctype_update():
+    frappe.db.add_index("RE Commission Entry", ["period_start", "period_end", "rm", "project"])
+
+
+@frappe.whitelist()
+def calculate_commissions(period_start=None, period_end=None):
+    """
+    (Re)calculate commission for `period_start`–`period_end` (default: last
+    month). Returns {"entries", "collected", "commission"} for the period.
+    """
+    frappe.only_for(COMMISSION_ROLES)
+    return _calculate(*_get_period(period_start, period_end))
+
+
+def calculate_last_month():
+    """Monthly job: last month's commission, as Draft entries."""
+    _calculate(*_get_period(None, None))
+
+
+def _calculate(period_start, period_end):
+    values = {"period_start": period_start, "period_end": period_end, "user": frappe.session.user}
+
+    frappe.db.sql(
+        """
+        DELETE FROM `tabRE Commission Entry`
+        WHERE period_start = %(period_start)s AND period_end = %(period_end)s AND status = 'Draft'
+        """,
+        values,
+    )
+    frappe.db.sql(
+        """
+        INSERT INTO `tabRE Commission Entry`
+            (name, creation, modified, owner, modified_by, docstatus,
+             period_start, period_end, rm, project,
+             collected_amount, payments, commission_amount, effective_rate, status)
+        SELECT
+            MD5(CONCAT_WS('|', %(period_start)s, %(period_end)s, x.rm, x.project)),
+            NOW(), NOW(), %(user)s, %(user)s, 0,
+            %(period_start)s, %(period_end)s, x.rm, x.project,
+            x.collected, x.payments, x.commission,
+            IF(x.collected > 0, ROUND(x.commission * 100 / x.collected, 4), 0),
+            'Draft'
+        FROM (
+            SELECT
+                c.rm,
+                c.project,
+                c.collected,
+                c.payments,
+                ROUND(IFNULL(SUM(
+                    GREATEST(LEAST(c.collected, IF(s.to_amount > 0, s.to_amount, c.collected)) - s.from_amount, 0)
+                    * s.rate / 100
+                ), 0), 2) AS commission
+            FROM (
+                SELECT
+                    IFNULL(NULLIF(pe.re_assigned_rm, ''), b.assigned_rm) AS rm,
+                    b.project,
+                    SUM(pe.paid_amount) AS collected,
+                    COUNT(*) AS payments
+                FROM `tabPayment Entry` pe
+                INNER JOIN `tabRE Booking` b ON b.name = pe.re_booking
+                WHERE pe.docstatus = 1
+                    AND pe.payment_type = 'Receive'
+                    AND pe.posting_date BETWEEN %(period_start)s AND %(period_end)s
+                GROUP BY 1, 2
+                HAVING IFNULL(rm, '') != ''
+            ) c
+            LEFT JOIN `tabRE Commission Slab` s
+                ON s.parent = c.project AND s.parenttype = 'RE Project' AND s.parentfield = 'commission_slabs'
+            WHERE NOT EXISTS (
+                SELECT 1 FROM `tabRE Commission Entry` e
+                WHERE e.period_start = %(period_start)s AND e.period_end = %(period_end)s
+                    AND e.rm = c.rm AND e.project = c.project
+            )
+            GROUP BY c.rm, c.project, c.collected, c.payments
+        ) x
+        """,
+        values,
+    )
+    frappe.db.commit()
+
+    entries, collected, commission = frappe.db.sql(
+        """
+        SELECT COUNT(*), IFNULL(SUM(collected_amount), 0), IFNULL(SUM(commission_amount), 0)
+        FROM `tabRE Commission Entry`
+        WHERE period_start = %(period_start)s AND period_end = %(period_end)s
+        """,
+        values,
+    )[0]
+    return {"entries": entries, "collected": collected, "commission": commission}
+
+
+def _get_period(period_start, period_end):
+    if not period_start:
+        last_month = add_months(today(), -1)
+        return get_first_day(last_month), get_last_day(last_month)
+
+    period_start = getdate(period_start)
+    period_end = getdate(period_end) if period_end else get_last_day(period_start)
+    if period_end < period_start:
+        frappe.throw(_("Period End cannot be before Period Start"))
+    return period_start, period_end
@@ -0,0 +1,58 @@
+// RE Commission Entry — list view
+// Calculates RM commission on a period's collections; re-running a period
+// replaces its Draft entries and keeps Approved ones.
+
+frappe.listview_settings["RE Commission Entry"] = {
+	onload(listview) {
+		if (!frappe.user.has_role(["RE Accounts", "RE Admin", "System Manager"])) return;
+
+		listview.page.add_inner_button(__("Calculate Commissions"), () => open_calculate_dialog(listview));
+	},
+};
+
+function open_calculate_dialog(listview) {
+	const last_month = frappe.datetime.add_months(frappe.datetime.get_today(), -1);
+	const dialog = new frappe.ui.Dialog({
+		title: __("Calculate Commissions"),
+		fields: [
+			{
+				fieldname: "period_start",
+				fieldtype: "Date",
+				label: __("Period Start"),
+				default: frappe.datetime.month_start(last_month),
+				reqd: 1,
+			},
+			{
+				fieldname: "period_end",
+				fieldtype: "Date",
+				label: __("Period End"),
+				default: frappe.datetime.month_end(last_month),
+				reqd: 1,
+			},
+		],
+		primary_action_label: __("Calculate"),
+		primary_action(values) {
+			dialog.hide();
+			frappe.call({
+				method: "real_estate_crm.real_estate_crm.doctype.re_commission_entry.re_commission_entry.calculate_commissions",
+				args: values,
+				freeze: true,
+				freeze_message: __("Calculating commissions..."),
+				callback(r) {
+					if (!r.message) return;
+					frappe.msgprint({
+						title: __("Commissions Calculated"),
+						indicator: "green",
+						message: __("{0} entries: {1} collected, {2} commission.", [
+							r.message.entries,
+							format_currency(r.message.collected),
+							format_currency(r.message.commission),
+						]),
+					});
+					listview.refresh();
+				},
+			});
+		},
+	});
+	dialog.show();
+}
@@ -0,0 +1,256 @@
+"""
+RE Funnel Fact — Lead → Opportunity → Booking funnel, one row per
+(project, RM, week). Weeks start on Monday.
+
+Each row holds two views of the week:
+
+    cohort     leads created that week, and how many of them went on to an
+               Opportunity, a booking on the project, a Completed booking
+    activity   opportunities created and bookings dated that week
+
+A lead is followed through Opportunity (opportunity_from = Lead) and the
+Customer it was converted to (Customer.lead_name → RE Booking.customer).
+
+Lead, Opportunity and RE Booking events mark the cells they touch as dirty
+(a Redis set); refresh_dirty() recomputes only those cells every few
+minutes, each with one INSERT … SELECT over indexed rows. rebuild()
+recomputes everything in place (weekly, and after bulk changes that skip
+hooks). The Lead Funnel report reads this table only.
+"""
+
+import hashlib
+
+import frappe
+import redis
+from frappe.model.document import Document
+from frappe.utils import add_days, cstr, getdate
+
+DIRTY_KEY = "re_funnel_dirty"
+REFRESH_BATCH = 500
+_SEP = "\x1f"
+
+
+class REFunnelFact(Document):
+    pass
+
+
+def on_doctype_update():
+    # Report filters: project / RM over a range of weeks.
+    frappe.db.add_index("RE Funnel Fact", ["project", "week"])
+    frappe.db.add_index("RE Funnel Fact", ["rm", "week"])
+
+
+def week_start(value):
+    if not value:
+        return None
+    value = getdate(value)
+    return add_days(value, -value.weekday())
+
+
+# ─── Event hooks ─────────────────────────────────────────────────────────────
+
+
+def on_lead_change(doc, method=None):
+    """Lead on_update / on_trash (hooks.py)."""
+    cells = {_lead_cell(doc)}
+    before = doc.get_doc_before_save()
+    if before:
+        cells.add(_lead_cell(before))
+    mark_dirty(cells)
+
+
+def on_opportunity_change(doc, method=None):
+    """Opportunity on_update / on_trash (hooks.py)."""
+    cells = {_opportunity_cell(doc)}
+    before = doc.get_doc_before_save()
+    if before:
+        cells.add(_opportunity_cell(before))
+    if doc.opportunity_from == "Lead" and doc.party_name:
+        lead = frappe.db.get_value(
+            "Lead", doc.party_name, ["re_interested_in_project", "re_assigned_rm", "creation"], as_dict=True
+        )
+        if lead:
+            cells.add(_lead_cell(lead))
+    mark_dirty(cells)
+
+
+def on_booking_change(booking):
+    """RE Booking submit / cancel / status change: its week, and its customer's leads."""
+    cells = {(booking.project, cstr(booking.assigned_rm), week_start(booking.booking_date))}
+    leads = frappe.db.sql(
+        """
+        SELECT l.re_interested_in_project, l.re_assigned_rm, l.creation
+        FROM `tabCustomer` c
+        INNER JOIN `tabLead` l ON l.name = c.lead_name
+        WHERE c.name = %s AND l.re_interested_in_project = %s
+        """,
+        (booking.customer, booking.project),
+        as_dict=True,
+    )
+    cells.update(_lead_cell(lead) for lead in leads)
+    mark_dirty(cells)
+
+
+def mark_dirty(cells):
+    """Queue (project, rm, week) cells for the next refresh, once committed."""
+    members = {_SEP.join((project, cstr(rm), str(week))) for project, rm, week in cells if project and week}
+    if not members:
+        return
+
+    def add():
+        try:
+            frappe.cache().sadd(DIRTY_KEY, *members)
+        except Exception:
+            # Picked up by the weekly rebuild.
+            frappe.logger("real_estate_crm").warning("Could not mark funnel cells dirty", exc_info=True)
+
+    frappe.db.after_commit.add(add)
+
+
+# ─── Refresh ─────────────────────────────────────────────────────────────────
+
+
+def refresh_dirty():
+    """Recompute the dirty cells (scheduler, every few minutes)."""
+    cache = frappe.cache()
+    while True:
+        # RedisWrapper.spop takes no count; pop a batch from the raw client.
+        members = redis.Redis.spop(cache, cache.make_key(DIRTY_KEY), REFRESH_BATCH)
+        if not members:
+            return
+        try:
+            for member in members:
+                project, rm, week = frappe.safe_decode(member).split(_SEP)
+                refresh_cell(project, rm, week)
+            frappe.db.commit()
+        except Exception:
+            frappe.db.rollback()
+            cache.sadd(DIRTY_KEY, *members)
+            raise
+
+
+def rebuild():
+    """
+    Recompute every cell from Lead, Opportunity and RE Booking (weekly), in
+    place: the report keeps its current rows while cells are upserted, and
+    rows that no longer have a source cell are deleted at the end.
+    """
+    # Every upsert below stamps modified = NOW(), so rows older than this were
+    # not recomputed, by this run or by a concurrent refresh_dirty().
+    started = frappe.db.sql("SELECT NOW()")[0][0]
+    cells = frappe.db.sql(
+        """
+        SELECT re_interested_in_project, IFNULL(re_assigned_rm, ''),
+            DATE_SUB(DATE(creation), INTERVAL WEEKDAY(creation) DAY)
+        FROM `tabLead`
+        WHERE IFNULL(re_interested_in_project, '') != ''
+        UNION
+        SELECT re_project, IFNULL(re_assigned_rm, ''),
+            DATE_SUB(DATE(creation), INTERVAL WEEKDAY(creation) DAY)
+        FROM `tabOpportunity`
+        WHERE IFNULL(re_project, '') != ''
+        UNION
+        SELECT project, IFNULL(assigned_rm, ''),
+            DATE_SUB(booking_date, INTERVAL WEEKDAY(booking_date) DAY)
+        FROM `tabRE Booking`
+        WHERE docstatus = 1 AND booking_date IS NOT NULL
+        """
+    )
+    for i, (project, rm, week) in enumerate(cells, start=1):
+        refresh_cell(project, rm, week)
+        if i % REFRESH_BATCH == 0:
+            frappe.db.commit()
+    frappe.db.sql("DELETE FROM `tabRE Funnel Fact` WHERE modified < %s", started)
+    frappe.db.commit()
+
+
+def refresh_cell(project, rm, week):
+    """Recompute one (project, rm, week) row; rows with nothing in them are dropped."""
+    week = week_start(week)
+    values = {
+        "name": hashlib.md5(_SEP.join((project, cstr(rm), str(week))).encode()).hexdigest(),
+        "project": project,
+        "rm": cstr(rm),
+        "week": week,
+        "week_end": add_days(week, 7),
+        "user": frappe.session.user,
+    }
+    frappe.db.sql(
+        """
+        INSERT INTO `tabRE Funnel Fact`
+            (name, creation, modified, owner, modified_by, docstatus, project, rm, week,
+             leads, cohort_opportunities, cohort_bookings, cohort_completed,
+             opportunities, bookings, booking_value)
+        SELECT
+            %(name)s, NOW(), NOW(), %(user)s, %(user)s, 0, %(project)s, NULLIF(%(rm)s, ''), %(week)s,
+            c.leads, IFNULL(c.opportunities, 0), IFNULL(c.bookings, 0), IFNULL(c.completed, 0),
+            o.opportunities, b.bookings, b.booking_value
+        FROM (
+            SELECT
+                COUNT(*) AS leads,
+                SUM(EXISTS (
+                    SELECT 1 FROM `tabOpportunity` opp
+                    WHERE opp.opportunity_from = 'Lead' AND opp.party_name = l.name
+                )) AS opportunities,
+                SUM(EXISTS (
+                    SELECT 1 FROM `tabCustomer` cu
+                    INNER JOIN `tabRE Booking` bk ON bk.customer = cu.name
+                    WHERE cu.lead_name = l.name AND bk.project = l.re_interested_in_project
+                        AND bk.docstatus = 1 AND bk.booking_status != 'Cancelled'
+                )) AS bookings,
+                SUM(EXISTS (
+                    SELECT 1 FROM `tabCustomer` cu
+                    INNER JOIN `tabRE Booking` bk ON bk.customer = cu.name
+                    WHERE cu.lead_name = l.name AND bk.project = l.re_interested_in_project
+                        AND bk.docstatus = 1 AND bk.booking_status = 'Completed'
+                )) AS completed
+            FROM `tabLead` l
+            WHERE l.re_interested_in_project = %(project)s
+                AND IFNULL(l.re_assigned_rm, '') = %(rm)s
+                AND l.creation >= %(week)s AND l.creation < %(week_end)s
+        ) c,
+        (
+            SELECT COUNT(*) AS opportunities
+            FROM `tabOpportunity`
+            WHERE re_project = %(project)s
+                AND IFNULL(re_assigned_rm, '') = %(rm)s
+                AND creation >= %(week)s AND creation < %(week_end)s
+        ) o,
+        (
+            SELECT COUNT(*) AS bookings, IFNULL(SUM(final_value), 0) AS booking_value
+            FROM `tabRE Booking`
+            WHERE project = %(project)s
+                AND IFNULL(assigned_rm, '') = %(rm)s
+                AND docstatus = 1 AND booking_status != 'Cancelled'
+                AND booking_date >= %(week)s AND booking_date < %(week_end)s
+        ) b
+        ON DUPLICATE KEY UPDATE
+            leads = VALUES(leads),
+            cohort_opportunities = VALUES(cohort_opportunities),
+            cohort_bookings = VALUES(cohort_bookings),
+            cohort_completed = VALUES(cohort_completed),
+            opportunities = VALUES(opportunities),
+            bookings = VALUES(bookings),
+            booking_value = VALUES(booking_value),
+            modified = NOW()
+        """,
+        values,
+    )
+    frappe.db.sql(
+        """
+        DELETE FROM `tabRE Funnel Fact`
+        WHERE name = %(name)s AND leads = 0 AND opportunities = 0 AND bookings = 0
+        """,
+        values,
+    )
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _lead_cell(lead):
+    return (lead.re_interested_in_project, cstr(lead.re_assigned_rm), week_start(lead.creation))
+
+
+def _opportunity_cell(opportunity):
+    return (opportunity.re_project, cstr(opportunity.re_assigned_rm), week_start(opportunity.creation))
@@ -0,0 +1,223 @@
+"""
+RE Interest Accrual — late-payment interest ledger.
+
+One row per schedule row and period at a constant balance and rate:
+the daily run extends the open row (to_date, days, amount) while the
+balance and the plan's rate are unchanged, and starts a new row when either
+changes or the open row has been posted. Interest is simple, on the
+overdue balance, at the Payment Plan Template's annual rate after its grace
+days:
+
+    amount = balance × rate / 100 / 365 × days
+
+accrue_interest() runs after mark_overdue_schedules; post_journal_entries()
+posts unposted rows as Journal Entries, JOURNAL_ENTRY_CHUNK rows at a time.
+Both are enabled in RE CRM Settings.
+"""
+
+import frappe
+from frappe import _
+from frappe.model.document import Document
+from frappe.utils import flt, getdate, today
+
+JOURNAL_ENTRY_CHUNK = 200
+
+# Overdue schedule rows on plans that charge interest, past their grace
+# days and not yet accrued up to %(accrual_date)s.
+_JOINS = """
+    INNER JOIN `tabRE Booking` b ON b.name = ps.parent
+    INNER JOIN `tabRE Payment Plan Template` t ON t.name = b.payment_plan_type
+"""
+_ELIGIBLE = """
+    b.docstatus = 1
+        AND ps.status = 'Overdue'
+        AND ps.balance > 0
+        AND t.interest_rate > 0
+        AND DATE_ADD(ps.due_date, INTERVAL IFNULL(t.interest_grace_days, 0) DAY) < %(accrual_date)s
+        AND IFNULL(ps.interest_accrued_to, '0001-01-01') < %(accrual_date)s
+"""
+
+
+class REInterestAccrual(Document):
+    pass
+
+
+def on_doctype_update():
+    # Unposted rows, scanned by post_journal_entries().
+    frappe.db.add_index("RE Interest Accrual", ["journal_entry", "to_date"])
+
+
+def accrue_interest(accrual_date=None):
+    """
+    Accrue interest up to `accrual_date` (default today) in three set-based
+    statements. Idempotent: rows already accrued to that date are skipped,
+    and missed days are caught up on the next run.
+    """
+    values = {"accrual_date": getdate(accrual_date or today()), "user": frappe.session.user}
+
+    # 1. Extend open periods whose balance and rate are unchanged.
+    frappe.db.sql(
+        """
+        UPDATE `tabRE Interest Accrual` a
+        INNER JOIN `tabRE Booking Payment Schedule` ps
+            ON ps.name = a.schedule_row AND ps.interest_accrued_to = a.to_date
+        {joins}
+        SET
+            a.to_date = %(accrual_date)s,
+            a.days = DATEDIFF(%(accrual_date)s, a.from_date) + 1,
+            a.amount = ROUND(a.balance * a.annual_rate / 36500 * (DATEDIFF(%(accrual_date)s, a.from_date) + 1), 2),
+            a.modified = NOW(),
+            a.modified_by = %(user)s
+        WHERE {eligible}
+            AND IFNULL(a.journal_entry, '') = ''
+            AND a.balance = ps.balance
+            AND a.annual_rate = t.interest_rate
+        """.format(joins=_JOINS, eligible=_ELIGIBLE),
+        values,
+    )
+
+    # 2. Open a new period everywhere else.
+    frappe.db.sql(
+        """
+        INSERT INTO `tabRE Interest Accrual`
+            (name, creation, modified, owner, modified_by, docstatus,
+             booking, schedule_row, project, customer,
+             from_date, to_date, days, balance, annual_rate, amount)
+        SELECT
+            MD5(CONCAT_WS('|', n.schedule_row, %(accrual_date)s)),
+            NOW(), NOW(), %(user)s, %(user)s, 0,
+            n.booking, n.schedule_row, n.project, n.customer,
+            n.from_date, %(accrual_date)s, DATEDIFF(%(accrual_date)s, n.from_date) + 1,
+            n.balance, n.annual_rate,
+            ROUND(n.balance * n.annual_rate / 36500 * (DATEDIFF(%(accrual_date)s, n.from_date) + 1), 2)
+        FROM (
+            SELECT
+                b.name AS booking,
+                ps.name AS schedule_row,
+                b.project,
+                b.customer,
+                ps.balance,
+                t.interest_rate AS annual_rate,
+                GREATEST(
+                    DATE_ADD(IFNULL(ps.interest_accrued_to, '0001-01-01'), INTERVAL 1 DAY),
+                    DATE_ADD(ps.due_date, INTERVAL IFNULL(t.interest_grace_days, 0) + 1 DAY)
+                ) AS from_date
+            FROM `tabRE Booking Payment Schedule` ps
+            {joins}
+            WHERE {eligible}
+                AND NOT EXISTS (
+                    SELECT 1 FROM `tabRE Interest Accrual` a
+                    WHERE a.schedule_row = ps.name AND a.to_date = %(accrual_date)s
+                )
+        ) n
+        """.format(joins=_JOINS, eligible=_ELIGIBLE),
+        values,
+    )
+
+    # 3. Roll the totals up onto the schedule rows touched today.
+    frappe.db.sql(
+        """
+        UPDATE `tabRE Booking Payment Schedule` ps
+        INNER JOIN (
+            SELECT schedule_row, SUM(amount) AS total
+            FROM `tabRE Interest Accrual`
+            WHERE schedule_row IN (
+                SELECT schedule_row FROM `tabRE Interest Accrual` WHERE to_date = %(accrual_date)s
+            )
+            GROUP BY schedule_row
+        ) x ON x.schedule_row = ps.name
+        SET ps.interest_accrued = x.total, ps.interest_accrued_to = %(accrual_date)s
+        """,
+        values,
+    )
+    frappe.db.commit()
+
+
+def post_journal_entries(posting_date=None):
+    """
+    Post unposted accruals up to `posting_date` (default today): one
+    submitted Journal Entry per JOURNAL_ENTRY_CHUNK rows, debiting each
+    customer's receivable and crediting the interest income account.
+    Each chunk commits on its own; a failed chunk is logged and stops the run.
+    """
+    posting_date = getdate(posting_date or today())
+    settings = frappe.get_cached_doc("RE CRM Settings")
+    company = frappe.db.get_single_value("Global Defaults", "default_company")
+    if not company or not settings.interest_income_account:
+        frappe.log_error(
+            message="Set a default company and the Interest Income Account in RE CRM Settings.",
+            title="RE CRM — Interest Posting Skipped",
+        )
+        return
+
+    receivable = settings.interest_receivable_account or frappe.get_cached_value(
+        "Company", company, "default_receivable_account"
+    )
+    cost_center = frappe.get_cached_value("Company", company, "cost_center")
+
+    while True:
+        rows = frappe.db.sql(
+            """
+            SELECT name, customer, amount
+            FROM `tabRE Interest Accrual`
+            WHERE IFNULL(journal_entry, '') = '' AND to_date <= %s AND amount > 0
+            ORDER BY to_date, name
+            LIMIT %s
+            """,
+            (posting_date, JOURNAL_ENTRY_CHUNK),
+            as_dict=True,
+        )
+        if not rows:
+            return
+
+        try:
+            journal_entry = _make_journal_entry(
+                rows, company, posting_date, receivable, settings.interest_income_account, cost_center
+            )
+            frappe.db.sql(
+                "UPDATE `tabRE Interest Accrual` SET journal_entry = %s WHERE name IN %s",
+                (journal_entry, tuple(r.name for r in rows)),
+            )
+            frappe.db.commit()
+        except Exception:
+            frappe.db.rollback()
+            frappe.log_error(title=_("RE CRM — Interest Posting Failed"))
+            return
+
+
+def _make_journal_entry(rows, company, posting_date, receivable, income_account, cost_center):
+    by_customer = {}
+    for row in rows:
+        by_customer[row.customer] = by_customer.get(row.customer, 0) + flt(row.amount)
+
+    accounts = [
+        {
+            "account": receivable,
+            "party_type": "Customer",
+            "party": customer,
+            "debit_in_account_currency": amount,
+        }
+        for customer, amount in by_customer.items()
+    ]
+    accounts.append(
+        {
+            "account": income_account,
+            "cost_center": cost_center,
+            "credit_in_account_currency": sum(by_customer.values()),
+        }
+    )
+
+    je = frappe.get_doc(
+        {
+            "doctype": "Journal Entry",
+            "voucher_type": "Journal Entry",
+            "company": company,
+            "posting_date": posting_date,
+            "user_remark": _("Late payment interest accrued up to {0}").format(posting_date),
+            "accounts": accounts,
+        }
+    )
+    je.flags.ignore_permissions = True
+    je.insert()
+    je.submit()
+    return je.name
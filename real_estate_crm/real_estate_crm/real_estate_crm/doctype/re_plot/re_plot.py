@@ -3,12 +3,40 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.utils import flt
 
+from real_estate_crm.utils.version_stamps import bump as bump_versions
+
 
 class REPlot(Document):
     def validate(self):
         self._compute_total_value()
         self._validate_status_change()
 
+    def after_insert(self):
+        bump_versions(("plot",), project=self.project)
+
+    def on_update(self):
+        if self.flags.in_insert:
+            return  # after_insert bumps
+
+        # Area, rate, facing and the project itself feed the plot sections too.
+        previous = self.get_doc_before_save()
+        bump_versions(("plot",), projects=(self.project, previous.project if previous else None))
+
+        # Admin overrides from the form; booking-driven changes publish from RE Booking.
+        if self.has_value_changed("status"):
+            publish_plot_status(
+                self.name,
+                self.project,
+                self.status,
+                previous_status=previous.status if previous else None,
+                booking=self.booking,
+            )
+
+    def on_trash(self):
+        # Nothing has been written yet when on_trash runs; bump once the delete commits.
+        project = self.project
+        frappe.db.after_commit.add(lambda: bump_versions(("plot",), project=project))
+
     def _compute_total_value(self):
         """total_value = plot_area × rate_per_unit (PRD §4.2)"""
         self.total_value = flt(self.plot_area) * flt(self.rate_per_unit)
@@ -39,3 +67,38 @@ class REPlot(Document):
             exc=frappe.PermissionError,
             title=_("Status Change Not Allowed"),
         )
+
+
+def publish_plot_status(plot, project, status, previous_status=None, booking=None, customer=None):
+    """
+    Push a compact plot-status delta to everyone viewing `project` (the
+    RE Project document room, joined by re_project_dashboard.js), and nudge
+    open RE Plot list views. Sent after commit, so a rolled-back booking
+    never announces a change. Also bumps the project's plot version stamp.
+    """
+    bump_versions(("plot",), project=project)
+    frappe.publish_realtime(
+        "re_plot_status",
+        {
+            "plot": plot,
+            "project": project,
+            "status": status,
+            "previous_status": previous_status,
+            "booking": booking,
+            "customer": customer,
+        },
+        doctype="RE Project",
+        docname=project,
+        after_commit=True,
+    )
+    frappe.publish_realtime(
+        "list_update",
+        {"doctype": "RE Plot", "name": plot, "user": frappe.session.user},
+        doctype="RE Plot",
+        after_commit=True,
+    )
+
+
+def on_doctype_update():
+    """Backs the plot availability delta sync (project = X AND modified >= Y)."""
+    frappe.db.add_index("RE Plot", ["project", "modified"])
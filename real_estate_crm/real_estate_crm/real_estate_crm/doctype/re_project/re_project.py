@@ -1,11 +1,18 @@
 import frappe
 from frappe import _
 from frappe.model.document import Document
+from frappe.utils import flt
+
+from real_estate_crm.utils.version_stamps import bump as bump_versions
 
 
 class REProject(Document):
     def validate(self):
         self._validate_dates()
+        self._validate_commission_slabs()
+
+    def on_update(self):
+        bump_versions(("project",), project=self.name)
 
     def _validate_dates(self):
         if self.project_start_date and self.expected_possession_date:
@@ -14,3 +21,19 @@ class REProject(Document):
                     _("Expected Possession Date cannot be before Project Start Date."),
                     title=_("Invalid Date"),
                 )
+
+    def _validate_commission_slabs(self):
+        """Slabs must not overlap; only the last one may be open-ended (To Amount 0)."""
+        slabs = sorted(self.commission_slabs or [], key=lambda s: flt(s.from_amount))
+        for i, slab in enumerate(slabs):
+            if slab.to_amount and flt(slab.to_amount) <= flt(slab.from_amount):
+                frappe.throw(
+                    _("Commission slab row {0}: To Amount must be greater than From Amount.").format(slab.idx),
+                    title=_("Invalid Commission Slab"),
+                )
+            following = slabs[i + 1] if i + 1 < len(slabs) else None
+            if following and (not slab.to_amount or flt(following.from_amount) < flt(slab.to_amount)):
+                frappe.throw(
+                    _("Commission slab rows {0} and {1} overlap.").format(slab.idx, following.idx),
+                    title=_("Invalid Commission Slab"),
+                )
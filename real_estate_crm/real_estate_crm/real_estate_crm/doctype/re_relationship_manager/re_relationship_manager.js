@@ -13,18 +13,7 @@ function load_dashboard(frm) {
 		callback(r) {
 			if (!r.message) return;
 			const stats = r.message;
-
-			const active_rows = (stats.active_bookings || [])
-				.map(
-					(b) =>
-						`<tr>
-							<td>${b.name}</td>
-							<td>${b.project || ""}</td>
-							<td>${b.plot || ""}</td>
-							<td><span class="indicator-pill ${status_color(b.booking_status)}">${b.booking_status}</span></td>
-						</tr>`
-				)
-				.join("");
+			const active_rows = (stats.active_bookings || []).map(active_booking_row).join("");
 
 			const html = `
 				<div class="row" style="margin-bottom:12px">
@@ -42,7 +31,7 @@ function load_dashboard(frm) {
 					</div>
 					<div class="col-sm-3">
 						<div class="stat-box text-center p-3 border rounded">
-							<div class="h3 text-warning">${stats.active_bookings.length}</div>
+							<div class="h3 text-warning">${stats.active_count}</div>
 							<div class="text-muted small">${__("Active Bookings")}</div>
 						</div>
 					</div>
@@ -62,16 +51,46 @@ function load_dashboard(frm) {
 									<th>${__("Plot")}</th>
 									<th>${__("Status")}</th>
 								</tr></thead>
-								<tbody>${active_rows}</tbody>
-							</table>`
+								<tbody class="active-bookings">${active_rows}</tbody>
+							</table>
+							<button class="btn btn-xs btn-default load-more-bookings">${__("Load More")}</button>`
 						: `<p class="text-muted">${__("No active bookings.")}</p>`
 				}
 			`;
-			frm.get_field("dashboard_html").$wrapper.html(html);
+			const $wrapper = frm.get_field("dashboard_html").$wrapper.html(html);
+			setup_load_more(frm, $wrapper, stats.active_bookings.length, stats.active_count);
 		},
 	});
 }
 
+// The stats carry the first page of active bookings; further pages on demand.
+function setup_load_more(frm, $wrapper, loaded, total) {
+	const $button = $wrapper.find(".load-more-bookings").toggle(loaded < total);
+	$button.on("click", () => {
+		frappe.call({
+			method: "get_active_bookings",
+			doc: frm.doc,
+			args: { start: loaded },
+			btn: $button,
+			callback(r) {
+				const rows = r.message || [];
+				$wrapper.find(".active-bookings").append(rows.map(active_booking_row).join(""));
+				loaded += rows.length;
+				$button.toggle(rows.length > 0 && loaded < total);
+			},
+		});
+	});
+}
+
+function active_booking_row(b) {
+	return `<tr>
+		<td>${b.name}</td>
+		<td>${b.project || ""}</td>
+		<td>${b.plot || ""}</td>
+		<td><span class="indicator-pill ${status_color(b.booking_status)}">${b.booking_status}</span></td>
+	</tr>`;
+}
+
 function status_color(status) {
 	const map = {
 		Booked: "blue",
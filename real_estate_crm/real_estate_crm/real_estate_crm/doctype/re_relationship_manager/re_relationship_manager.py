@@ -1,15 +1,40 @@
 import frappe
 from frappe import _
 from frappe.model.document import Document
+from frappe.utils import cint, flt
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.lead_assignment import clear_project_rms
+from real_estate_crm.utils.report_cache import invalidate as invalidate_report_cache
+from real_estate_crm.utils.version_stamps import bump as bump_versions, get_versions
+
+# Dashboard stats: cached per RM and version-stamp version; a new version
+# (or a new day) simply misses, and old entries expire.
+STATS_DOMAINS = ("booking", "payment", "lead")
+STATS_KEY = "re_rm_stats"
+STATS_TTL = 24 * 3600
+ACTIVE_PAGE_LENGTH = 20
+MAX_PAGE_LENGTH = 100
 
-class RERelationshipManager(Document):
-    def before_insert(self):
-        self._auto_generate_rm_code()
 
+class RERelationshipManager(Document):
     def validate(self):
         self._auto_generate_rm_code()
 
+    def on_update(self):
+        invalidate_report_cache()
+        # Projects dropped from the table must go stale too.
+        before = self.get_doc_before_save()
+        projects = {row.project for row in self.assigned_projects or []}
+        if before:
+            projects |= {row.project for row in before.assigned_projects or []}
+        bump_versions(("rm",), projects=projects)
+        clear_project_rms()
+
+    def on_trash(self):
+        # Otherwise pick_rm keeps handing out the deleted RM.
+        clear_project_rms()
+
     def _auto_generate_rm_code(self):
         """
         Auto-generate rm_code from name initials if the user left it blank.
@@ -18,45 +43,110 @@ class RERelationshipManager(Document):
         if self.rm_code:
             return
 
-        words = (self.rm_name or "").split()
-        initials = "".join(w[0].upper() for w in words if w)
-        if not initials:
-            return
-
-        code = initials
-        counter = 1
-        # Exclude self when checking uniqueness on subsequent saves
-        while frappe.db.exists(
-            "RE Relationship Manager", {"rm_code": code, "name": ("!=", self.name or "")}
-        ):
-            code = f"{initials}{counter:02d}"
-            counter += 1
-
-        self.rm_code = code
+        prefix = rm_code_prefix(self.rm_name)
+        if prefix:
+            # Exclude self when checking uniqueness on subsequent saves
+            self.rm_code = allocate_rm_codes([prefix], exclude=self.name)[0]
 
     @frappe.whitelist()
+    @instrument()
     def get_performance_stats(self):
         """
         Returns stats rendered in the dashboard section (PRD §6.1).
-        Called from JavaScript on form refresh.
+        Called from JavaScript on form refresh. Cached per RM until one of its
+        bookings, payments or leads changes (utils/version_stamps.py).
         """
-        leads = frappe.db.count("Lead", {"re_assigned_rm": self.name})
-        bookings = frappe.db.get_all(
-            "RE Booking",
-            filters={"assigned_rm": self.name},
-            fields=["name", "booking_status", "final_value", "plot", "project"],
-        )
-        total_revenue = sum(b.final_value or 0 for b in bookings if b.booking_status != "Cancelled")
-        active_bookings = [
-            b for b in bookings if b.booking_status not in ("Completed", "Cancelled")
-        ]
-        closed_bookings = len(
-            [b for b in bookings if b.booking_status == "Completed"]
+        version = get_versions({"stats": STATS_DOMAINS}, rm=self.name)["stats"]
+        if not version:
+            return self._compute_performance_stats()
+
+        key = f"{STATS_KEY}:{self.name}:{version}"
+        stats = frappe.cache().get_value(key)
+        if stats is None:
+            stats = self._compute_performance_stats()
+            frappe.cache().set_value(key, stats, expires_in_sec=STATS_TTL)
+        return stats
+
+    @frappe.whitelist()
+    def get_active_bookings(self, start=0, page_length=ACTIVE_PAGE_LENGTH):
+        """One page of the RM's open bookings, newest first."""
+        return frappe.db.sql(
+            """
+            SELECT name, booking_status, final_value, plot, project
+            FROM `tabRE Booking`
+            WHERE assigned_rm = %(rm)s AND booking_status NOT IN ('Completed', 'Cancelled')
+            ORDER BY booking_date DESC, name DESC
+            LIMIT %(start)s, %(page_length)s
+            """,
+            {
+                "rm": self.name,
+                "start": cint(start),
+                "page_length": min(cint(page_length) or ACTIVE_PAGE_LENGTH, MAX_PAGE_LENGTH),
+            },
+            as_dict=True,
         )
 
+    def _compute_performance_stats(self):
+        by_status = frappe.db.sql(
+            """
+            SELECT booking_status, COUNT(*) AS bookings, IFNULL(SUM(final_value), 0) AS revenue
+            FROM `tabRE Booking`
+            WHERE assigned_rm = %s
+            GROUP BY booking_status
+            """,
+            self.name,
+            as_dict=True,
+        )
         return {
-            "leads": leads,
-            "closed_bookings": closed_bookings,
-            "total_revenue": total_revenue,
-            "active_bookings": active_bookings,
+            "leads": frappe.db.count("Lead", {"re_assigned_rm": self.name}),
+            "closed_bookings": sum(r.bookings for r in by_status if r.booking_status == "Completed"),
+            "total_revenue": sum(flt(r.revenue) for r in by_status if r.booking_status != "Cancelled"),
+            "active_count": sum(
+                r.bookings for r in by_status if r.booking_status not in ("Completed", "Cancelled")
+            ),
+            "active_bookings": self.get_active_bookings(),
         }
+
+
+def rm_code_prefix(rm_name):
+    """Name initials, upper-cased: "Rahul Sharma" → "RS"."""
+    return "".join(w[0].upper() for w in (rm_name or "").split())
+
+
+def allocate_rm_codes(prefixes, exclude=None, reserved=()):
+    """
+    One free code per entry of `prefixes`, in order, from each prefix's
+    sequence RS, RS01, RS02 … Codes in use (and `reserved` ones) are read
+    with one query per distinct prefix; the rest is done in memory, so a
+    batch sharing initials costs the same as a single RM.
+    """
+    taken = {code.upper() for code in reserved}
+    for prefix in set(prefixes):
+        taken.update(_codes_in_use(prefix, exclude))
+
+    codes, next_counter = [], {}
+    for prefix in prefixes:
+        counter = next_counter.get(prefix, 0)
+        code = f"{prefix}{counter:02d}" if counter else prefix
+        while code.upper() in taken:
+            counter += 1
+            code = f"{prefix}{counter:02d}"
+        next_counter[prefix] = counter + 1
+        taken.add(code.upper())
+        codes.append(code)
+    return codes
+
+
+def _codes_in_use(prefix, exclude=None):
+    """Upper-cased rm_codes starting with `prefix` (a range scan on the unique index)."""
+    pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    return {
+        code.upper()
+        for (code,) in frappe.db.sql(
+            """
+            SELECT rm_code FROM `tabRE Relationship Manager`
+            WHERE rm_code LIKE %(pattern)s AND name != %(exclude)s
+            """,
+            {"pattern": pattern, "exclude": exclude or ""},
+        )
+    }
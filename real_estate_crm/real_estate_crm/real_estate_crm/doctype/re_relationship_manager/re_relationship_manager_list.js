@@ -0,0 +1,73 @@
+// RE Relationship Manager — list view
+// Bulk onboarding from an HR export: codes are allocated for the whole file
+// and RMs inserted in one pass; every row is listed in the result.
+
+frappe.listview_settings["RE Relationship Manager"] = {
+	onload(listview) {
+		if (!frappe.user.has_role(["RE Admin", "System Manager"])) return;
+
+		listview.page.add_inner_button(__("Bulk Import"), () => open_import_dialog(listview));
+	},
+};
+
+function open_import_dialog(listview) {
+	const dialog = new frappe.ui.Dialog({
+		title: __("Bulk RM Import"),
+		fields: [
+			{
+				fieldname: "file_url",
+				fieldtype: "Attach",
+				label: __("CSV / XLSX File"),
+				reqd: 1,
+				description: __(
+					"Columns: Name, RM Code, Mobile, Email, Designation, Joining Date, Employee, Status, Projects (comma-separated). RM Code is generated from the initials when blank."
+				),
+			},
+		],
+		primary_action_label: __("Import"),
+		primary_action(values) {
+			dialog.hide();
+			frappe.call({
+				method: "real_estate_crm.api.re_rm_import.import_rms",
+				args: values,
+				freeze: true,
+				freeze_message: __("Importing RMs..."),
+				callback(r) {
+					if (!r.message) return;
+					show_result(r.message);
+					listview.refresh();
+				},
+			});
+		},
+	});
+	dialog.show();
+}
+
+function show_result(result) {
+	const rows = result.rows
+		.map(
+			(row) => `<tr>
+				<td>${row.row}</td>
+				<td>${frappe.utils.escape_html(row.rm_name || "")}</td>
+				<td>${frappe.utils.escape_html(row.rm_code || "")}</td>
+				<td>${__(row.action)}</td>
+				<td>${frappe.utils.escape_html(row.note || "")}</td>
+			</tr>`
+		)
+		.join("");
+
+	frappe.msgprint({
+		title: __("RM Import Finished"),
+		indicator: result.Invalid ? "orange" : "green",
+		wide: true,
+		message: `
+			<p>${__("{0} inserted, {1} skipped, {2} invalid.", [result.Inserted, result.Skipped, result.Invalid])}</p>
+			<table class="table table-bordered table-condensed">
+				<thead><tr>
+					<th>${__("Row")}</th><th>${__("Name")}</th><th>${__("RM Code")}</th>
+					<th>${__("Action")}</th><th>${__("Note")}</th>
+				</tr></thead>
+				<tbody>${rows}</tbody>
+			</table>`,
+	});
+}
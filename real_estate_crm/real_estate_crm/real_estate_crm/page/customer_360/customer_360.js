@@ -42,12 +42,15 @@ function load_customer_data(page, customer) {
         '<div class="text-center" style="padding:60px 0;"><div class="spinner-border text-primary" role="status"></div><p class="text-muted mt-3">Loading customer data&hellip;</p></div>'
     );
 
-    frappe.call({
+    // A cached copy renders at once; the server answers "not modified"
+    // unless something about the customer changed.
+    real_estate_crm.version_cache.call({
         method: "real_estate_crm.real_estate_crm.page.customer_360.customer_360.get_customer_360_data",
         args: { customer: customer },
-        callback: function (r) {
-            if (r.message) {
-                render_360(page, r.message, customer);
+        cache_key: "customer_360:" + customer,
+        render: function (data) {
+            if (data) {
+                render_360(page, data, customer);
             }
         },
         error: function () {
@@ -7,13 +7,33 @@ import frappe
 from frappe import _
 from frappe.utils import flt, getdate, nowdate, date_diff
 
+from real_estate_crm.perf.instrumentation import instrument, section
+from real_estate_crm.utils.replica import use_replica
+from real_estate_crm.utils.version_stamps import get_versions, respond
+
+# Version-stamp domains the page reads (see utils/version_stamps.py).
+VERSION_DOMAINS = ("customer", "booking", "payment")
+
 
 @frappe.whitelist()
-def get_customer_360_data(customer):
-    """Return all Customer 360 data for the given customer."""
+@use_replica()
+@instrument()
+def get_customer_360_data(customer, client_version=None):
+    """
+    Return all Customer 360 data for the given customer. With `client_version`
+    the payload is wrapped as {"version", "data"}, or {"version", "not_modified": 1}
+    when nothing about the customer changed since.
+    """
     if not customer:
         frappe.throw(_("Please select a customer."))
 
+    if client_version is None:
+        return _build_customer_360(customer)
+    version = get_versions({"customer_360": VERSION_DOMAINS}, customer=customer)["customer_360"]
+    return respond(version, client_version, lambda: _build_customer_360(customer))
+
+
+def _build_customer_360(customer):
     data = {
         "customer_info": _get_customer_info(customer),
         "bookings": _get_bookings(customer),
@@ -33,6 +53,7 @@ def get_customer_360_data(customer):
     return data
 
 
+@section()
 def _get_customer_info(customer):
     """Fetch customer master info, primary contact, address and assigned RM."""
     cust = frappe.get_doc("Customer", customer)
@@ -84,6 +105,7 @@ def _get_customer_info(customer):
     return info
 
 
+@section()
 def _get_bookings(customer):
     """Return all RE Bookings for the customer."""
     return frappe.get_all(
@@ -103,6 +125,7 @@ def _get_bookings(customer):
     )
 
 
+@section()
 def _get_payment_details(booking_name):
     """Calculate payment summary and overdue stages for a booking."""
     schedules = frappe.get_all(
@@ -174,6 +197,7 @@ def _get_payment_details(booking_name):
     return summary, overdue
 
 
+@section()
 def _get_documents(customer):
     """Collect documents from customer and all bookings (RE Document Entry child table)."""
     documents = []
@@ -212,6 +236,7 @@ def _get_documents(customer):
     return documents
 
 
+@section()
 def _get_activity(customer):
     """Return recent comments and communications for the customer."""
     comments = frappe.get_all(
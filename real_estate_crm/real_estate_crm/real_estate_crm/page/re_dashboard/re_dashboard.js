@@ -14,53 +14,78 @@ frappe.pages["re-dashboard"].on_page_load = function (wrapper) {
 
 frappe.pages["re-dashboard"].on_page_show = function (wrapper) {
 	let page = wrapper.page;
-	load_dashboard(page);
+	frappe.require("re_dashboard.bundle.css", () => load_dashboard(page));
 };
 
-function load_dashboard(page) {
-	page.$content.html(
-		'<div class="re-dash-loading"><div class="spinner-border text-primary"></div><p class="text-muted mt-3">Loading dashboard&hellip;</p></div>'
-	);
+// Section → renderer. Each section is fetched on its own request and
+// rendered as soon as it arrives; requests go out in this order (KPIs first).
+const RE_DASHBOARD_SECTIONS = {
+	kpi_cards: (data) => render_kpi_cards(data),
+	project_summary: (data) => render_project_summary(data),
+	monthly_collections: (data) => render_collections_chart(data),
+	overdue_payments: (data) => render_overdue_payments(data),
+	upcoming_dues: (data) => render_upcoming_dues(data),
+	recent_bookings: (data) => render_recent_bookings(data),
+};
 
-	frappe.call({
-		method: "real_estate_crm.real_estate_crm.page.re_dashboard.re_dashboard.get_dashboard_data",
-		callback: function (r) {
-			if (r.message) {
-				render_dashboard(page, r.message);
-			}
-		},
-		error: function () {
-			page.$content.html(
-				'<div class="re-dash-loading"><i class="fa fa-exclamation-triangle text-danger fa-2x"></i><p class="mt-3 text-muted">Failed to load dashboard data.</p></div>'
-			);
-		},
+function load_dashboard(page) {
+	page.$content.html(render_dashboard_skeleton());
+
+	// Cached sections render at once; the server only recomputes stale ones.
+	Object.keys(RE_DASHBOARD_SECTIONS).forEach((section) => {
+		real_estate_crm.version_cache.call({
+			method: "real_estate_crm.real_estate_crm.page.re_dashboard.re_dashboard.get_dashboard_section",
+			args: { section: section },
+			cache_key: "re_dashboard:" + section,
+			render: (data) => render_dashboard_section(page, section, data),
+			error: function () {
+				page.$content
+					.find(`[data-section="${section}"]`)
+					.html(
+						'<div class="re-dash-card"><div class="re-dash-card-body"><p class="text-muted text-center"><i class="fa fa-exclamation-triangle text-danger"></i> Failed to load this section.</p></div></div>'
+					);
+			},
+		});
 	});
+
+	if (frappe.user.has_role(RE_FORECAST_ROLES)) {
+		load_cash_flow_forecast(page);
+	}
 }
 
 /* ================================================================== */
 /*  MASTER RENDER                                                      */
 /* ================================================================== */
-function render_dashboard(page, data) {
-	page.$content.empty();
+function render_dashboard_skeleton() {
+	let slot = (section) =>
+		`<div data-section="${section}"><div class="re-dash-loading" style="padding:24px 0;"><div class="spinner-border spinner-border-sm text-muted"></div></div></div>`;
 
 	let html = '<div class="re-dash-container">';
 	html += render_greeting();
-	html += render_kpi_cards(data.kpi_cards);
-	html += render_project_summary(data.project_summary);
-	html += render_collections_chart(data.monthly_collections);
+	html += slot("kpi_cards");
+	html += slot("project_summary");
+	html += slot("monthly_collections");
 
 	html += '<div class="re-dash-row">';
-	html += '<div class="re-dash-col-6">' + render_overdue_payments(data.overdue_payments) + "</div>";
-	html += '<div class="re-dash-col-6">' + render_upcoming_dues(data.upcoming_dues) + "</div>";
+	html += '<div class="re-dash-col-6">' + slot("overdue_payments") + "</div>";
+	html += '<div class="re-dash-col-6">' + slot("upcoming_dues") + "</div>";
 	html += "</div>";
 
-	html += render_recent_bookings(data.recent_bookings);
+	if (frappe.user.has_role(RE_FORECAST_ROLES)) {
+		html += render_forecast_card();
+	}
+
+	html += slot("recent_bookings");
 	html += "</div>";
-	page.$content.html(html);
+	return html;
+}
+
+function render_dashboard_section(page, section, data) {
+	page.$content.find(`[data-section="${section}"]`).html(RE_DASHBOARD_SECTIONS[section](data));
 
-	setTimeout(() => {
-		draw_collections_bar(data.monthly_collections);
-	}, 100);
+	if (section === "monthly_collections") {
+		draw_collections_bar(data);
+	}
 }
 
 /* ================================================================== */
@@ -193,6 +218,82 @@ function draw_collections_bar(collections) {
 	});
 }
 
+/* ================================================================== */
+/*  CASH-FLOW FORECAST                                                 */
+/* ================================================================== */
+const RE_FORECAST_ROLES = ["RE Accounts", "RE Admin", "RE Sales Manager", "System Manager"];
+
+function render_forecast_card() {
+	return `
+	<div class="re-dash-card" data-section="cash_flow_forecast">
+		<div class="re-dash-card-header">
+			<h6>Expected Collections (24 months)</h6>
+			<select class="form-control input-xs re-forecast-delay" style="width:auto;">
+				<option value="0">As scheduled</option>
+				<option value="3">Possession +3 months</option>
+				<option value="6">Possession +6 months</option>
+				<option value="12">Possession +12 months</option>
+			</select>
+		</div>
+		<div class="re-dash-card-body">
+			<div id="re-forecast-chart" style="height:240px;"></div>
+			<p class="text-muted re-forecast-note" style="font-size:0.8em;"></p>
+		</div>
+	</div>`;
+}
+
+function load_cash_flow_forecast(page) {
+	let $card = page.$content.find('[data-section="cash_flow_forecast"]');
+	let delay = $card.find(".re-forecast-delay").val();
+
+	$card.find(".re-forecast-delay").off("change").on("change", () => load_cash_flow_forecast(page));
+
+	frappe.call({
+		method: "real_estate_crm.api.re_cash_flow_forecast.get_cash_flow_forecast",
+		args: { scenario: { possession_delay_months: cint(delay) } },
+		callback: function (r) {
+			if (r.message) {
+				draw_forecast_chart(r.message);
+				$card
+					.find(".re-forecast-note")
+					.text(
+						`Includes ${format_compact_currency(r.message.past_due)} past due (shown in the first month); ` +
+							`${format_compact_currency(r.message.beyond_horizon)} falls due after the horizon.`
+					);
+			}
+		},
+		error: function () {
+			$("#re-forecast-chart").html(
+				'<p class="text-muted text-center" style="padding-top:80px;"><i class="fa fa-exclamation-triangle text-danger"></i> Failed to load the forecast.</p>'
+			);
+		},
+	});
+}
+
+function draw_forecast_chart(forecast) {
+	let datasets = [{ name: "Expected", values: forecast.total }];
+	if (forecast.baseline_total) {
+		datasets.unshift({ name: "As scheduled", values: forecast.baseline_total });
+	}
+
+	new frappe.Chart("#re-forecast-chart", {
+		data: { labels: forecast.months.map(format_month_label), datasets: datasets },
+		type: "line",
+		height: 220,
+		colors: forecast.baseline_total ? ["#98a1b3", "#2490ef"] : ["#2490ef"],
+		lineOptions: { regionFill: 1, hideDots: 1 },
+		tooltipOptions: {
+			formatTooltipY: (d) => format_compact_currency(d),
+		},
+	});
+}
+
+function format_month_label(month) {
+	let parts = month.split("-");
+	let monthNames = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
+	return monthNames[parseInt(parts[1]) - 1] + " " + parts[0].slice(2);
+}
+
 /* ================================================================== */
 /*  PROJECT SUMMARY TABLE                                              */
 /* ================================================================== */
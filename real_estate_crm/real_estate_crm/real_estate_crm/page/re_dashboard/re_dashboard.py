@@ -7,22 +7,57 @@ overdue payments, recent bookings, and plot status breakdown.
 
 import frappe
 from frappe import _
-from frappe.utils import nowdate, flt, getdate, add_days
+from frappe.utils import nowdate, flt, getdate, add_days, cint
+
+from real_estate_crm.perf.instrumentation import instrument, section
+from real_estate_crm.utils.parallel import run_sections
+from real_estate_crm.utils.replica import use_replica
+from real_estate_crm.utils.version_stamps import get_versions, respond, respond_sections
+
+
+@frappe.whitelist()
+@use_replica()
+@instrument()
+def get_dashboard_data(parallel=0, client_versions=None):
+    """
+    Batched API — returns all dashboard sections in one call. With
+    `parallel`, sections run concurrently on separate read connections.
+
+    With `client_versions` ({section: version} from a previous call) only
+    stale sections are computed: {"versions", "sections"} or
+    {"versions", "not_modified": 1}.
+    """
+    if client_versions is None:
+        return _compute_sections(SECTIONS, parallel)
+    return respond_sections(
+        get_versions(SECTION_DOMAINS),
+        client_versions,
+        lambda names: _compute_sections({name: SECTIONS[name] for name in names}, parallel),
+    )
 
 
 @frappe.whitelist()
-def get_dashboard_data():
-    """Main API — returns all dashboard sections in one call."""
-    data = {}
-    data["kpi_cards"] = _get_kpi_cards()
-    data["project_summary"] = _get_project_summary()
-    data["monthly_collections"] = _get_monthly_collections()
-    data["recent_bookings"] = _get_recent_bookings()
-    data["overdue_payments"] = _get_overdue_payments()
-    data["upcoming_dues"] = _get_upcoming_dues()
-    return data
+@use_replica()
+@instrument()
+def get_dashboard_section(section, client_version=None):
+    """
+    One section — the page requests these in parallel and renders each as it
+    arrives. Returns {"version", "data"}, or {"version", "not_modified": 1}
+    when `client_version` is still current.
+    """
+    if section not in SECTIONS:
+        frappe.throw(_("Unknown dashboard section: {0}").format(section))
+    version = get_versions({section: SECTION_DOMAINS[section]})[section]
+    return respond(version, client_version, SECTIONS[section])
 
 
+def _compute_sections(sections, parallel):
+    if cint(parallel):
+        return run_sections({name: (fn, ()) for name, fn in sections.items()})
+    return {name: fn() for name, fn in sections.items()}
+
+
+@section()
 def _get_kpi_cards():
     """Top-level KPI numbers — project-focused."""
     total_projects = frappe.db.count("RE Project")
@@ -88,6 +123,7 @@ def _get_kpi_cards():
     }
 
 
+@section()
 def _get_plot_status_breakdown():
     """Plot counts grouped by status — for the donut chart."""
     result = frappe.db.sql(
@@ -102,6 +138,7 @@ def _get_plot_status_breakdown():
     return result or []
 
 
+@section()
 def _get_recent_bookings(limit=10):
     """Most recent bookings for the activity feed."""
     bookings = frappe.db.sql(
@@ -120,6 +157,7 @@ def _get_recent_bookings(limit=10):
     return bookings or []
 
 
+@section()
 def _get_overdue_payments(limit=10):
     """Top overdue payment stages — sorted by days overdue."""
     today = nowdate()
@@ -148,6 +186,7 @@ def _get_overdue_payments(limit=10):
     return overdues or []
 
 
+@section()
 def _get_upcoming_dues(limit=5):
     """Payment stages due in the next 7 days."""
     today = nowdate()
@@ -176,6 +215,7 @@ def _get_upcoming_dues(limit=5):
     return upcoming or []
 
 
+@section()
 def _get_project_summary():
     """Per-project plot breakdown with financial summary."""
     summary = frappe.db.sql(
@@ -219,6 +259,7 @@ def _get_project_summary():
     return summary or []
 
 
+@section()
 def _get_monthly_collections():
     """Last 6 months of payment collections for the bar chart."""
     data = frappe.db.sql(
@@ -238,3 +279,24 @@ def _get_monthly_collections():
         as_dict=True,
     )
     return data or []
+
+
+# Section name → builder, in render order (KPIs first).
+SECTIONS = {
+    "kpi_cards": _get_kpi_cards,
+    "project_summary": _get_project_summary,
+    "monthly_collections": _get_monthly_collections,
+    "recent_bookings": _get_recent_bookings,
+    "overdue_payments": _get_overdue_payments,
+    "upcoming_dues": _get_upcoming_dues,
+}
+
+# Version-stamp domains each section reads (see utils/version_stamps.py).
+SECTION_DOMAINS = {
+    "kpi_cards": ("project", "booking", "payment", "plot"),
+    "project_summary": ("project", "booking", "payment", "plot"),
+    "monthly_collections": ("payment",),
+    "recent_bookings": ("booking",),
+    "overdue_payments": ("booking", "payment"),
+    "upcoming_dues": ("booking", "payment"),
+}
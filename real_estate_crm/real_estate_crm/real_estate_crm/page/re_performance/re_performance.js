@@ -0,0 +1,195 @@
+frappe.pages["re-performance"].on_page_load = function (wrapper) {
+	var page = frappe.ui.make_app_page({
+		parent: wrapper,
+		title: "RE Performance",
+		single_column: true,
+	});
+
+	page.main.addClass("re-dashboard-page");
+	$('<div class="re-dashboard-content"></div>').appendTo(page.main);
+	page.$content = page.main.find(".re-dashboard-content");
+
+	page.set_primary_action("Refresh", () => load_performance(page), "refresh");
+	page.set_secondary_action("Clear", () => {
+		frappe.confirm("Clear all recorded calls?", () => {
+			frappe.call({
+				method: "real_estate_crm.real_estate_crm.page.re_performance.re_performance.clear_performance_data",
+				callback: () => load_performance(page),
+			});
+		});
+	});
+};
+
+frappe.pages["re-performance"].on_page_show = function (wrapper) {
+	frappe.require("re_dashboard.bundle.css", () => load_performance(wrapper.page));
+};
+
+function load_performance(page) {
+	page.$content.html(
+		'<div class="re-dash-loading"><div class="spinner-border text-primary"></div><p class="text-muted mt-3">Loading performance data&hellip;</p></div>'
+	);
+
+	frappe.call({
+		method: "real_estate_crm.real_estate_crm.page.re_performance.re_performance.get_performance_data",
+		callback: function (r) {
+			if (r.message) {
+				render_performance(page, r.message);
+			}
+		},
+		error: function () {
+			page.$content.html(
+				'<div class="re-dash-loading"><i class="fa fa-exclamation-triangle text-danger fa-2x"></i><p class="mt-3 text-muted">Failed to load performance data.</p></div>'
+			);
+		},
+	});
+}
+
+/* ================================================================== */
+/*  MASTER RENDER                                                      */
+/* ================================================================== */
+function render_performance(page, data) {
+	let html = '<div class="re-dash-container">';
+	html += `
+	<div class="re-dash-greeting">
+		<h3>Endpoint Performance</h3>
+		<p class="text-muted">Based on the last ${data.sample_size} instrumented calls.</p>
+	</div>`;
+	html += render_endpoint_table(data.endpoints);
+	html += render_slowest_calls(data.slowest_calls);
+	html += "</div>";
+	page.$content.html(html);
+
+	page.$content.find(".re-perf-endpoint").on("click", function () {
+		$(this).closest("tbody").next(".re-perf-sections").toggle();
+	});
+}
+
+/* ================================================================== */
+/*  ENDPOINT SUMMARY                                                   */
+/* ================================================================== */
+function render_endpoint_table(endpoints) {
+	if (!endpoints || !endpoints.length) {
+		return `
+		<div class="re-dash-card">
+			<div class="re-dash-card-header"><h6>Endpoints</h6></div>
+			<div class="re-dash-card-body"><p class="text-muted text-center">No calls recorded yet.</p></div>
+		</div>`;
+	}
+
+	let rows = endpoints
+		.map((e) => {
+			let sections = (e.sections || [])
+				.map(
+					(s) => `
+				<tr>
+					<td style="padding-left:28px;" class="text-muted">${s.section}</td>
+					<td></td>
+					<td class="text-right">${fmt_ms(s.p50_ms)}</td>
+					<td class="text-right">${fmt_ms(s.p95_ms)}</td>
+					<td></td>
+					<td class="text-right">${s.queries_p50}</td>
+					<td></td>
+				</tr>`
+				)
+				.join("");
+
+			return `
+			<tbody><tr class="re-perf-endpoint" style="cursor:${sections ? "pointer" : "default"};">
+				<td>
+					${sections ? '<i class="fa fa-caret-right text-muted"></i>' : ""}
+					<strong>${e.endpoint}</strong>
+					<span class="re-dash-badge ${e.kind === "report" ? "purple" : "blue"}">${e.kind}</span>
+					${e.errors ? `<span class="re-dash-badge red">${e.errors} errors</span>` : ""}
+				</td>
+				<td class="text-right">${e.calls}</td>
+				<td class="text-right">${fmt_ms(e.p50_ms)}</td>
+				<td class="text-right">${fmt_ms(e.p95_ms)}</td>
+				<td class="text-right">${fmt_ms(e.db_p50_ms)}</td>
+				<td class="text-right">${e.queries_p50}</td>
+				<td class="text-right">${e.rows_p50}</td>
+			</tr></tbody>
+			<tbody class="re-perf-sections" style="display:none;">${sections}</tbody>`;
+		})
+		.join("");
+
+	return `
+	<div class="re-dash-card">
+		<div class="re-dash-card-header">
+			<h6>Endpoints</h6>
+			<span class="text-muted" style="font-size:0.8em;">Click a row for its section breakdown</span>
+		</div>
+		<div class="re-dash-card-body">
+			<div class="table-responsive">
+				<table class="re-dash-table">
+					<thead>
+						<tr>
+							<th>Endpoint</th>
+							<th class="text-right">Calls</th>
+							<th class="text-right">p50</th>
+							<th class="text-right">p95</th>
+							<th class="text-right">DB p50</th>
+							<th class="text-right">Queries</th>
+							<th class="text-right">Rows</th>
+						</tr>
+					</thead>
+					${rows}
+				</table>
+			</div>
+		</div>
+	</div>`;
+}
+
+/* ================================================================== */
+/*  SLOWEST RECENT CALLS                                               */
+/* ================================================================== */
+function render_slowest_calls(calls) {
+	if (!calls || !calls.length) {
+		return "";
+	}
+
+	let rows = calls
+		.map(
+			(c) => `
+			<tr>
+				<td>${c.endpoint}</td>
+				<td>${c.user || "-"}</td>
+				<td>${frappe.datetime.str_to_user(c.ts)}</td>
+				<td class="text-right">${fmt_ms(c.wall_ms)}</td>
+				<td class="text-right">${fmt_ms(c.db_ms)}</td>
+				<td class="text-right">${c.queries}</td>
+				<td class="text-right">${c.rows}</td>
+			</tr>`
+		)
+		.join("");
+
+	return `
+	<div class="re-dash-card">
+		<div class="re-dash-card-header"><h6>Slowest Recent Calls</h6></div>
+		<div class="re-dash-card-body">
+			<div class="table-responsive">
+				<table class="re-dash-table">
+					<thead>
+						<tr>
+							<th>Endpoint</th>
+							<th>User</th>
+							<th>When</th>
+							<th class="text-right">Wall</th>
+							<th class="text-right">DB</th>
+							<th class="text-right">Queries</th>
+							<th class="text-right">Rows</th>
+						</tr>
+					</thead>
+					<tbody>${rows}</tbody>
+				</table>
+			</div>
+		</div>
+	</div>`;
+}
+
+/* ================================================================== */
+/*  HELPERS                                                            */
+/* ================================================================== */
+function fmt_ms(value) {
+	if (value === undefined || value === null) return "-";
+	return value >= 1000 ? (value / 1000).toFixed(2) + " s" : Math.round(value) + " ms";
+}
@@ -0,0 +1,70 @@
+"""
+RE Performance — latency and query-count summary for instrumented endpoints.
+
+Reads the Redis ring buffer filled by real_estate_crm.perf.instrumentation.
+"""
+
+import frappe
+
+from real_estate_crm.perf.instrumentation import REGISTRY, clear, get_recent_calls, percentile
+
+
+@frappe.whitelist()
+def get_performance_data(slowest_limit=20):
+    """Per-endpoint p50/p95 with section breakdown, plus the slowest recent calls."""
+    frappe.only_for(["RE Admin", "System Manager"])
+
+    calls = get_recent_calls()
+    by_endpoint = {}
+    for call in calls:
+        by_endpoint.setdefault(call["endpoint"], []).append(call)
+
+    endpoints = [_summarize(name, rows) for name, rows in by_endpoint.items()]
+    endpoints.sort(key=lambda e: e["p95_ms"], reverse=True)
+
+    slowest = sorted(calls, key=lambda c: c["wall_ms"], reverse=True)[: int(slowest_limit)]
+
+    return {
+        "sample_size": len(calls),
+        "endpoints": endpoints,
+        "slowest_calls": slowest,
+        "registered": sorted(name for name, kind in REGISTRY.items() if kind != "section"),
+    }
+
+
+@frappe.whitelist()
+def clear_performance_data():
+    frappe.only_for(["RE Admin", "System Manager"])
+    clear()
+
+
+def _summarize(name, calls):
+    sections = {}
+    for call in calls:
+        for section_name, s in call.get("sections", {}).items():
+            sections.setdefault(section_name, []).append(s)
+
+    return {
+        "endpoint": name,
+        "kind": calls[0].get("kind"),
+        "calls": len(calls),
+        "errors": sum(1 for c in calls if c.get("error")),
+        "p50_ms": percentile([c["wall_ms"] for c in calls], 50),
+        "p95_ms": percentile([c["wall_ms"] for c in calls], 95),
+        "db_p50_ms": percentile([c["db_ms"] for c in calls], 50),
+        "queries_p50": percentile([c["queries"] for c in calls], 50),
+        "rows_p50": percentile([c["rows"] for c in calls], 50),
+        "sections": sorted(
+            (
+                {
+                    "section": section_name,
+                    "p50_ms": percentile([s["wall_ms"] for s in rows], 50),
+                    "p95_ms": percentile([s["wall_ms"] for s in rows], 95),
+                    "queries_p50": percentile([s["queries"] for s in rows], 50),
+                }
+                for section_name, rows in sections.items()
+            ),
+            key=lambda s: s["p95_ms"],
+            reverse=True,
+        ),
+    }
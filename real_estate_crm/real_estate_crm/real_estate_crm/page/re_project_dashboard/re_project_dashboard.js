@@ -14,7 +14,7 @@ frappe.pages["re-project-dashboard"].on_page_load = function (wrapper) {
 
 frappe.pages["re-project-dashboard"].on_page_show = function (wrapper) {
 	let page = wrapper.page;
-	load_project_dashboard(page);
+	frappe.require("re_dashboard.bundle.css", () => load_project_dashboard(page));
 };
 
 function get_project_from_route() {
@@ -31,66 +31,153 @@ function load_project_dashboard(page) {
 		return;
 	}
 
-	page.$content.html(
-		'<div class="re-dash-loading"><div class="spinner-border text-primary"></div><p class="text-muted mt-3">Loading project dashboard&hellip;</p></div>'
-	);
-
-	frappe.call({
-		method: "real_estate_crm.real_estate_crm.page.re_project_dashboard.re_project_dashboard.get_project_dashboard_data",
-		args: { project: project },
-		callback: function (r) {
-			if (r.message) {
-				render_project_dashboard(page, r.message);
-			}
-		},
-		error: function () {
-			page.$content.html(
-				'<div class="re-dash-loading"><i class="fa fa-exclamation-triangle text-danger fa-2x"></i><p class="mt-3 text-muted">Failed to load project dashboard.</p></div>'
-			);
-		},
+	subscribe_plot_status(page, project);
+	page.$content.html(render_project_dashboard_skeleton());
+
+	// Cached sections render at once; the server only recomputes stale ones.
+	Object.keys(RE_PROJECT_DASHBOARD_SECTIONS).forEach((section) => {
+		real_estate_crm.version_cache.call({
+			method: "real_estate_crm.real_estate_crm.page.re_project_dashboard.re_project_dashboard.get_project_dashboard_section",
+			args: { project: project, section: section },
+			cache_key: "re_project_dashboard:" + project + ":" + section,
+			render: (data) => render_project_dashboard_section(page, section, data),
+			error: function () {
+				page.$content
+					.find(`[data-section="${section}"]`)
+					.html(
+						'<div class="re-dash-card"><div class="re-dash-card-body"><p class="text-muted text-center"><i class="fa fa-exclamation-triangle text-danger"></i> Failed to load this section.</p></div></div>'
+					);
+			},
+		});
 	});
 }
 
+// Section → renderer. Each section is fetched on its own request and
+// rendered as soon as it arrives; requests go out in this order (header and
+// KPIs first). Chart sections render their container in the skeleton and
+// draw into it when the data lands.
+const RE_PROJECT_DASHBOARD_SECTIONS = {
+	project_info: (data, page) => {
+		set_project_page_actions(page, data);
+		return render_project_header(data);
+	},
+	kpi_cards: (data) => render_project_kpi_cards(data),
+	plot_status_breakdown: (data, page) => {
+		page.re_plot_breakdown = data || [];
+		draw_plot_donut(data);
+	},
+	monthly_collections: (data) => {
+		draw_collections_bar(data);
+	},
+	plot_inventory: (data) => render_plot_inventory(data),
+	assigned_rms: (data) => render_assigned_rms(data),
+	overdue_payments: (data) => render_overdue_payments(data),
+	upcoming_dues: (data) => render_upcoming_dues(data),
+	recent_bookings: (data) => render_recent_bookings(data),
+};
+
 /* ================================================================== */
 /*  MASTER RENDER                                                      */
 /* ================================================================== */
-function render_project_dashboard(page, data) {
-	let info = data.project_info;
-	page.set_title(info.project_name || info.name);
-
-	page.set_primary_action("Edit Project", () => {
-		frappe._re_edit_project = true;
-		frappe.set_route("Form", "RE Project", info.name);
-	}, "edit");
+function render_project_dashboard_skeleton() {
+	let slot = (section) =>
+		`<div data-section="${section}"><div class="re-dash-loading" style="padding:24px 0;"><div class="spinner-border spinner-border-sm text-muted"></div></div></div>`;
 
-	page.$content.empty();
 	let html = '<div class="re-dash-container">';
 
-	html += render_project_header(info);
-	html += render_project_kpi_cards(data.kpi_cards);
+	html += slot("project_info");
+	html += slot("kpi_cards");
 
 	html += '<div class="re-dash-row">';
 	html += '<div class="re-dash-col-6">' + render_plot_chart() + "</div>";
 	html += '<div class="re-dash-col-6">' + render_collections_chart() + "</div>";
 	html += "</div>";
 
-	html += render_plot_inventory(data.plot_inventory);
-	html += render_assigned_rms(data.assigned_rms);
+	html += slot("plot_inventory");
+	html += slot("assigned_rms");
 
 	html += '<div class="re-dash-row">';
-	html += '<div class="re-dash-col-6">' + render_overdue_payments(data.overdue_payments) + "</div>";
-	html += '<div class="re-dash-col-6">' + render_upcoming_dues(data.upcoming_dues) + "</div>";
+	html += '<div class="re-dash-col-6">' + slot("overdue_payments") + "</div>";
+	html += '<div class="re-dash-col-6">' + slot("upcoming_dues") + "</div>";
 	html += "</div>";
 
-	html += render_recent_bookings(data.recent_bookings);
+	html += slot("recent_bookings");
 
 	html += "</div>";
-	page.$content.html(html);
+	return html;
+}
 
-	setTimeout(() => {
-		draw_plot_donut(data.plot_status_breakdown);
-		draw_collections_bar(data.monthly_collections);
-	}, 100);
+function render_project_dashboard_section(page, section, data) {
+	let html = RE_PROJECT_DASHBOARD_SECTIONS[section](data, page);
+	if (html !== undefined) {
+		page.$content.find(`[data-section="${section}"]`).html(html);
+	}
+}
+
+function set_project_page_actions(page, info) {
+	page.set_title(info.project_name || info.name);
+
+	page.set_primary_action("Edit Project", () => {
+		frappe._re_edit_project = true;
+		frappe.set_route("Form", "RE Project", info.name);
+	}, "edit");
+}
+
+/* ================================================================== */
+/*  REALTIME PLOT STATUS                                               */
+/* ================================================================== */
+const RE_PLOT_STATUS_COLORS = { Available: "green", Booked: "blue", Registered: "purple", "On Hold": "yellow" };
+
+// Joins the RE Project document room; the server publishes "re_plot_status"
+// deltas there on booking submit/cancel and admin overrides. Each delta is
+// patched into the open dashboard instead of reloading it.
+function subscribe_plot_status(page, project) {
+	if (page.re_project && page.re_project !== project) {
+		frappe.realtime.doc_unsubscribe("RE Project", page.re_project);
+	}
+	page.re_project = project;
+	frappe.realtime.doc_subscribe("RE Project", project);
+
+	if (!page.re_plot_status_bound) {
+		page.re_plot_status_bound = true;
+		frappe.realtime.on("re_plot_status", (data) => {
+			if (data.project === page.re_project) {
+				apply_plot_status(page, data);
+			}
+		});
+	}
+}
+
+function apply_plot_status(page, data) {
+	let $row = page.$content.find(`tr[data-plot="${CSS.escape(data.plot)}"]`);
+	$row.find(".re-plot-status").html(
+		`<span class="re-dash-badge ${RE_PLOT_STATUS_COLORS[data.status] || "gray"}">${data.status}</span>`
+	);
+	$row.find(".re-plot-customer").text(data.customer || "-");
+
+	if (!data.previous_status || data.previous_status === data.status) return;
+
+	[
+		[data.previous_status, -1],
+		[data.status, 1],
+	].forEach(([status, delta]) => {
+		let $count = page.$content.find(`[data-plot-count="${status}"]`);
+		if ($count.length) {
+			$count.text(cint($count.text()) + delta);
+		}
+
+		let breakdown = page.re_plot_breakdown || [];
+		let entry = breakdown.find((d) => d.status === status);
+		if (entry) {
+			entry.count = Math.max(cint(entry.count) + delta, 0);
+		} else if (delta > 0) {
+			breakdown.push({ status: status, count: 1 });
+		}
+	});
+
+	if (page.re_plot_breakdown) {
+		draw_plot_donut(page.re_plot_breakdown.filter((d) => d.count > 0));
+	}
 }
 
 /* ================================================================== */
@@ -119,9 +206,9 @@ function render_project_header(info) {
 function render_project_kpi_cards(kpi) {
 	let cards = [
 		{ label: "Total Plots", value: kpi.total_plots, icon: "fa-map-marker", color: "#2490ef" },
-		{ label: "Available", value: kpi.available, icon: "fa-check-circle", color: "#29cd42" },
-		{ label: "Booked", value: kpi.booked, icon: "fa-bookmark", color: "#2490ef" },
-		{ label: "Registered", value: kpi.registered, icon: "fa-file-text", color: "#7c3aed" },
+		{ key: "Available", label: "Available", value: kpi.available, icon: "fa-check-circle", color: "#29cd42" },
+		{ key: "Booked", label: "Booked", value: kpi.booked, icon: "fa-bookmark", color: "#2490ef" },
+		{ key: "Registered", label: "Registered", value: kpi.registered, icon: "fa-file-text", color: "#7c3aed" },
 		{
 			label: "Revenue",
 			value: format_compact_currency(kpi.total_revenue),
@@ -159,7 +246,7 @@ function render_project_kpi_cards(kpi) {
 			</div>
 			<div class="re-dash-kpi-body">
 				<div class="re-dash-kpi-label">${c.label}</div>
-				<div class="re-dash-kpi-value">${c.value}</div>
+				<div class="re-dash-kpi-value"${c.key ? ` data-plot-count="${c.key}"` : ""}>${c.value}</div>
 				${c.subtitle ? `<div class="re-dash-kpi-subtitle">${c.subtitle}</div>` : ""}
 			</div>
 		</div>`;
@@ -270,20 +357,18 @@ function render_plot_inventory(plots) {
 		</div>`;
 	}
 
-	let status_colors = { Available: "green", Booked: "blue", Registered: "purple", "On Hold": "yellow" };
-
 	let rows = plots
 		.map((pl) => {
-			let color = status_colors[pl.status] || "gray";
+			let color = RE_PLOT_STATUS_COLORS[pl.status] || "gray";
 			return `
-			<tr>
+			<tr data-plot="${frappe.utils.escape_html(pl.name)}">
 				<td><a href="/app/re-plot/${encodeURIComponent(pl.name)}">${pl.plot_number}</a></td>
 				<td>${pl.sector || "-"}</td>
 				<td>${pl.plot_type || "-"}</td>
 				<td class="text-right">${pl.plot_area} ${pl.area_unit}</td>
 				<td class="text-right">${format_compact_currency(pl.total_value)}</td>
-				<td><span class="re-dash-badge ${color}">${pl.status}</span></td>
-				<td>${pl.customer || "-"}</td>
+				<td class="re-plot-status"><span class="re-dash-badge ${color}">${pl.status}</span></td>
+				<td class="re-plot-customer">${pl.customer || "-"}</td>
 			</tr>`;
 		})
 		.join("");
@@ -7,28 +7,62 @@ overdue payments, assigned RMs, and plot status breakdown.
 
 import frappe
 from frappe import _
-from frappe.utils import nowdate, flt, add_days
+from frappe.utils import nowdate, flt, add_days, cint
+
+from real_estate_crm.perf.instrumentation import instrument, section
+from real_estate_crm.utils.parallel import run_sections
+from real_estate_crm.utils.replica import use_replica
+from real_estate_crm.utils.version_stamps import get_versions, respond, respond_sections
 
 
 @frappe.whitelist()
-def get_project_dashboard_data(project):
-    """Main API -- returns all project dashboard sections."""
+@use_replica()
+@instrument()
+def get_project_dashboard_data(project, parallel=0, client_versions=None):
+    """
+    Batched API -- returns all project dashboard sections. With `parallel`,
+    sections run concurrently on separate read connections.
+
+    With `client_versions` only stale sections are computed, as in
+    re_dashboard.get_dashboard_data.
+    """
+    _validate_project(project)
+    if client_versions is None:
+        return _compute_sections(project, SECTIONS, parallel)
+    return respond_sections(
+        get_versions(SECTION_DOMAINS, project=project),
+        client_versions,
+        lambda names: _compute_sections(project, {name: SECTIONS[name] for name in names}, parallel),
+    )
+
+
+@frappe.whitelist()
+@use_replica()
+@instrument()
+def get_project_dashboard_section(project, section, client_version=None):
+    """
+    One section -- the page requests these in parallel and renders each as it
+    arrives. Returns {"version", "data"} or {"version", "not_modified": 1}.
+    """
+    _validate_project(project)
+    if section not in SECTIONS:
+        frappe.throw(_("Unknown dashboard section: {0}").format(section))
+    version = get_versions({section: SECTION_DOMAINS[section]}, project=project)[section]
+    return respond(version, client_version, lambda: SECTIONS[section](project))
+
+
+def _compute_sections(project, sections, parallel):
+    if cint(parallel):
+        return run_sections({name: (fn, (project,)) for name, fn in sections.items()})
+    return {name: fn(project) for name, fn in sections.items()}
+
+
+def _validate_project(project):
     if not frappe.db.exists("RE Project", project):
         frappe.throw(_("Project {0} not found").format(project))
 
-    data = {}
-    data["project_info"] = _get_project_info(project)
-    data["kpi_cards"] = _get_kpi_cards(project)
-    data["plot_status_breakdown"] = _get_plot_status_breakdown(project)
-    data["plot_inventory"] = _get_plot_inventory(project)
-    data["assigned_rms"] = _get_assigned_rms(project)
-    data["monthly_collections"] = _get_monthly_collections(project)
-    data["recent_bookings"] = _get_recent_bookings(project)
-    data["overdue_payments"] = _get_overdue_payments(project)
-    data["upcoming_dues"] = _get_upcoming_dues(project)
-    return data
-
 
+@section()
 def _get_project_info(project):
     """Basic project details for the header."""
     return frappe.db.get_value(
@@ -39,6 +73,7 @@ def _get_project_info(project):
     )
 
 
+@section()
 def _get_kpi_cards(project):
     """Project-scoped KPI numbers."""
     total_plots = frappe.db.count("RE Plot", {"project": project})
@@ -106,6 +141,7 @@ def _get_kpi_cards(project):
     }
 
 
+@section()
 def _get_plot_status_breakdown(project):
     """Plot counts grouped by status for the donut chart."""
     return frappe.db.sql(
@@ -120,6 +156,7 @@ def _get_plot_status_breakdown(project):
     ) or []
 
 
+@section()
 def _get_plot_inventory(project):
     """All plots in this project with details."""
     return frappe.db.sql(
@@ -139,6 +176,7 @@ def _get_plot_inventory(project):
     ) or []
 
 
+@section()
 def _get_assigned_rms(project):
     """RMs assigned to this project via the RE RM Project child table."""
     return frappe.db.sql(
@@ -159,6 +197,7 @@ def _get_assigned_rms(project):
     ) or []
 
 
+@section()
 def _get_monthly_collections(project):
     """Last 6 months of payment collections for this project."""
     return frappe.db.sql(
@@ -180,6 +219,7 @@ def _get_monthly_collections(project):
     ) or []
 
 
+@section()
 def _get_recent_bookings(project, limit=10):
     """Recent bookings for this project."""
     return frappe.db.sql(
@@ -197,6 +237,7 @@ def _get_recent_bookings(project, limit=10):
     ) or []
 
 
+@section()
 def _get_overdue_payments(project, limit=10):
     """Overdue payment stages for this project."""
     today = nowdate()
@@ -223,6 +264,7 @@ def _get_overdue_payments(project, limit=10):
     ) or []
 
 
+@section()
 def _get_upcoming_dues(project, limit=5):
     """Payment stages due in the next 7 days for this project."""
     today = nowdate()
@@ -248,3 +290,30 @@ def _get_upcoming_dues(project, limit=5):
         """,
         (today, next_week, project, limit), as_dict=True,
     ) or []
+
+
+# Section name → builder(project), in render order (header and KPIs first).
+SECTIONS = {
+    "project_info": _get_project_info,
+    "kpi_cards": _get_kpi_cards,
+    "plot_status_breakdown": _get_plot_status_breakdown,
+    "plot_inventory": _get_plot_inventory,
+    "assigned_rms": _get_assigned_rms,
+    "monthly_collections": _get_monthly_collections,
+    "recent_bookings": _get_recent_bookings,
+    "overdue_payments": _get_overdue_payments,
+    "upcoming_dues": _get_upcoming_dues,
+}
+
+# Version-stamp domains each section reads (see utils/version_stamps.py).
+SECTION_DOMAINS = {
+    "project_info": ("project",),
+    "kpi_cards": ("booking", "payment", "plot"),
+    "plot_status_breakdown": ("plot",),
+    "plot_inventory": ("booking", "plot"),
+    "assigned_rms": ("rm",),
+    "monthly_collections": ("payment",),
+    "recent_bookings": ("booking",),
+    "overdue_payments": ("booking", "payment"),
+    "upcoming_dues": ("booking", "payment"),
+}
@@ -32,4 +32,7 @@ frappe.query_reports["Booking Register"] = {
 			options: "\nDraft\nBooked\nPayment In Progress\nPossession Due\nCompleted\nCancelled",
 		},
 	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+	},
 };
@@ -4,14 +4,19 @@
 import frappe
 from frappe.utils import flt
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.replica import use_replica
 
+
+@use_replica()
+@instrument(kind="report")
 def execute(filters=None):
 	columns = get_columns()
 	data = get_data(filters)
 	return columns, data
 
 
-def get_columns():
+def get_columns(filters=None):
 	return [
 		{"fieldname": "booking_no", "label": "Booking No", "fieldtype": "Link", "options": "RE Booking", "width": 140},
 		{"fieldname": "booking_date", "label": "Date", "fieldtype": "Date", "width": 100},
@@ -28,10 +33,15 @@ def get_columns():
 
 
 def get_data(filters):
+	query, values = get_query(filters)
+	return frappe.db.sql(query, values, as_dict=True)
+
+
+def get_query(filters):
+	"""SQL and values for the report rows — also streamed by the background export."""
 	conditions = get_conditions(filters)
 
-	data = frappe.db.sql(
-		"""
+	query = """
 		SELECT
 			b.name AS booking_no,
 			b.booking_date,
@@ -48,12 +58,9 @@ def get_data(filters):
 		LEFT JOIN `tabRE Relationship Manager` rm ON rm.name = b.assigned_rm
 		WHERE b.docstatus = 1 {conditions}
 		ORDER BY b.booking_date DESC, b.name
-		""".format(conditions=conditions),
-		filters,
-		as_dict=True,
-	)
+		""".format(conditions=conditions)
 
-	return data
+	return query, filters
 
 
 def get_conditions(filters):
@@ -8,7 +8,6 @@ frappe.query_reports["Customer Ledger"] = {
 			label: __("Customer"),
 			fieldtype: "Link",
 			options: "Customer",
-			reqd: 1,
 		},
 		{
 			fieldname: "project",
@@ -27,4 +26,82 @@ frappe.query_reports["Customer Ledger"] = {
 			fieldtype: "Date",
 		},
 	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+		if (frappe.user.has_role(["RE Accounts", "RE Admin", "System Manager"])) {
+			report.page.add_inner_button(__("Customer Statements"), () => generate_statements(report));
+		}
+	},
 };
+
+// Statement PDFs for the selected customer, or every customer of the project.
+function generate_statements(report) {
+	const filters = report.get_filter_values();
+	const dialog = new frappe.ui.Dialog({
+		title: __("Customer Statements"),
+		fields: [
+			{
+				fieldname: "output",
+				label: __("Output"),
+				fieldtype: "Select",
+				options: "Zip\nAttach",
+				default: "Zip",
+				description: __("Attach saves each PDF on its Customer."),
+			},
+		],
+		primary_action_label: __("Generate"),
+		primary_action: (values) => {
+			dialog.hide();
+			listen_statements();
+			frappe.call({
+				method: "real_estate_crm.api.re_customer_statements.generate_statements",
+				args: {
+					project: filters.project,
+					customers: filters.customer ? [filters.customer] : null,
+					from_date: filters.from_date,
+					to_date: filters.to_date,
+					output: values.output,
+				},
+				callback: (r) => {
+					if (r.message && r.message.queued) {
+						frappe.show_alert({
+							message: __("Statements queued — you will be notified when they are ready."),
+							indicator: "blue",
+						});
+					}
+				},
+			});
+		},
+	});
+	dialog.show();
+}
+
+let statements_listening = false;
+
+function listen_statements() {
+	if (statements_listening) return;
+	statements_listening = true;
+
+	frappe.realtime.on("re_statement_progress", (data) => {
+		frappe.show_progress(
+			__("Customer Statements"),
+			data.done,
+			data.total,
+			__("{0} of {1} customers", [data.done, data.total])
+		);
+	});
+
+	frappe.realtime.on("re_statement_done", (data) => {
+		frappe.hide_progress();
+		let message = __("{0} statements, {1} pages in {2}s ({3} pages/s).", [
+			data.customers,
+			data.pages,
+			data.seconds,
+			data.pages_per_second,
+		]);
+		if (data.file_url) {
+			message += ` <a href="${data.file_url}" target="_blank">${__("Download")}</a>`;
+		}
+		frappe.msgprint({ title: __("Statements Ready"), indicator: "green", message: message });
+	});
+}
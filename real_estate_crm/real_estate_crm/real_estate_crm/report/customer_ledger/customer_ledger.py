@@ -4,20 +4,36 @@
 """
 Customer Ledger — per-customer payment history with running balance.
 PRD §11.6
+
+Pick a Project without a Customer to get every customer's ledger at once.
 """
 
+from itertools import groupby
+
 import frappe
-from frappe.utils import flt
+from frappe import _
+
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.replica import use_replica
 
 
+@use_replica()
+@instrument(kind="report")
 def execute(filters=None):
 	columns = get_columns()
 	data = get_data(filters)
 	return columns, data
 
 
-def get_columns():
+def get_columns(filters=None):
 	return [
+		{
+			"fieldname": "customer",
+			"label": "Customer",
+			"fieldtype": "Link",
+			"options": "Customer",
+			"width": 160,
+		},
 		{"fieldname": "date", "label": "Date", "fieldtype": "Date", "width": 110},
 		{
 			"fieldname": "payment_entry",
@@ -42,87 +58,125 @@ def get_columns():
 
 
 def get_data(filters):
-	if not filters or not filters.get("customer"):
+	if not filters or not (filters.get("customer") or filters.get("project")):
 		return []
 
-	customer = filters["customer"]
+	query, values = get_query(filters)
+	return frappe.db.sql(query, values, as_dict=True)
 
-	# Total due across all submitted, non-cancelled bookings for this customer
-	booking_conditions = "b.customer = %(customer)s AND b.docstatus = 1 AND b.booking_status != 'Cancelled'"
-	if filters.get("project"):
-		booking_conditions += " AND b.project = %(project)s"
 
-	total_due = flt(
-		frappe.db.sql(
-			"""
-			SELECT IFNULL(SUM(b.final_value), 0)
-			FROM `tabRE Booking` b
-			WHERE {cond}
-			""".format(cond=booking_conditions),
-			filters,
-		)[0][0]
-	)
+def get_query(filters):
+	"""
+	Paid schedule rows that have a linked Payment Entry, joined with the
+	Payment Entry for mode_of_payment and reference_no. Also streamed by the
+	background export.
 
-	# Get all paid schedule rows that have a linked Payment Entry
-	# Join with Payment Entry for mode_of_payment and reference_no
-	date_conditions = ""
-	if filters.get("from_date"):
-		date_conditions += " AND ps.receipt_date >= %(from_date)s"
-	if filters.get("to_date"):
-		date_conditions += " AND ps.receipt_date <= %(to_date)s"
+	balance_after = total due - running SUM() of receipts per customer. The
+	window runs over every receipt up to to_date and from_date is applied
+	afterwards, so the opening balance is already in the first row.
 
-	rows = frappe.db.sql(
-		"""
-		SELECT
-			ps.receipt_date AS date,
-			ps.payment_entry,
-			ps.parent AS booking_no,
-			ps.stage_name,
-			ps.amount_received AS amount,
-			pe.mode_of_payment AS payment_mode,
-			pe.reference_no
-		FROM `tabRE Booking Payment Schedule` ps
-		INNER JOIN `tabRE Booking` b ON ps.parent = b.name
-		LEFT JOIN `tabPayment Entry` pe ON pe.name = ps.payment_entry
-		WHERE b.customer = %(customer)s
-			AND b.docstatus = 1
-			AND ps.payment_entry IS NOT NULL
-			AND ps.payment_entry != ''
-			{project_cond}
-			{date_cond}
-		ORDER BY ps.receipt_date, ps.stage_order
-		""".format(
-			project_cond=" AND b.project = %(project)s" if filters.get("project") else "",
-			date_cond=date_conditions,
-		),
-		filters,
-		as_dict=True,
-	)
+	Without a customer, every customer of the project (or of the
+	`customers` list) is returned in one pass, ordered by customer (batch
+	mode, see iter_ledgers and the customer statements job).
+	"""
+	if not (filters.get("customer") or filters.get("project") or filters.get("customers")):
+		frappe.throw(_("Please select a Customer or a Project."))
+
+	booking_conditions = ""
+	if filters.get("customer"):
+		booking_conditions += " AND b.customer = %(customer)s"
+	if filters.get("customers"):
+		booking_conditions += " AND b.customer IN %(customers)s"
+	if filters.get("project"):
+		booking_conditions += " AND b.project = %(project)s"
 
-	# Compute opening cumulative received if from_date is set
-	cumulative_received = 0.0
-	if filters.get("from_date"):
-		prior = frappe.db.sql(
-			"""
-			SELECT IFNULL(SUM(ps.amount_received), 0)
+	query = """
+		SELECT
+			l.customer,
+			l.date,
+			l.payment_entry,
+			l.booking_no,
+			l.stage_name,
+			l.amount,
+			l.payment_mode,
+			l.reference_no,
+			IFNULL(due.total_due, 0) - l.cumulative_received AS balance_after
+		FROM (
+			SELECT
+				b.customer,
+				ps.receipt_date AS date,
+				ps.payment_entry,
+				ps.parent AS booking_no,
+				ps.stage_name,
+				ps.stage_order,
+				ps.amount_received AS amount,
+				pe.mode_of_payment AS payment_mode,
+				pe.reference_no,
+				SUM(ps.amount_received) OVER (
+					PARTITION BY b.customer
+					ORDER BY ps.receipt_date, ps.stage_order, ps.parent
+					ROWS UNBOUNDED PRECEDING
+				) AS cumulative_received
 			FROM `tabRE Booking Payment Schedule` ps
 			INNER JOIN `tabRE Booking` b ON ps.parent = b.name
-			WHERE b.customer = %(customer)s
-				AND b.docstatus = 1
+			LEFT JOIN `tabPayment Entry` pe ON pe.name = ps.payment_entry
+			WHERE b.docstatus = 1
 				AND ps.payment_entry IS NOT NULL
 				AND ps.payment_entry != ''
-				AND ps.receipt_date < %(from_date)s
-				{project_cond}
-			""".format(
-				project_cond=" AND b.project = %(project)s" if filters.get("project") else "",
-			),
-			filters,
-		)
-		cumulative_received = flt(prior[0][0]) if prior else 0.0
-
-	# Running balance: total_due - cumulative payments
-	for row in rows:
-		cumulative_received += flt(row.amount)
-		row["balance_after"] = total_due - cumulative_received
-
-	return rows
+				{booking_cond}
+				{to_date_cond}
+		) l
+		LEFT JOIN (
+			-- Total due across all submitted, non-cancelled bookings
+			SELECT b.customer, SUM(b.final_value) AS total_due
+			FROM `tabRE Booking` b
+			WHERE b.docstatus = 1
+				AND b.booking_status != 'Cancelled'
+				{booking_cond}
+			GROUP BY b.customer
+		) due ON due.customer = l.customer
+		WHERE 1=1
+			{from_date_cond}
+		ORDER BY l.customer, l.date, l.stage_order, l.booking_no
+		""".format(
+		booking_cond=booking_conditions,
+		to_date_cond=" AND ps.receipt_date <= %(to_date)s" if filters.get("to_date") else "",
+		from_date_cond=" AND l.date >= %(from_date)s" if filters.get("from_date") else "",
+	)
+
+	return query, filters
+
+
+def iter_ledgers(filters):
+	"""
+	Batch mode, streamed: yields (customer, rows) for every customer matched
+	by `filters` (project and / or customers, from_date, to_date), holding
+	one customer's rows in memory at a time. The rows are read over a
+	connection of their own, so the caller may keep querying while it
+	iterates.
+	"""
+	query, values = get_query(frappe._dict(filters))
+	db = _connect_stream()
+	try:
+		with db.unbuffered_cursor():
+			rows = db.sql(query, values, as_dict=True, as_iterator=True)
+			for customer, ledger in groupby(rows, key=lambda row: row["customer"]):
+				yield customer, list(ledger)
+	finally:
+		db.close()
+
+
+def _connect_stream():
+	from frappe.database import get_db
+
+	conf = frappe.conf
+	db = get_db(
+		socket=conf.db_socket,
+		host=conf.db_host,
+		port=conf.db_port,
+		user=conf.db_user or conf.db_name,
+		password=conf.db_password,
+		cur_db_name=conf.db_name,
+	)
+	db.connect()
+	return db
@@ -0,0 +1,49 @@
+// Copyright (c) 2026, Real Estate CRM and contributors
+// For license information, please see license.txt
+
+frappe.query_reports["Lead Funnel"] = {
+	filters: [
+		{
+			fieldname: "view",
+			label: __("View"),
+			fieldtype: "Select",
+			options: "Cohort\nActivity",
+			default: "Cohort",
+			reqd: 1,
+		},
+		{
+			fieldname: "group_by",
+			label: __("Group By"),
+			fieldtype: "Select",
+			options: "Week\nProject\nRM",
+			default: "Week",
+		},
+		{
+			fieldname: "from_date",
+			label: __("From Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.add_months(frappe.datetime.get_today(), -3),
+		},
+		{
+			fieldname: "to_date",
+			label: __("To Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.get_today(),
+		},
+		{
+			fieldname: "project",
+			label: __("Project"),
+			fieldtype: "Link",
+			options: "RE Project",
+		},
+		{
+			fieldname: "rm",
+			label: __("Relationship Manager"),
+			fieldtype: "Link",
+			options: "RE Relationship Manager",
+		},
+	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+	},
+};
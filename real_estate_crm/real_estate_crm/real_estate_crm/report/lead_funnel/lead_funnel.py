@@ -0,0 +1,157 @@
+# Copyright (c) 2026, Real Estate CRM and contributors
+# For license information, please see license.txt
+
+"""
+Lead Funnel — Lead → Opportunity → Booking conversion by project, RM or week.
+
+Reads RE Funnel Fact only. Cohort follows the leads created in each week
+through to Opportunity, booking and completion; Activity counts what
+happened in each week (new leads, opportunities, bookings).
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import flt
+
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.real_estate_crm.doctype.re_funnel_fact.re_funnel_fact import week_start
+from real_estate_crm.utils.replica import use_replica
+
+GROUP_BY = {
+	"Week": ("week", "Date", None),
+	"Project": ("project", "Link", "RE Project"),
+	"RM": ("rm", "Link", "RE Relationship Manager"),
+}
+
+# view → [(fieldname, label, fieldtype, SQL)]
+MEASURES = {
+	"Cohort": [
+		("leads", "Leads", "Int", "SUM(leads)"),
+		("reached_opportunity", "Reached Opportunity", "Int", "SUM(cohort_opportunities)"),
+		("booked", "Booked", "Int", "SUM(cohort_bookings)"),
+		("completed", "Completed", "Int", "SUM(cohort_completed)"),
+	],
+	"Activity": [
+		("leads", "New Leads", "Int", "SUM(leads)"),
+		("opportunities", "Opportunities", "Int", "SUM(opportunities)"),
+		("bookings", "Bookings", "Int", "SUM(bookings)"),
+		("booking_value", "Booking Value", "Currency", "SUM(booking_value)"),
+	],
+}
+
+# view → [(fieldname, label, numerator, denominator)]
+RATES = {
+	"Cohort": [
+		("opportunity_rate", "Lead → Opportunity %", "reached_opportunity", "leads"),
+		("booking_rate", "Lead → Booking %", "booked", "leads"),
+		("completion_rate", "Booking → Completed %", "completed", "booked"),
+	],
+	"Activity": [
+		("booking_rate", "Bookings per Lead %", "bookings", "leads"),
+	],
+}
+
+
+@use_replica()
+@instrument(kind="report")
+def execute(filters=None):
+	filters = frappe._dict(filters or {})
+	columns = get_columns(filters)
+	query, values = get_query(filters)
+	data = frappe.db.sql(query, values, as_dict=True)
+	add_rates(filters, data)
+	chart = get_chart(filters, data) if _group_by(filters) == "Week" else None
+	return columns, data, None, chart
+
+
+def get_columns(filters):
+	fieldname, fieldtype, options = GROUP_BY[_group_by(filters)]
+	columns = [
+		{
+			"fieldname": fieldname,
+			"label": "Lead Week" if fieldname == "week" and _view(filters) == "Cohort" else _group_by(filters),
+			"fieldtype": fieldtype,
+			"options": options,
+			"width": 180,
+		}
+	]
+	columns += [
+		{"fieldname": f, "label": label, "fieldtype": fieldtype, "width": 140}
+		for f, label, fieldtype, _sql in MEASURES[_view(filters)]
+	]
+	columns += [
+		{"fieldname": f, "label": label, "fieldtype": "Percent", "width": 150}
+		for f, label, _num, _den in RATES[_view(filters)]
+	]
+	return columns
+
+
+def get_query(filters):
+	"""SQL and values for the report rows — also streamed by the background export."""
+	filters = frappe._dict(filters or {})
+	if filters.get("from_date") and filters.get("to_date") and filters.from_date > filters.to_date:
+		frappe.throw(_("From Date cannot be after To Date"))
+
+	conditions = ""
+	if filters.get("project"):
+		conditions += " AND project = %(project)s"
+	if filters.get("rm"):
+		conditions += " AND rm = %(rm)s"
+	if filters.get("from_date"):
+		filters.from_week = week_start(filters.from_date)
+		conditions += " AND week >= %(from_week)s"
+	if filters.get("to_date"):
+		conditions += " AND week <= %(to_date)s"
+
+	group_field = GROUP_BY[_group_by(filters)][0]
+	query = """
+		SELECT
+			{group_field},
+			{measures}
+		FROM `tabRE Funnel Fact`
+		WHERE 1=1 {conditions}
+		GROUP BY {group_field}
+		ORDER BY {order_by}
+	""".format(
+		group_field=group_field,
+		measures=",\n".join(f"{sql} AS {f}" for f, _label, _type, sql in MEASURES[_view(filters)]),
+		conditions=conditions,
+		order_by="week" if group_field == "week" else "leads DESC",
+	)
+	return query, filters
+
+
+def get_row_processor(filters):
+	"""Per-row conversion rates, for the background export."""
+	rates = RATES[_view(frappe._dict(filters or {}))]
+	return lambda row: _add_row_rates(rates, row)
+
+
+def add_rates(filters, data):
+	process_row = get_row_processor(filters)
+	for row in data:
+		process_row(row)
+
+
+def get_chart(filters, data):
+	measures = MEASURES[_view(filters)][:3]
+	return {
+		"data": {
+			"labels": [str(row.week) for row in data],
+			"datasets": [{"name": label, "values": [flt(row[f]) for row in data]} for f, label, _t, _s in measures],
+		},
+		"type": "bar",
+	}
+
+
+def _add_row_rates(rates, row):
+	for f, _label, numerator, denominator in rates:
+		row[f] = flt(row[numerator]) * 100 / flt(row[denominator]) if flt(row[denominator]) else 0
+
+
+def _view(filters):
+	return filters.get("view") or "Cohort"
+
+
+def _group_by(filters):
+	return filters.get("group_by") or "Week"
@@ -15,5 +15,46 @@ frappe.query_reports["Overdue Payment Report"] = {
 			fieldtype: "Link",
 			options: "RE Relationship Manager",
 		},
+		{
+			fieldname: "view",
+			label: __("View"),
+			fieldtype: "Select",
+			options: "Detail\nRM Summary",
+			default: "Detail",
+		},
+		{
+			fieldname: "min_days_overdue",
+			label: __("Min Days Overdue"),
+			fieldtype: "Int",
+		},
+		{
+			fieldname: "min_balance",
+			label: __("Min Balance"),
+			fieldtype: "Currency",
+		},
+		{
+			fieldname: "sort_by",
+			label: __("Sort By"),
+			fieldtype: "Select",
+			options: "Days Overdue\nBalance\nBooking",
+			default: "Days Overdue",
+		},
+		{
+			fieldname: "page_length",
+			label: __("Rows per Page"),
+			fieldtype: "Int",
+			default: 500,
+			depends_on: "eval:doc.view != 'RM Summary'",
+		},
+		{
+			fieldname: "page",
+			label: __("Page"),
+			fieldtype: "Int",
+			default: 1,
+			depends_on: "eval:doc.view != 'RM Summary'",
+		},
 	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+	},
 };
@@ -2,16 +2,41 @@
 # For license information, please see license.txt
 
 import frappe
-from frappe.utils import flt, getdate, date_diff
+from frappe.utils import add_days, cint, flt, getdate
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.real_estate_crm.doctype.re_aging_snapshot.re_aging_snapshot import get_bucket_totals
+from real_estate_crm.utils.replica import use_replica
+from real_estate_crm.utils.report_cache import cached_report
 
+
+DETAIL_SORT = {
+	"Days Overdue": "ps.due_date ASC, ps.name",
+	"Balance": "ps.balance DESC, ps.name",
+	"Booking": "ps.parent, ps.stage_order",
+}
+SUMMARY_SORT = {
+	"Days Overdue": "days_overdue DESC",
+	"Balance": "balance DESC",
+	"Booking": "bookings DESC",
+}
+DEFAULT_PAGE_LENGTH = 500
+
+
+@use_replica()
+@instrument(kind="report")
+@cached_report()
 def execute(filters=None):
-	columns = get_columns()
+	filters = frappe._dict(filters or {})
+	columns = get_columns(filters)
 	data = get_data(filters)
-	return columns, data
+	return columns, data, None, None, get_report_summary(filters)
+
 
+def get_columns(filters=None):
+	if filters and filters.get("view") == "RM Summary":
+		return get_summary_columns()
 
-def get_columns():
 	return [
 		{
 			"fieldname": "rm_name",
@@ -83,20 +108,133 @@ def get_columns():
 			"fieldtype": "Int",
 			"width": 120,
 		},
+		{
+			"fieldname": "interest_accrued",
+			"label": "Interest Accrued",
+			"fieldtype": "Currency",
+			"width": 130,
+		},
+	]
+
+
+def get_summary_columns():
+	return [
+		{
+			"fieldname": "rm_name",
+			"label": "RM Name",
+			"fieldtype": "Data",
+			"width": 180,
+		},
+		{
+			"fieldname": "rm",
+			"label": "RM Code",
+			"fieldtype": "Link",
+			"options": "RE Relationship Manager",
+			"width": 140,
+		},
+		{
+			"fieldname": "bookings",
+			"label": "Bookings",
+			"fieldtype": "Int",
+			"width": 100,
+		},
+		{
+			"fieldname": "overdue_stages",
+			"label": "Overdue Stages",
+			"fieldtype": "Int",
+			"width": 120,
+		},
+		{
+			"fieldname": "balance",
+			"label": "Balance",
+			"fieldtype": "Currency",
+			"width": 150,
+		},
+		{
+			"fieldname": "oldest_due_date",
+			"label": "Oldest Due Date",
+			"fieldtype": "Date",
+			"width": 120,
+		},
+		{
+			"fieldname": "days_overdue",
+			"label": "Max Days Overdue",
+			"fieldtype": "Int",
+			"width": 130,
+		},
 	]
 
 
 def get_data(filters):
+	"""One page of rows; RM Summary is never paginated."""
+	query, values = get_query(filters)
+
+	if filters.get("view") != "RM Summary":
+		page_length = cint(filters.get("page_length")) or DEFAULT_PAGE_LENGTH
+		values["limit"] = page_length
+		values["offset"] = (max(cint(filters.get("page")), 1) - 1) * page_length
+		query += " LIMIT %(limit)s OFFSET %(offset)s"
+
+	return frappe.db.sql(query, values, as_dict=True)
+
+
+def get_query(filters):
+	"""
+	SQL and values for all matching rows — also streamed, unpaginated, by
+	the background export.
+
+	Rows are found through the (status, due_date) index: min_days_overdue
+	becomes an upper bound on due_date rather than a DATEDIFF() predicate.
+	"""
+	filters = frappe._dict(filters or {})
+	values = dict(filters, today=getdate())
+
 	conditions = ""
-	if filters and filters.get("project"):
+	if filters.get("min_days_overdue"):
+		values["due_on_or_before"] = add_days(values["today"], -cint(filters.min_days_overdue))
+		conditions += " AND ps.due_date <= %(due_on_or_before)s"
+	if filters.get("min_balance"):
+		values["min_balance"] = flt(filters.min_balance)
+		conditions += " AND ps.balance >= %(min_balance)s"
+	if filters.get("project"):
 		conditions += " AND b.project = %(project)s"
-	if filters and filters.get("rm"):
+	if filters.get("rm"):
 		conditions += " AND b.assigned_rm = %(rm)s"
 
-	today = getdate()
+	sort_by = filters.get("sort_by") or "Days Overdue"
 
-	data = frappe.db.sql(
-		"""
+	if filters.get("view") == "RM Summary":
+		query = """
+			SELECT
+				rm.rm_name AS rm_name,
+				o.rm,
+				o.bookings,
+				o.overdue_stages,
+				o.balance,
+				o.oldest_due_date,
+				DATEDIFF(%(today)s, o.oldest_due_date) AS days_overdue
+			FROM (
+				SELECT
+					b.assigned_rm AS rm,
+					COUNT(DISTINCT b.name) AS bookings,
+					COUNT(*) AS overdue_stages,
+					SUM(ps.balance) AS balance,
+					MIN(ps.due_date) AS oldest_due_date
+				FROM
+					`tabRE Booking Payment Schedule` ps
+				INNER JOIN `tabRE Booking` b ON ps.parent = b.name
+				WHERE
+					ps.status = 'Overdue'
+					AND b.docstatus = 1
+					{conditions}
+				GROUP BY b.assigned_rm
+			) o
+			LEFT JOIN `tabRE Relationship Manager` rm ON rm.name = o.rm
+			ORDER BY {order_by}
+		""".format(conditions=conditions, order_by=SUMMARY_SORT.get(sort_by, SUMMARY_SORT["Days Overdue"]))
+		return query, values
+
+	query = """
 		SELECT
 			rm.rm_name AS rm_name,
 			b.name AS booking_no,
@@ -107,7 +245,9 @@ def get_data(filters):
 			ps.amount_due AS amount_due,
 			ps.amount_received AS amount_received,
 			ps.balance AS balance,
-			ps.due_date AS due_date
+			ps.due_date AS due_date,
+			DATEDIFF(%(today)s, ps.due_date) AS days_overdue,
+			ps.interest_accrued AS interest_accrued
 		FROM
 			`tabRE Booking Payment Schedule` ps
 		INNER JOIN `tabRE Booking` b ON ps.parent = b.name
@@ -117,16 +257,23 @@ def get_data(filters):
 			AND b.docstatus = 1
 			{conditions}
 		ORDER BY
-			rm.rm_name, b.name, ps.due_date
-	""".format(conditions=conditions),
-		filters,
-		as_dict=True,
-	)
-
-	for row in data:
-		if row.due_date:
-			row["days_overdue"] = date_diff(today, getdate(row.due_date))
-		else:
-			row["days_overdue"] = 0
-
-	return data
+			{order_by}
+	""".format(conditions=conditions, order_by=DETAIL_SORT.get(sort_by, DETAIL_SORT["Days Overdue"]))
+
+	return query, values
+
+
+def get_report_summary(filters):
+	"""Aging buckets from the latest nightly snapshot (see Receivables Aging)."""
+	filters = filters or {}
+	totals = get_bucket_totals(project=filters.get("project"), rm=filters.get("rm"))
+	indicators = {"0-30": "Blue", "31-60": "Orange", "61-90": "Orange", "90+": "Red"}
+	return [
+		{
+			"value": flt(amount),
+			"label": "{0} days".format(bucket),
+			"datatype": "Currency",
+			"indicator": indicators[bucket],
+		}
+		for bucket, amount in totals.items()
+	]
@@ -32,4 +32,7 @@ frappe.query_reports["Payment Collection Report"] = {
 			default: 0,
 		},
 	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+	},
 };
@@ -4,14 +4,21 @@
 import frappe
 from frappe.utils import flt, getdate, today
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.replica import use_replica
+from real_estate_crm.utils.report_cache import cached_report
 
+
+@use_replica()
+@instrument(kind="report")
+@cached_report()
 def execute(filters=None):
 	columns = get_columns()
 	data = get_data(filters)
 	return columns, data
 
 
-def get_columns():
+def get_columns(filters=None):
 	return [
 		{"fieldname": "booking_no", "label": "Booking No", "fieldtype": "Link", "options": "RE Booking", "width": 140},
 		{"fieldname": "customer", "label": "Customer", "fieldtype": "Link", "options": "Customer", "width": 150},
@@ -28,10 +35,21 @@ def get_columns():
 
 
 def get_data(filters):
+	query, values = get_query(filters)
+	data = frappe.db.sql(query, values, as_dict=True)
+
+	if not data:
+		return data
+
+	data.append(get_total_row(filters))
+	return data
+
+
+def get_query(filters):
+	"""SQL and values for the report rows — also streamed by the background export."""
 	conditions = get_conditions(filters)
 
-	data = frappe.db.sql(
-		"""
+	query = """
 		SELECT
 			b.name AS booking_no,
 			b.customer,
@@ -46,38 +64,42 @@ def get_data(filters):
 			ps.status
 		FROM `tabRE Booking` b
 		INNER JOIN `tabRE Booking Payment Schedule` ps ON ps.parent = b.name AND ps.parenttype = 'RE Booking'
-		LEFT JOIN `tabRE Relationship Manager` rm ON rm.name = b.assigned_rm
 		WHERE b.docstatus = 1 {conditions}
 		ORDER BY b.name, ps.stage_order
-		""".format(conditions=conditions),
-		filters,
-		as_dict=True,
-	)
+		""".format(conditions=conditions)
 
-	if not data:
-		return data
+	return query, filters
 
-	# Calculate totals for summary row
-	total_due = sum(flt(row.get("amount_due")) for row in data)
-	total_received = sum(flt(row.get("amount_received")) for row in data)
-	total_balance = sum(flt(row.get("balance")) for row in data)
 
-	# Append summary row
-	data.append({
+def get_total_row(filters):
+	"""Summary row, aggregated in SQL over the same conditions as the data."""
+	totals = frappe.db.sql(
+		"""
+		SELECT
+			IFNULL(SUM(ps.amount_due), 0) AS amount_due,
+			IFNULL(SUM(ps.amount_received), 0) AS amount_received,
+			IFNULL(SUM(ps.balance), 0) AS balance
+		FROM `tabRE Booking` b
+		INNER JOIN `tabRE Booking Payment Schedule` ps ON ps.parent = b.name AND ps.parenttype = 'RE Booking'
+		WHERE b.docstatus = 1 {conditions}
+		""".format(conditions=get_conditions(filters)),
+		filters,
+		as_dict=True,
+	)[0]
+
+	return {
 		"booking_no": "",
 		"customer": "",
 		"plot": "",
 		"stage_name": "<b>Total</b>",
 		"stage_order": None,
-		"amount_due": total_due,
-		"amount_received": total_received,
-		"balance": total_balance,
+		"amount_due": flt(totals.amount_due),
+		"amount_received": flt(totals.amount_received),
+		"balance": flt(totals.balance),
 		"due_date": None,
 		"receipt_date": None,
 		"status": "",
-	})
-
-	return data
+	}
 
 
 def get_conditions(filters):
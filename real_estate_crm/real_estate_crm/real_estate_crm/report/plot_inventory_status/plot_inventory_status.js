@@ -27,4 +27,7 @@ frappe.query_reports["Plot Inventory Status"] = {
 			fieldtype: "Data",
 		},
 	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+	},
 };
@@ -4,14 +4,19 @@
 import frappe
 from frappe.utils import flt
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.replica import use_replica
 
+
+@use_replica()
+@instrument(kind="report")
 def execute(filters=None):
 	columns = get_columns()
 	data = get_data(filters)
 	return columns, data
 
 
-def get_columns():
+def get_columns(filters=None):
 	return [
 		{"fieldname": "plot_number", "label": "Plot Number", "fieldtype": "Data", "width": 120},
 		{"fieldname": "project", "label": "Project", "fieldtype": "Link", "options": "RE Project", "width": 150},
@@ -31,10 +36,15 @@ def get_columns():
 
 
 def get_data(filters):
+	query, values = get_query(filters)
+	return frappe.db.sql(query, values, as_dict=True)
+
+
+def get_query(filters):
+	"""SQL and values for the report rows — also streamed by the background export."""
 	conditions = get_conditions(filters)
 
-	data = frappe.db.sql(
-		"""
+	query = """
 		SELECT
 			p.plot_number,
 			p.project,
@@ -55,12 +65,9 @@ def get_data(filters):
 		LEFT JOIN `tabRE Relationship Manager` rm ON rm.name = b.assigned_rm
 		WHERE 1=1 {conditions}
 		ORDER BY p.project, p.sector, p.plot_number
-		""".format(conditions=conditions),
-		filters,
-		as_dict=True,
-	)
+		""".format(conditions=conditions)
 
-	return data
+	return query, filters
 
 
 def get_conditions(filters):
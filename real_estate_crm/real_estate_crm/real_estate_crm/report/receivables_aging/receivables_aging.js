@@ -0,0 +1,59 @@
+// Copyright (c) 2026, Real Estate CRM and contributors
+// For license information, please see license.txt
+
+frappe.query_reports["Receivables Aging"] = {
+	filters: [
+		{
+			fieldname: "view",
+			label: __("View"),
+			fieldtype: "Select",
+			options: "Summary\nTrend",
+			default: "Summary",
+			reqd: 1,
+		},
+		{
+			fieldname: "group_by",
+			label: __("Group By"),
+			fieldtype: "Select",
+			options: "Project\nRM\nCustomer",
+			default: "Project",
+			depends_on: "eval:doc.view == 'Summary'",
+		},
+		{
+			fieldname: "snapshot_date",
+			label: __("As On"),
+			fieldtype: "Date",
+			default: frappe.datetime.get_today(),
+			depends_on: "eval:doc.view == 'Summary'",
+		},
+		{
+			fieldname: "from_date",
+			label: __("From Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.add_months(frappe.datetime.get_today(), -3),
+			depends_on: "eval:doc.view == 'Trend'",
+		},
+		{
+			fieldname: "to_date",
+			label: __("To Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.get_today(),
+			depends_on: "eval:doc.view == 'Trend'",
+		},
+		{
+			fieldname: "project",
+			label: __("Project"),
+			fieldtype: "Link",
+			options: "RE Project",
+		},
+		{
+			fieldname: "rm",
+			label: __("Relationship Manager"),
+			fieldtype: "Link",
+			options: "RE Relationship Manager",
+		},
+	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+	},
+};
@@ -0,0 +1,125 @@
+# Copyright (c) 2026, Real Estate CRM and contributors
+# For license information, please see license.txt
+
+"""
+Receivables Aging — overdue balance by 0–30 / 31–60 / 61–90 / 90+ days.
+
+Reads RE Aging Snapshot only. Summary pivots the latest snapshot on or before
+"As On" by Project, RM or Customer; Trend totals each nightly snapshot in a
+date range.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import flt
+
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.real_estate_crm.doctype.re_aging_snapshot.re_aging_snapshot import (
+	BUCKETS,
+	get_latest_snapshot_date,
+)
+from real_estate_crm.utils.replica import use_replica
+
+GROUP_BY = {
+	"Project": ("project", "Link", "RE Project"),
+	"RM": ("assigned_rm", "Link", "RE Relationship Manager"),
+	"Customer": ("customer", "Link", "Customer"),
+}
+
+
+@use_replica()
+@instrument(kind="report")
+def execute(filters=None):
+	filters = frappe._dict(filters or {})
+	columns = get_columns(filters)
+	query, values = get_query(filters)
+	data = frappe.db.sql(query, values, as_dict=True) if query else []
+	chart = get_chart(data) if filters.get("view") == "Trend" else None
+	return columns, data, None, chart
+
+
+def get_columns(filters):
+	if filters.get("view") == "Trend":
+		columns = [{"fieldname": "snapshot_date", "label": "Snapshot Date", "fieldtype": "Date", "width": 120}]
+	else:
+		fieldname, fieldtype, options = GROUP_BY[filters.get("group_by") or "Project"]
+		columns = [
+			{
+				"fieldname": fieldname,
+				"label": filters.get("group_by") or "Project",
+				"fieldtype": fieldtype,
+				"options": options,
+				"width": 200,
+			}
+		]
+
+	columns += [
+		{"fieldname": _bucket_field(bucket), "label": bucket, "fieldtype": "Currency", "width": 130}
+		for bucket in BUCKETS
+	]
+	columns.append({"fieldname": "total", "label": "Total", "fieldtype": "Currency", "width": 140})
+	return columns
+
+
+def get_query(filters):
+	"""SQL and values for the report rows — also streamed by the background export."""
+	filters = frappe._dict(filters or {})
+
+	conditions = ""
+	if filters.get("project"):
+		conditions += " AND project = %(project)s"
+	if filters.get("rm"):
+		conditions += " AND assigned_rm = %(rm)s"
+
+	pivot = ",\n".join(
+		"SUM(CASE WHEN bucket = '{0}' THEN outstanding ELSE 0 END) AS {1}".format(bucket, _bucket_field(bucket))
+		for bucket in BUCKETS
+	)
+
+	if filters.get("view") == "Trend":
+		if not (filters.get("from_date") and filters.get("to_date")):
+			frappe.throw(_("From Date and To Date are required for the Trend view."))
+		group_field = "snapshot_date"
+		conditions += " AND snapshot_date BETWEEN %(from_date)s AND %(to_date)s"
+	else:
+		filters.snapshot_date = get_latest_snapshot_date(filters.get("snapshot_date"))
+		if not filters.snapshot_date:
+			return None, filters
+		group_field = GROUP_BY[filters.get("group_by") or "Project"][0]
+		conditions += " AND snapshot_date = %(snapshot_date)s"
+
+	query = """
+		SELECT
+			{group_field},
+			{pivot},
+			SUM(outstanding) AS total
+		FROM `tabRE Aging Snapshot`
+		WHERE 1=1 {conditions}
+		GROUP BY {group_field}
+		ORDER BY {order_by}
+	""".format(
+		group_field=group_field,
+		pivot=pivot,
+		conditions=conditions,
+		order_by="snapshot_date" if group_field == "snapshot_date" else "total DESC",
+	)
+
+	return query, filters
+
+
+def get_chart(data):
+	return {
+		"data": {
+			"labels": [str(row.snapshot_date) for row in data],
+			"datasets": [
+				{"name": bucket, "values": [flt(row[_bucket_field(bucket)]) for row in data]}
+				for bucket in BUCKETS
+			],
+		},
+		"type": "line",
+		"fieldtype": "Currency",
+	}
+
+
+def _bucket_field(bucket):
+	return "bucket_" + bucket.replace("-", "_").replace("+", "_plus")
@@ -16,4 +16,7 @@ frappe.query_reports["RM Performance Report"] = {
 			options: "RE Relationship Manager",
 		},
 	],
+	onload: function (report) {
+		real_estate_crm.add_background_export(report);
+	},
 };
@@ -2,16 +2,22 @@
 # For license information, please see license.txt
 
 import frappe
-from frappe.utils import flt
 
+from real_estate_crm.perf.instrumentation import instrument
+from real_estate_crm.utils.replica import use_replica
+from real_estate_crm.utils.report_cache import cached_report
 
+
+@use_replica()
+@instrument(kind="report")
+@cached_report()
 def execute(filters=None):
 	columns = get_columns()
 	data = get_data(filters)
 	return columns, data
 
 
-def get_columns():
+def get_columns(filters=None):
 	return [
 		{
 			"fieldname": "rm_name",
@@ -66,115 +72,78 @@ def get_columns():
 
 
 def get_data(filters):
-	conditions = ""
-	if filters and filters.get("rm"):
-		conditions += " AND rm.name = %(rm)s"
+	query, values = get_query(filters)
+	return frappe.db.sql(query, values, as_dict=True)
+
+
+def get_query(filters):
+	"""
+	One grouped query for all RMs: each metric is aggregated once per RM in
+	a derived table and joined back, instead of five queries per RM. Also
+	streamed by the background export.
+	"""
+	filters = frappe._dict(filters or {})
+
+	rm_condition = ""
+	if filters.get("rm"):
+		rm_condition = " AND rm.name = %(rm)s"
 
-	# Get all RMs
-	rm_data = frappe.db.sql(
-		"""
+	project_condition = ""
+	if filters.get("project"):
+		project_condition = " AND b.project = %(project)s"
+
+	query = """
 		SELECT
-			rm.name AS rm_code,
 			rm.rm_name,
-			rm.status
+			rm.name AS rm_code,
+			rm.status,
+			IFNULL(l.cnt, 0) AS leads_assigned,
+			IFNULL(o.cnt, 0) AS opportunities,
+			IFNULL(bk.bookings_closed, 0) AS bookings_closed,
+			IFNULL(bk.total_revenue, 0) AS total_revenue,
+			IFNULL(os.outstanding, 0) AS outstanding_collection
 		FROM
 			`tabRE Relationship Manager` rm
-		WHERE
-			1=1
-			{conditions}
-		ORDER BY
-			rm.rm_name
-	""".format(conditions=conditions),
-		filters,
-		as_dict=True,
-	)
-
-	project_condition = ""
-	if filters and filters.get("project"):
-		project_condition = " AND project = %(project)s"
-
-	data = []
-	for rm in rm_data:
-		row = {
-			"rm_name": rm.rm_name,
-			"rm_code": rm.rm_code,
-			"status": rm.status,
-		}
-
-		# Count leads assigned to this RM
-		lead_count = frappe.db.sql(
-			"""
-			SELECT COUNT(*) AS cnt
+		LEFT JOIN (
+			SELECT re_assigned_rm AS rm, COUNT(*) AS cnt
 			FROM `tabLead`
-			WHERE re_assigned_rm = %(rm_code)s
-		""",
-			{"rm_code": rm.rm_code},
-			as_dict=True,
-		)
-		row["leads_assigned"] = lead_count[0].cnt if lead_count else 0
-
-		# Count opportunities assigned to this RM
-		opp_count = frappe.db.sql(
-			"""
-			SELECT COUNT(*) AS cnt
+			WHERE re_assigned_rm IS NOT NULL {lead_rm_condition}
+			GROUP BY re_assigned_rm
+		) l ON l.rm = rm.name
+		LEFT JOIN (
+			SELECT re_assigned_rm AS rm, COUNT(*) AS cnt
 			FROM `tabOpportunity`
-			WHERE re_assigned_rm = %(rm_code)s
-		""",
-			{"rm_code": rm.rm_code},
-			as_dict=True,
-		)
-		row["opportunities"] = opp_count[0].cnt if opp_count else 0
-
-		# Count bookings closed (status = Completed) and total revenue
-		booking_data = frappe.db.sql(
-			"""
-			SELECT
-				COUNT(*) AS cnt,
-				SUM(final_value) AS total_revenue
-			FROM `tabRE Booking`
-			WHERE assigned_rm = %(rm_code)s
-				AND docstatus = 1
-				AND booking_status = 'Completed'
-				{project_condition}
-		""".format(project_condition=project_condition),
-			{"rm_code": rm.rm_code, "project": filters.get("project") if filters else None},
-			as_dict=True,
-		)
-		row["bookings_closed"] = booking_data[0].cnt if booking_data else 0
-
-		# Total revenue from all non-cancelled bookings
-		revenue_data = frappe.db.sql(
-			"""
-			SELECT
-				IFNULL(SUM(final_value), 0) AS total_revenue
-			FROM `tabRE Booking`
-			WHERE assigned_rm = %(rm_code)s
-				AND docstatus = 1
-				AND booking_status != 'Cancelled'
-				{project_condition}
-		""".format(project_condition=project_condition),
-			{"rm_code": rm.rm_code, "project": filters.get("project") if filters else None},
-			as_dict=True,
-		)
-		row["total_revenue"] = flt(revenue_data[0].total_revenue) if revenue_data else 0
-
-		# Outstanding collection from payment schedules
-		outstanding_data = frappe.db.sql(
-			"""
+			WHERE re_assigned_rm IS NOT NULL {lead_rm_condition}
+			GROUP BY re_assigned_rm
+		) o ON o.rm = rm.name
+		LEFT JOIN (
 			SELECT
-				IFNULL(SUM(ps.balance), 0) AS outstanding
+				b.assigned_rm AS rm,
+				SUM(CASE WHEN b.booking_status = 'Completed' THEN 1 ELSE 0 END) AS bookings_closed,
+				SUM(CASE WHEN b.booking_status != 'Cancelled' THEN b.final_value ELSE 0 END) AS total_revenue
+			FROM `tabRE Booking` b
+			WHERE b.docstatus = 1 {booking_rm_condition} {project_condition}
+			GROUP BY b.assigned_rm
+		) bk ON bk.rm = rm.name
+		LEFT JOIN (
+			SELECT b.assigned_rm AS rm, SUM(ps.balance) AS outstanding
 			FROM `tabRE Booking Payment Schedule` ps
 			INNER JOIN `tabRE Booking` b ON ps.parent = b.name
-			WHERE b.assigned_rm = %(rm_code)s
-				AND b.docstatus = 1
+			WHERE b.docstatus = 1
 				AND ps.status NOT IN ('Paid', 'Cancelled')
-				{project_condition}
-		""".format(project_condition=project_condition.replace("project", "b.project") if project_condition else ""),
-			{"rm_code": rm.rm_code, "project": filters.get("project") if filters else None},
-			as_dict=True,
-		)
-		row["outstanding_collection"] = flt(outstanding_data[0].outstanding) if outstanding_data else 0
-
-		data.append(row)
+				{booking_rm_condition} {project_condition}
+			GROUP BY b.assigned_rm
+		) os ON os.rm = rm.name
+		WHERE
+			1=1
+			{rm_condition}
+		ORDER BY
+			rm.rm_name
+	""".format(
+		rm_condition=rm_condition,
+		lead_rm_condition=" AND re_assigned_rm = %(rm)s" if filters.get("rm") else "",
+		booking_rm_condition=" AND b.assigned_rm = %(rm)s" if filters.get("rm") else "",
+		project_condition=project_condition,
+	)
 
-	return data
+	return query, filters
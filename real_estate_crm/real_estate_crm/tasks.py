@@ -4,7 +4,15 @@ Registered in hooks.py under scheduler_events.
 """
 
 import frappe
-from frappe.utils import today
+from frappe.utils import get_last_day, getdate, today
+
+from real_estate_crm.real_estate_crm.doctype.re_aging_snapshot.re_aging_snapshot import build_snapshot
+from real_estate_crm.real_estate_crm.doctype.re_interest_accrual.re_interest_accrual import (
+    accrue_interest,
+    post_journal_entries,
+)
+from real_estate_crm.utils.report_cache import invalidate as invalidate_report_cache
+from real_estate_crm.utils.version_stamps import bump as bump_versions
 
 
 def mark_overdue_schedules():
@@ -13,6 +21,9 @@ def mark_overdue_schedules():
     - Marks RE Booking Payment Schedule rows as 'Overdue' when due_date
       has passed and status is still Pending or Partial.
     - Sends email alert to the booking's assigned RM.
+    - Builds today's RE Aging Snapshot.
+    - Accrues late-payment interest on Overdue rows and, on the last day of
+      the month, posts it as Journal Entries (both per RE CRM Settings).
 
     Safe to run before Module 4 doctypes exist — exits early if the
     table is not yet present (e.g., during initial bench setup).
@@ -41,3 +52,28 @@ def mark_overdue_schedules():
 
     if overdue:
         frappe.db.commit()
+        bookings = frappe.db.get_all(
+            "RE Booking",
+            filters={"name": ["in", list({row.parent for row in overdue})]},
+            fields=["project", "customer"],
+        )
+        bump_versions(
+            ("payment",),
+            projects={b.project for b in bookings},
+            customers={b.customer for b in bookings},
+        )
+
+    # Aging is built from the statuses set above.
+    build_snapshot()
+    _accrue_interest()
+    invalidate_report_cache()
+
+
+def _accrue_interest():
+    settings = frappe.get_cached_doc("RE CRM Settings")
+    if not settings.accrue_late_payment_interest:
+        return
+
+    accrue_interest()
+    if settings.post_interest_journal_entries and getdate(today()) == get_last_day(today()):
+        post_journal_entries()
@@ -0,0 +1,149 @@
+"""
+Cash-flow forecast: expected collections by month over open payment schedules.
+
+Open schedule rows (Pending / Partial / Overdue with a balance) are loaded
+in one query into NumPy arrays — due date, balance, project, RM and whether
+the stage is possession-linked — and bucketed by month with bincount:
+
+    forecast = get_forecast({"possession_delay_months": 6})
+
+Scenarios shift due dates before bucketing:
+
+    possession_delay_months   possession-linked stages slip by N months
+    payment_delay_days        every stage is paid N days late
+    collection_efficiency     % of each balance expected to be collected
+
+Balances due before the current month land in the current month (and are
+also reported as `past_due`). Results are cached per scenario and month, and
+go stale together with the report cache (bookings, payments, RM changes, the
+daily overdue job).
+"""
+
+import hashlib
+import json
+
+import frappe
+import numpy as np
+from frappe.utils import cint, flt, getdate, nowdate
+
+from real_estate_crm.utils.report_cache import get_generation
+
+HORIZON_MONTHS = 24
+CACHE_PREFIX = "re_cash_flow_forecast"
+DEFAULT_CACHE_TTL = 3600
+
+
+def get_scenario(values=None):
+    """Normalized scenario dict; unknown keys are dropped, values clamped."""
+    values = frappe.parse_json(values) or {}
+    return frappe._dict(
+        possession_delay_months=max(cint(values.get("possession_delay_months")), 0),
+        payment_delay_days=max(cint(values.get("payment_delay_days")), 0),
+        collection_efficiency=min(max(flt(values.get("collection_efficiency", 100)), 0), 100),
+    )
+
+
+def get_forecast(scenario=None, horizon=HORIZON_MONTHS):
+    """Cached forecast for `scenario` (default: as scheduled)."""
+    scenario = get_scenario(scenario)
+    key = _cache_key(scenario, horizon)
+    cached = frappe.cache().get_value(key)
+    if cached is not None:
+        return cached
+
+    forecast = compute_forecast(load_schedule(), scenario, horizon)
+    frappe.cache().set_value(
+        key, forecast, expires_in_sec=cint(frappe.conf.get("re_forecast_cache_ttl", DEFAULT_CACHE_TTL))
+    )
+    return forecast
+
+
+def load_schedule():
+    """Open schedule rows as column arrays; projects / RMs as integer codes."""
+    rows = frappe.db.sql(
+        """
+        SELECT ps.due_date, ps.balance, b.project, IFNULL(b.assigned_rm, ''), ps.is_possession_stage
+        FROM `tabRE Booking Payment Schedule` ps
+        INNER JOIN `tabRE Booking` b ON ps.parent = b.name
+        WHERE b.docstatus = 1
+            AND b.booking_status != 'Cancelled'
+            AND ps.status IN ('Pending', 'Partial', 'Overdue')
+            AND ps.balance > 0
+            AND ps.due_date IS NOT NULL
+        """
+    )
+    if not rows:
+        return None
+
+    due, balance, project, rm, possession = zip(*rows)
+    projects, project_codes = np.unique(np.array(project, dtype=object).astype(str), return_inverse=True)
+    rms, rm_codes = np.unique(np.array(rm, dtype=object).astype(str), return_inverse=True)
+
+    return {
+        "due": np.array(due, dtype="datetime64[D]"),
+        "balance": np.array(balance, dtype=np.float64),
+        "project": project_codes,
+        "projects": projects.tolist(),
+        "rm": rm_codes,
+        "rms": rms.tolist(),
+        "possession": np.array(possession, dtype=bool),
+    }
+
+
+def compute_forecast(schedule, scenario, horizon=HORIZON_MONTHS):
+    start = np.datetime64(nowdate()).astype("datetime64[M]")
+    months = [str(start + i) for i in range(horizon)]
+    result = {
+        "months": months,
+        "scenario": scenario,
+        "total": [0.0] * horizon,
+        "by_project": [],
+        "by_rm": [],
+        "past_due": 0.0,
+        "beyond_horizon": 0.0,
+    }
+    if schedule is None:
+        return result
+
+    due = schedule["due"] + np.timedelta64(scenario.payment_delay_days, "D")
+    month = (due.astype("datetime64[M]") - start).astype(np.int64)
+    month += np.where(schedule["possession"], scenario.possession_delay_months, 0)
+    amount = schedule["balance"] * (scenario.collection_efficiency / 100.0)
+
+    past_due = month < 0
+    month = np.maximum(month, 0)
+    in_horizon = month < horizon
+
+    m, a = month[in_horizon], amount[in_horizon]
+    result["total"] = _round(np.bincount(m, weights=a, minlength=horizon))
+    result["by_project"] = _breakdown("project", schedule["projects"], schedule["project"][in_horizon], m, a, horizon)
+    result["by_rm"] = _breakdown("rm", schedule["rms"], schedule["rm"][in_horizon], m, a, horizon)
+    result["past_due"] = round(float(amount[past_due].sum()), 2)
+    result["beyond_horizon"] = round(float(amount[~in_horizon].sum()), 2)
+    return result
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _breakdown(field, labels, codes, month, amount, horizon):
+    """(group × month) totals from one bincount over code * horizon + month."""
+    grid = np.bincount(codes * horizon + month, weights=amount, minlength=len(labels) * horizon)
+    grid = grid.reshape(len(labels), horizon)
+    totals = grid.sum(axis=1)
+
+    return [
+        {field: labels[i] or None, "amounts": _round(grid[i]), "total": round(float(totals[i]), 2)}
+        for i in np.argsort(-totals)
+        if totals[i]
+    ]
+
+
+def _round(values):
+    return np.round(values, 2).tolist()
+
+
+def _cache_key(scenario, horizon):
+    digest = hashlib.md5(json.dumps(scenario, sort_keys=True).encode()).hexdigest()[:12]
+    month = getdate(nowdate()).strftime("%Y-%m")
+    return ":".join((CACHE_PREFIX, get_generation(), month, str(horizon), digest))
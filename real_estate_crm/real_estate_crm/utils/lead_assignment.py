@@ -0,0 +1,204 @@
+"""
+Lead auto-assignment to Relationship Managers.
+
+On Lead insert, a lead with an interested project and no RM gets one of the
+project's Active RMs (RE Relationship Manager.assigned_projects), by the
+strategy set in RE CRM Settings:
+
+    Least Loaded   the RM with the fewest open leads
+    Round Robin    the project's RMs in turn
+
+Open-lead counts per RM live in a Redis sorted set (LOAD_KEY), so picking an
+RM never counts rows in tabLead. The pick and the increment run as one Lua
+script, so concurrent web-form leads cannot both see the same low count.
+Lead hooks keep the counts current as leads are reassigned, closed,
+reopened or deleted; reconcile() rebuilds them from one GROUP BY query
+(daily, and whenever the set is missing — e.g. after a Redis flush).
+"""
+
+import frappe
+from frappe.utils import cstr
+
+LOAD_KEY = "re_lead_load"
+SEEDED_KEY = "re_lead_load:seeded"
+ROUND_ROBIN_KEY = "re_lead_round_robin"
+PROJECT_RMS_KEY = "re_lead_project_rms"
+
+# Leads in these statuses no longer count towards an RM's load.
+CLOSED_STATUSES = ("Converted", "Do Not Contact", "Lost Quotation")
+
+STRATEGIES = {"Least Loaded": "least_loaded", "Round Robin": "round_robin"}
+
+# KEYS: load set, round-robin counter. ARGV: strategy, candidate RMs.
+_PICK_SCRIPT = """
+local pick
+if ARGV[1] == 'round_robin' then
+    local i = redis.call('INCR', KEYS[2])
+    pick = ARGV[((i - 1) % (#ARGV - 1)) + 2]
+else
+    local best
+    for i = 2, #ARGV do
+        local load = tonumber(redis.call('ZSCORE', KEYS[1], ARGV[i]) or '0')
+        if best == nil or load < best then
+            best = load
+            pick = ARGV[i]
+        end
+    end
+end
+redis.call('ZINCRBY', KEYS[1], 1, pick)
+return pick
+"""
+
+
+# ─── Lead hooks (hooks.py doc_events) ────────────────────────────────────────
+
+
+def on_lead_before_insert(doc, method=None):
+    if doc.re_assigned_rm or not doc.re_interested_in_project or not is_open(doc):
+        return
+
+    settings = frappe.get_cached_doc("RE CRM Settings")
+    if not settings.auto_assign_leads:
+        return
+
+    rm = pick_rm(doc.re_interested_in_project, settings.lead_assignment_strategy)
+    if rm:
+        doc.re_assigned_rm = rm
+        # Already counted by the pick; undo it if the insert is rolled back.
+        doc.flags.re_lead_counted = True
+        frappe.db.after_rollback.add(lambda: _adjust({rm: -1}))
+
+
+def on_lead_update(doc, method=None):
+    before = doc.get_doc_before_save()
+    old_rm = before.re_assigned_rm if before and is_open(before) else None
+    new_rm = doc.re_assigned_rm if is_open(doc) else None
+    if doc.flags.re_lead_counted:
+        old_rm = new_rm
+        doc.flags.re_lead_counted = False
+
+    if old_rm != new_rm:
+        changes = {}
+        if old_rm:
+            changes[old_rm] = -1
+        if new_rm:
+            changes[new_rm] = changes.get(new_rm, 0) + 1
+        frappe.db.after_commit.add(lambda: _adjust(changes))
+
+
+def on_lead_trash(doc, method=None):
+    if doc.re_assigned_rm and is_open(doc):
+        rm = doc.re_assigned_rm
+        frappe.db.after_commit.add(lambda: _adjust({rm: -1}))
+
+
+# ─── Public API ──────────────────────────────────────────────────────────────
+
+
+def is_open(lead):
+    return lead.status not in CLOSED_STATUSES
+
+
+def pick_rm(project, strategy=None):
+    """Assign-and-count an RM for a new lead on `project`; None if it has no Active RM."""
+    candidates = get_project_rms(project)
+    if not candidates:
+        return None
+
+    strategy = STRATEGIES.get(strategy, "least_loaded")
+    cache = frappe.cache()
+    try:
+        _ensure_seeded()
+        rm = cache.eval(
+            _PICK_SCRIPT,
+            2,
+            cache.make_key(LOAD_KEY),
+            cache.make_key(f"{ROUND_ROBIN_KEY}:{project}"),
+            strategy,
+            *candidates,
+        )
+    except Exception:
+        frappe.logger("real_estate_crm").warning("Lead auto-assignment skipped", exc_info=True)
+        return None
+    return frappe.safe_decode(rm)
+
+
+def get_project_rms(project):
+    """Active RMs assigned to `project`, sorted (cached until an RM is saved or deleted)."""
+    return frappe.cache().hget(
+        PROJECT_RMS_KEY,
+        project,
+        generator=lambda: frappe.db.sql_list(
+            """
+            SELECT rm.name
+            FROM `tabRE Relationship Manager` rm
+            INNER JOIN `tabRE RM Project` p ON p.parent = rm.name
+                AND p.parenttype = 'RE Relationship Manager'
+            WHERE rm.status = 'Active' AND p.project = %s
+            ORDER BY rm.name
+            """,
+            project,
+        ),
+    )
+
+
+def get_loads(rms=None):
+    """{rm: open leads} from the Redis counters."""
+    _ensure_seeded()
+    loads = {
+        frappe.safe_decode(rm): int(score)
+        for rm, score in frappe.cache().zrange(frappe.cache().make_key(LOAD_KEY), 0, -1, withscores=True)
+    }
+    if rms is None:
+        return loads
+    return {rm: loads.get(rm, 0) for rm in rms}
+
+
+def clear_project_rms():
+    """
+    Drop the project → RMs cache once the transaction commits; called when
+    an RM is saved or deleted. Clearing earlier would let a concurrent
+    request re-cache the uncommitted state.
+    """
+    frappe.db.after_commit.add(lambda: frappe.cache().delete_key(PROJECT_RMS_KEY))
+
+
+def reconcile():
+    """Rebuild the open-lead counters from tabLead (daily job)."""
+    counts = frappe.db.sql(
+        """
+        SELECT re_assigned_rm, COUNT(*)
+        FROM `tabLead`
+        WHERE IFNULL(re_assigned_rm, '') != ''
+            AND status NOT IN %(closed)s
+        GROUP BY re_assigned_rm
+        """,
+        {"closed": CLOSED_STATUSES},
+    )
+    cache = frappe.cache()
+    pipe = cache.pipeline()
+    pipe.delete(cache.make_key(LOAD_KEY))
+    if counts:
+        pipe.zadd(cache.make_key(LOAD_KEY), {rm: count for rm, count in counts})
+    pipe.set(cache.make_key(SEEDED_KEY), 1)
+    pipe.execute()
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _ensure_seeded():
+    if not frappe.cache().get(frappe.cache().make_key(SEEDED_KEY)):
+        reconcile()
+
+
+def _adjust(changes):
+    try:
+        cache = frappe.cache()
+        pipe = cache.pipeline()
+        for rm, delta in changes.items():
+            pipe.zincrby(cache.make_key(LOAD_KEY), delta, cstr(rm))
+        pipe.execute()
+    except Exception:
+        # Drift is corrected by the daily reconcile().
+        frappe.logger("real_estate_crm").warning("Could not update lead counters", exc_info=True)
@@ -0,0 +1,108 @@
+"""
+Duplicate detection keys for Leads and Customers.
+
+Every Lead and Customer carries two indexed custom fields holding hashes of
+its normalized contact details:
+
+    re_phone_hash   md5 of the last 10 digits of the mobile (or phone) number
+    re_email_hash   md5 of the trimmed, lower-cased email
+
+Both are '' when the detail is missing, so NULL only means "not hashed yet".
+They are set on validate (hooks.py) and back-filled on migrate; the bulk
+lead import looks up a whole chunk of rows in one query against them.
+"""
+
+import hashlib
+import re
+
+import frappe
+
+PHONE_DIGITS = 10
+BACKFILL_CHUNK = 5000
+
+# doctype → (phone fields, in order of preference; email field)
+CONTACT_FIELDS = {
+    "Lead": (("mobile_no", "phone"), "email_id"),
+    "Customer": (("mobile_no",), "email_id"),
+}
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_phone(value):
+    """Digits only, national part: "+91 98480-22338" → "9848022338"."""
+    digits = _NON_DIGITS.sub("", value or "")
+    if len(digits) < 7:
+        return ""
+    return digits[-PHONE_DIGITS:]
+
+
+def normalize_email(value):
+    value = (value or "").strip().lower()
+    return value if "@" in value else ""
+
+
+def hash_key(value):
+    return hashlib.md5(value.encode()).hexdigest() if value else ""
+
+
+def get_keys(doctype, values):
+    """(phone hash, email hash) for a doc or dict of `doctype`."""
+    phone_fields, email_field = CONTACT_FIELDS[doctype]
+    phone = next((p for p in (normalize_phone(values.get(f)) for f in phone_fields) if p), "")
+    return hash_key(phone), hash_key(normalize_email(values.get(email_field)))
+
+
+def set_keys(doc, method=None):
+    """validate hook for Lead and Customer."""
+    doc.re_phone_hash, doc.re_email_hash = get_keys(doc.doctype, doc)
+
+
+def find_matches(phone_hashes, email_hashes):
+    """
+    Existing Leads and Customers with any of the given hashes, in one query:
+    [{"doctype", "name", "phone_hash", "email_hash"}]. Customers first.
+    """
+    phone_hashes = tuple(h for h in phone_hashes if h) or ("",)
+    email_hashes = tuple(h for h in email_hashes if h) or ("",)
+    parts = [
+        f"""
+        SELECT '{doctype}' AS doctype, name, re_phone_hash AS phone_hash, re_email_hash AS email_hash
+        FROM `tab{doctype}`
+        WHERE (re_phone_hash IN %(phones)s AND re_phone_hash != '')
+            OR (re_email_hash IN %(emails)s AND re_email_hash != '')
+        """
+        for doctype in ("Customer", "Lead")
+    ]
+    return frappe.db.sql(
+        " UNION ALL ".join(parts),
+        {"phones": phone_hashes, "emails": email_hashes},
+        as_dict=True,
+    )
+
+
+def backfill_keys():
+    """Hash every Lead and Customer not hashed yet (after_migrate; cheap once done)."""
+    for doctype, (phone_fields, email_field) in CONTACT_FIELDS.items():
+        fields = ", ".join(("name",) + phone_fields + (email_field,))
+        while True:
+            rows = frappe.db.sql(
+                f"SELECT {fields} FROM `tab{doctype}` WHERE re_phone_hash IS NULL LIMIT %s",
+                BACKFILL_CHUNK,
+                as_dict=True,
+            )
+            if not rows:
+                break
+
+            # One UPDATE per chunk, joined to the chunk's keys as a derived table.
+            keys = " UNION ALL ".join(["SELECT %s AS name, %s AS phone_hash, %s AS email_hash"] * len(rows))
+            values = [v for row in rows for v in (row.name, *get_keys(doctype, row))]
+            frappe.db.sql(
+                f"""
+                UPDATE `tab{doctype}` t
+                INNER JOIN ({keys}) k ON k.name = t.name
+                SET t.re_phone_hash = k.phone_hash, t.re_email_hash = k.email_hash
+                """,
+                values,
+            )
+            frappe.db.commit()
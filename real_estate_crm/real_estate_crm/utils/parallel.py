@@ -0,0 +1,51 @@
+"""
+Run independent read-only sections concurrently, each on its own DB
+connection (and on the replica when one is configured).
+
+    results = run_sections({"kpi_cards": (_get_kpi_cards, ()), ...})
+
+Used by the dashboards' batched mode. Each worker thread initialises its own
+Frappe context for the calling site and user, so sections must not rely on
+request state beyond frappe.session.user. Pool size: `re_dashboard_workers`
+in site_config.json (default 4).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import frappe
+from frappe.utils import cint
+
+from real_estate_crm.perf.instrumentation import collect_sections, fold_sections
+from real_estate_crm.utils.replica import close_replica, use_replica
+
+DEFAULT_WORKERS = 4
+
+
+def run_sections(calls, max_workers=None):
+    """{name: (fn, args)} → {name: result}, in the order given."""
+    if not calls:
+        return {}
+
+    site, sites_path, user = frappe.local.site, frappe.local.sites_path, frappe.session.user
+    max_workers = max_workers or cint(frappe.conf.get("re_dashboard_workers")) or DEFAULT_WORKERS
+
+    def worker(fn, args):
+        frappe.init(site=site, sites_path=sites_path)
+        try:
+            frappe.connect()
+            frappe.set_user(user)
+            with collect_sections() as sections:
+                result = use_replica()(fn)(*args)
+            return result, sections
+        finally:
+            close_replica()
+            frappe.destroy()
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        futures = {name: pool.submit(worker, fn, args) for name, (fn, args) in calls.items()}
+        for name, future in futures.items():
+            result, sections = future.result()
+            fold_sections(sections)
+            results[name] = result
+    return results
@@ -0,0 +1,206 @@
+"""
+Read-replica routing for read-only analytics (dashboards, reports, search).
+
+    @frappe.whitelist()
+    @use_replica()
+    @instrument()
+    def get_dashboard_data(): ...
+
+Uses Frappe's own replica settings in site_config.json:
+
+    "read_from_replica": 1,
+    "replica_host": "127.0.0.1",
+    "replica_db_port": 3307,
+
+plus `"re_replica_max_lag"` (seconds, default 30; 0 skips the check). The
+call falls back to the primary when the replica is unreachable, when it
+is further behind than the lag ceiling or its lag is unknown, and when the
+current transaction has already written (the replica could not see it yet).
+
+The lag is remembered for the request and in Redis (an unknown lag, e.g.
+without the REPLICA MONITOR privilege, for longer), and a known-bad lag
+skips the replica without connecting. One replica connection serves every
+wrapped call of a request or job; close_replica() (after_request /
+after_job hooks) closes it.
+
+`use_replica()` must sit outside `instrument()` so the instrumentation sees
+the connection that actually serves the queries. See setup_replica.sh for a
+local primary + replica pair.
+"""
+
+import functools
+
+import frappe
+from frappe.utils import cint
+
+LAG_CACHE_KEY = "re_replica_lag"
+LAG_CACHE_TTL = 10
+LAG_UNKNOWN_TTL = 300
+DEFAULT_MAX_LAG = 30
+
+
+def use_replica():
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not is_configured() or _has_pending_writes() or not _lag_may_be_ok():
+                return fn(*args, **kwargs)
+
+            switched = _switch_to_replica()
+            if switched is None:
+                return fn(*args, **kwargs)
+
+            try:
+                if _lag_ok():
+                    return fn(*args, **kwargs)
+                return _run_on_primary(fn, args, kwargs)
+            finally:
+                if switched:
+                    _switch_to_primary()
+
+        return wrapper
+
+    return decorator
+
+
+def is_configured():
+    return bool(frappe.conf.get("read_from_replica") and frappe.conf.get("replica_host"))
+
+
+def is_reading_from_replica():
+    return _on_replica()
+
+
+def get_max_lag():
+    return cint(frappe.conf.get("re_replica_max_lag", DEFAULT_MAX_LAG))
+
+
+def get_replica_lag():
+    """
+    Seconds_Behind_Master of the replica; None if unknown. Cached for the
+    request and in Redis; on a miss it is read from the current (replica)
+    connection.
+    """
+    known, lag = _cached_lag()
+    if known:
+        return lag
+
+    try:
+        status = frappe.db.sql("SHOW SLAVE STATUS", as_dict=True)
+        lag = status[0].get("Seconds_Behind_Master") if status else None
+    except Exception:
+        # Missing REPLICA MONITOR privilege, or not a replica at all.
+        lag = None
+
+    lag = None if lag is None else cint(lag)
+    frappe.local.re_replica_lag = lag
+    frappe.cache().set_value(
+        LAG_CACHE_KEY, -1 if lag is None else lag, expires_in_sec=LAG_UNKNOWN_TTL if lag is None else LAG_CACHE_TTL
+    )
+    return lag
+
+
+def close_replica(*args, **kwargs):
+    """Close the replica connection kept for this request / job (after_request, after_job)."""
+    replica = getattr(frappe.local, "re_replica_db", None)
+    if replica is None:
+        return
+    del frappe.local.re_replica_db
+    try:
+        replica.close()
+    except Exception:
+        pass
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _has_pending_writes():
+    return bool(getattr(frappe.local, "db", None) and getattr(frappe.db, "transaction_writes", 0))
+
+
+def _on_replica():
+    primary = getattr(frappe.local, "primary_db", None)
+    return primary is not None and frappe.local.db is not primary
+
+
+def _switch_to_replica():
+    """True if switched, False if already on the replica (nested call or
+    inside frappe.read_only), None if the replica could not be reached."""
+    if _on_replica():
+        return False
+    if getattr(frappe.local, "re_replica_unavailable", False):
+        return None
+
+    replica = getattr(frappe.local, "re_replica_db", None)
+    if replica is not None:
+        frappe.local.primary_db, frappe.local.replica_db = frappe.local.db, replica
+        frappe.local.db = replica
+        return True
+
+    # frappe.read_only leaves closed handles behind; connect_replica() would
+    # then skip reconnecting.
+    _forget_replica()
+    try:
+        frappe.connect_replica()
+        frappe.local.db.connect()
+    except Exception:
+        frappe.logger("real_estate_crm").warning("Replica unavailable, reading from primary", exc_info=True)
+        if getattr(frappe.local, "primary_db", None) is not None:
+            frappe.local.db = frappe.local.primary_db
+        _forget_replica()
+        # Don't retry for every wrapped call of this request.
+        frappe.local.re_replica_unavailable = True
+        return None
+    frappe.local.re_replica_db = frappe.local.db
+    return True
+
+
+def _switch_to_primary():
+    # The connection stays open for the next wrapped call; see close_replica().
+    frappe.local.db = frappe.local.primary_db
+    _forget_replica()
+
+
+def _forget_replica():
+    for attr in ("replica_db", "primary_db"):
+        if hasattr(frappe.local, attr):
+            delattr(frappe.local, attr)
+
+
+def _lag_ok():
+    max_lag = get_max_lag()
+    if not max_lag:
+        return True
+    lag = get_replica_lag()
+    return lag is not None and lag <= max_lag
+
+
+def _lag_may_be_ok():
+    """False when a cached lag already rules the replica out (no connection needed)."""
+    max_lag = get_max_lag()
+    if not max_lag:
+        return True
+    known, lag = _cached_lag()
+    return not known or (lag is not None and lag <= max_lag)
+
+
+def _cached_lag():
+    """(known, lag) from this request, else from Redis."""
+    if hasattr(frappe.local, "re_replica_lag"):
+        return True, frappe.local.re_replica_lag
+
+    cached = frappe.cache().get_value(LAG_CACHE_KEY)
+    if cached is None:
+        return False, None
+    frappe.local.re_replica_lag = None if cached < 0 else cached
+    return True, frappe.local.re_replica_lag
+
+
+def _run_on_primary(fn, args, kwargs):
+    replica = frappe.local.db
+    frappe.local.db = frappe.local.primary_db
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        frappe.local.db = replica
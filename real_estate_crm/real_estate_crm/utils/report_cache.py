@@ -0,0 +1,109 @@
+"""
+Short-lived result cache for Real Estate CRM script reports.
+
+    @instrument(kind="report")
+    @cached_report()
+    def execute(filters=None): ...
+
+Results are keyed by report, normalized filters and the user's permission
+scope (roles + User Permissions), and expire after `ttl` seconds. Every key
+also carries a generation stamp; `invalidate()` rotates the stamp, so all
+cached results go stale at once without scanning Redis. Bookings, payments,
+RM changes and the daily overdue job call `invalidate()`; the rotation
+waits for their transaction to commit.
+
+Set `"re_report_cache_ttl": 0` in site_config.json to turn caching off, or
+`frappe.flags.re_skip_report_cache` to bypass it for one request.
+"""
+
+import functools
+import hashlib
+import json
+
+import frappe
+from frappe.core.doctype.user_permission.user_permission import get_user_permissions
+from frappe.utils import cint, cstr
+
+KEY_PREFIX = "re_report_cache"
+GENERATION_KEY = "re_report_cache_generation"
+DEFAULT_TTL = 300
+
+
+def cached_report(ttl=None):
+    """Decorator for a report's `execute(filters=None)`."""
+
+    def decorator(fn):
+        report = fn.__module__.rsplit(".", 1)[-1]
+
+        @functools.wraps(fn)
+        def wrapper(filters=None):
+            expires_in = get_ttl(ttl)
+            if not expires_in or frappe.flags.re_skip_report_cache:
+                return fn(filters)
+
+            key = _make_key(report, filters)
+            cached = frappe.cache().get_value(key)
+            if cached is not None:
+                return cached
+
+            result = fn(filters)
+            frappe.cache().set_value(key, result, expires_in_sec=expires_in)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_ttl(ttl=None):
+    return cint(frappe.conf.get("re_report_cache_ttl", ttl if ttl is not None else DEFAULT_TTL))
+
+
+def get_generation():
+    """Current generation stamp; derived caches can key on it to expire with reports."""
+    return frappe.cache().get_value(GENERATION_KEY) or "0"
+
+
+def invalidate(*args, **kwargs):
+    """
+    Make every cached report result stale, once the current transaction
+    commits. Safe to use as a doc_events hook.
+    """
+    if frappe.db and getattr(frappe.db, "transaction_writes", 0):
+        # Rotating now would let a report run before the commit cache
+        # pre-commit data under the new generation for the whole TTL.
+        frappe.db.after_commit.add(_rotate_generation)
+    else:
+        _rotate_generation()
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _rotate_generation():
+    frappe.cache().set_value(GENERATION_KEY, frappe.generate_hash(length=10))
+
+
+def _make_key(report, filters):
+    return ":".join((KEY_PREFIX, report, get_generation(), _scope_hash(), _filters_hash(filters)))
+
+
+def _filters_hash(filters):
+    """Blank filters are dropped and values stringified, so equivalent filter
+    sets ({"rm": ""} vs {}, date vs "YYYY-MM-DD") share one key."""
+    normalized = {k: cstr(v) for k, v in (filters or {}).items() if v not in (None, "", [])}
+    return _digest(normalized)
+
+
+def _scope_hash():
+    user = frappe.session.user
+    return _digest(
+        {
+            "roles": sorted(frappe.get_roles(user)),
+            "user_permissions": get_user_permissions(user),
+        }
+    )
+
+
+def _digest(value):
+    return hashlib.md5(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()[:16]
@@ -0,0 +1,153 @@
+"""
+Version stamps for conditional dashboard / Customer 360 responses.
+
+Every change that can move a dashboard figure bumps a Redis counter per
+(scope, domain), where scope is "global", "project:<name>",
+"customer:<name>" or "rm:<name>" and domain is one of DOMAINS:
+
+    bump(("booking", "payment"), project=booking.project, customer=booking.customer)
+
+A page section declares the domains it reads; its version is today's date
+plus those counters, so a section goes stale when one of its inputs changes
+or the day rolls over (overdue days, upcoming dues):
+
+    SECTION_DOMAINS = {"kpi_cards": ("booking", "payment", "plot"), ...}
+    versions = get_versions(SECTION_DOMAINS, project=project)
+
+Endpoints take the client's last version and answer `{"version", "not_modified": 1}`
+instead of recomputing (see `respond` / `respond_sections`).
+
+Bumps run after commit, so a client can never pair a new version with
+pre-commit data. On the read replica the data may still trail a recent bump;
+within the lag ceiling of the last bump versions come back as None, which
+clients must not cache. Counters are seeded with the current time in ms, so
+after a Redis flush they restart above any version a browser still holds.
+"""
+
+import time
+
+import frappe
+from frappe.utils import cint, cstr, nowdate
+
+from real_estate_crm.utils.replica import DEFAULT_MAX_LAG, get_max_lag, is_reading_from_replica
+
+KEY_PREFIX = "re_version"
+BUMPED_AT = "bumped_at"
+DOMAINS = ("booking", "payment", "plot", "project", "rm", "customer", "lead")
+
+
+def bump(domains, project=None, customer=None, projects=(), customers=(), rms=()):
+    """Bump `domains` globally and for the given project(s) / customer(s) / RMs, after commit."""
+    scopes = ["global"]
+    scopes += [f"project:{p}" for p in {project, *projects} if p]
+    scopes += [f"customer:{c}" for c in {customer, *customers} if c]
+    scopes += [f"rm:{rm}" for rm in set(rms) if rm]
+
+    if frappe.db and getattr(frappe.db, "transaction_writes", 0):
+        frappe.db.after_commit.add(lambda: _incr(scopes, domains))
+    else:
+        _incr(scopes, domains)
+
+
+def get_versions(section_domains, project=None, customer=None, rm=None):
+    """{section: version} for one scope, from a single MGET."""
+    scope = (
+        f"project:{project}" if project else f"customer:{customer}" if customer else f"rm:{rm}" if rm else "global"
+    )
+    domains = sorted({d for section in section_domains.values() for d in section})
+    *values, bumped_at = frappe.cache().mget([_key(scope, d) for d in domains] + [_key(scope, BUMPED_AT)])
+    if _replica_may_trail(bumped_at):
+        return dict.fromkeys(section_domains)
+
+    counters = dict(zip(domains, values))
+    today = nowdate()
+    return {
+        section: ".".join([today] + [cstr(int(counters[d] or 0)) for d in section_domains[section]])
+        for section in section_domains
+    }
+
+
+def respond(version, client_version, compute):
+    """Envelope for one section: skip `compute()` when the client is current."""
+    if version and client_version == version:
+        return {"version": version, "not_modified": 1}
+    return {"version": version, "data": compute()}
+
+
+def respond_sections(versions, client_versions, compute):
+    """
+    Envelope for a batched call: `compute(names)` → {section: data} runs only
+    for the sections whose version differs from `client_versions`.
+    """
+    client_versions = frappe.parse_json(client_versions) or {}
+    stale = [name for name, version in versions.items() if not version or client_versions.get(name) != version]
+    if not stale:
+        return {"versions": versions, "not_modified": 1}
+    return {"versions": versions, "sections": compute(stale)}
+
+
+def on_doc_change(doc, method=None):
+    """doc_events hook for native doctypes feeding Customer 360 / dashboards."""
+    if doc.doctype == "Payment Entry":
+        rms = (doc.get("re_assigned_rm"),)
+        if doc.party_type == "Customer":
+            bump(("payment",), customer=doc.party, rms=rms)
+        else:
+            bump(("payment",), rms=rms)
+        return
+
+    if doc.doctype == "Lead":
+        # RM dashboard lead counts: new, deleted and reassigned leads only.
+        before = doc.get_doc_before_save()
+        rms = {doc.re_assigned_rm, before.re_assigned_rm if before else None} - {None, ""}
+        if rms and (method == "on_trash" or not before or before.re_assigned_rm != doc.re_assigned_rm):
+            bump(("lead",), rms=rms)
+        return
+
+    customers = _linked_customers(doc)
+    if customers:
+        bump(("customer",), customers=customers)
+
+
+# ─── Internals ───────────────────────────────────────────────────────────────
+
+
+def _key(scope, domain):
+    return frappe.cache().make_key(f"{KEY_PREFIX}:{scope}:{domain}")
+
+
+def _incr(scopes, domains):
+    now = int(time.time() * 1000)
+    try:
+        pipe = frappe.cache().pipeline()
+        for scope in scopes:
+            for domain in domains:
+                key = _key(scope, domain)
+                pipe.set(key, now, nx=True)
+                pipe.incr(key)
+            pipe.set(_key(scope, BUMPED_AT), now)
+        pipe.execute()
+    except Exception:
+        # A missed bump only matters while Redis is down; the counters are
+        # re-seeded above every stored version once it is back.
+        frappe.logger("real_estate_crm").warning("Could not bump version stamps", exc_info=True)
+
+
+def _replica_may_trail(bumped_at):
+    if not bumped_at or not is_reading_from_replica():
+        return False
+    window_ms = (get_max_lag() or DEFAULT_MAX_LAG) * 1000
+    return int(time.time() * 1000) - cint(bumped_at) < window_ms
+
+
+def _linked_customers(doc):
+    if doc.doctype == "Customer":
+        return [doc.name]
+    if doc.doctype in ("Contact", "Address"):
+        return [link.link_name for link in doc.get("links") or [] if link.link_doctype == "Customer"]
+    if doc.doctype == "Comment":
+        if doc.reference_doctype == "Customer":
+            return [doc.reference_name]
+        if doc.reference_doctype == "RE Booking" and doc.reference_name:
+            return [frappe.db.get_value("RE Booking", doc.reference_name, "customer")]
+    return []
@@ -0,0 +1,186 @@
+#!/usr/bin/env bash
+# ─────────────────────────────────────────────────────────────────────────────
+# Real Estate CRM — Local Read Replica Setup
+# Adds a second MariaDB instance (port 3307) replicating from the primary
+# (port 3306) and points a site's read-only analytics at it.
+#
+# Usage (after setup_ubuntu.sh):
+#   chmod +x setup_replica.sh
+#   ./setup_replica.sh
+#
+# What this script does:
+#   1. Enables binary logging + GTID on the primary MariaDB
+#   2. Creates a replication user on the primary
+#   3. Initialises a second data directory and starts it on port 3307
+#   4. Seeds the replica from a consistent dump and starts replication
+#   5. Sets read_from_replica / replica_host / replica_db_port /
+#      re_replica_max_lag in the site's site_config.json
+#
+# Dashboards, reports and global search then read from the replica
+# (real_estate_crm.utils.replica); writes stay on the primary.
+#
+# Stop the replica:   sudo mariadb-admin -S /run/mysqld/mysqld-replica.sock shutdown
+# Start it again:     sudo mysqld_safe --defaults-file=/etc/mysql/recrm-replica.cnf &
+# ─────────────────────────────────────────────────────────────────────────────
+
+set -euo pipefail
+
+# ── Configuration ────────────────────────────────────────────────────────────
+
+SITE_NAME="recrm.localhost"
+BENCH_DIR="$HOME/frappe-bench"
+
+REPLICA_PORT=3307
+REPLICA_DATADIR="/var/lib/mysql-replica"
+REPLICA_SOCKET="/run/mysqld/mysqld-replica.sock"
+REPLICA_CONF="/etc/mysql/recrm-replica.cnf"
+PRIMARY_CONF="/etc/mysql/mariadb.conf.d/60-recrm-primary.cnf"
+
+REPL_USER="recrm_repl"
+REPL_PASSWORD="recrm_repl_pw"
+
+# Reads fall back to the primary when the replica is further behind than this.
+MAX_LAG_SECONDS=30
+
+DB_ROOT_PASSWORD=""
+
+# ── Colors ───────────────────────────────────────────────────────────────────
+
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+CYAN='\033[0;36m'
+NC='\033[0m' # No Color
+
+log()  { echo -e "${GREEN}[✓]${NC} $1"; }
+warn() { echo -e "${YELLOW}[!]${NC} $1"; }
+info() { echo -e "${CYAN}[i]${NC} $1"; }
+err()  { echo -e "${RED}[✗]${NC} $1"; exit 1; }
+
+# ── Pre-flight checks ───────────────────────────────────────────────────────
+
+if [ "$(id -u)" -eq 0 ]; then
+    err "Do NOT run this script as root. Run as a regular user — it uses sudo internally."
+fi
+
+SITE_CONFIG="$BENCH_DIR/sites/$SITE_NAME/site_config.json"
+[ -f "$SITE_CONFIG" ] || err "Site config not found: $SITE_CONFIG — run setup_ubuntu.sh first."
+
+if [ -z "$DB_ROOT_PASSWORD" ]; then
+    read -sp "MariaDB root password: " DB_ROOT_PASSWORD
+    echo ""
+fi
+
+primary() { mysql -u root -p"$DB_ROOT_PASSWORD" "$@"; }
+# Fresh replica: root via unix_socket. After seeding, root carries the primary's
+# password — sudo + -p covers both.
+replica() { sudo mysql -u root -p"$DB_ROOT_PASSWORD" -S "$REPLICA_SOCKET" "$@"; }
+
+primary -e "SELECT 1;" > /dev/null 2>&1 || err "Cannot connect to the primary MariaDB as root."
+
+SITE_DB_USER=$(python3 -c "import json; c = json.load(open('$SITE_CONFIG')); print(c.get('db_user') or c['db_name'])")
+
+# ── Step 1: Binary log on the primary ───────────────────────────────────────
+
+info "Step 1/5 — Enabling binary logging on the primary..."
+
+if [ ! -f "$PRIMARY_CONF" ]; then
+    sudo tee "$PRIMARY_CONF" > /dev/null <<'MYCNF'
+[mysqld]
+server-id        = 1
+log_bin          = mysql-bin
+binlog_format    = ROW
+expire_logs_days = 3
+MYCNF
+    sudo systemctl restart mariadb
+    log "Primary restarted with binlog enabled."
+else
+    log "Primary binlog config already exists — skipping."
+fi
+
+# ── Step 2: Replication user ────────────────────────────────────────────────
+
+info "Step 2/5 — Creating replication user..."
+
+primary -e "
+    CREATE USER IF NOT EXISTS '$REPL_USER'@'127.0.0.1' IDENTIFIED BY '$REPL_PASSWORD';
+    GRANT REPLICATION SLAVE ON *.* TO '$REPL_USER'@'127.0.0.1';
+"
+# Lets the site user read Seconds_Behind_Master for the lag ceiling.
+# Replicated to the replica along with the rest of mysql.*.
+for host in $(primary -N -e "SELECT host FROM mysql.user WHERE user = '$SITE_DB_USER';"); do
+    primary -e "GRANT REPLICA MONITOR ON *.* TO '$SITE_DB_USER'@'$host';"
+done
+log "Replication user ready."
+
+# ── Step 3: Second instance ─────────────────────────────────────────────────
+
+info "Step 3/5 — Starting replica instance on port $REPLICA_PORT..."
+
+if [ ! -f "$REPLICA_CONF" ]; then
+    sudo tee "$REPLICA_CONF" > /dev/null <<MYCNF
+[mysqld]
+server-id            = 2
+port                 = $REPLICA_PORT
+bind-address         = 127.0.0.1
+socket               = $REPLICA_SOCKET
+datadir              = $REPLICA_DATADIR
+pid-file             = /run/mysqld/mysqld-replica.pid
+log-error            = /var/log/mysql/replica-error.log
+relay_log            = replica-relay-bin
+read_only            = 1
+character-set-server = utf8mb4
+collation-server     = utf8mb4_unicode_ci
+MYCNF
+fi
+
+if [ ! -d "$REPLICA_DATADIR/mysql" ]; then
+    sudo mariadb-install-db --defaults-file="$REPLICA_CONF" --user=mysql > /dev/null
+fi
+
+if ! sudo test -S "$REPLICA_SOCKET"; then
+    sudo mysqld_safe --defaults-file="$REPLICA_CONF" > /dev/null 2>&1 &
+    for _ in $(seq 1 30); do
+        sudo test -S "$REPLICA_SOCKET" && break
+        sleep 1
+    done
+fi
+sudo test -S "$REPLICA_SOCKET" || err "Replica did not start — see /var/log/mysql/replica-error.log"
+log "Replica instance running."
+
+# ── Step 4: Seed + start replication ────────────────────────────────────────
+
+info "Step 4/5 — Seeding replica from the primary (this can take a while)..."
+
+replica -e "STOP SLAVE; RESET SLAVE ALL;" > /dev/null 2>&1 || true
+
+# --gtid + --master-data records gtid_slave_pos in the dump, so replication
+# resumes exactly where the snapshot ends.
+mysqldump -u root -p"$DB_ROOT_PASSWORD" \
+    --all-databases --single-transaction --gtid --master-data=1 --routines --events --flush-privileges \
+    | replica
+
+replica -e "
+    CHANGE MASTER TO
+        MASTER_HOST = '127.0.0.1',
+        MASTER_PORT = 3306,
+        MASTER_USER = '$REPL_USER',
+        MASTER_PASSWORD = '$REPL_PASSWORD',
+        MASTER_USE_GTID = slave_pos;
+    START SLAVE;
+"
+sleep 2
+replica -e "SHOW SLAVE STATUS\G" | grep -E "Slave_IO_Running|Slave_SQL_Running|Seconds_Behind_Master"
+log "Replication started."
+
+# ── Step 5: Site config ─────────────────────────────────────────────────────
+
+info "Step 5/5 — Pointing $SITE_NAME at the replica..."
+
+cd "$BENCH_DIR"
+bench --site "$SITE_NAME" set-config -p read_from_replica 1
+bench --site "$SITE_NAME" set-config replica_host 127.0.0.1
+bench --site "$SITE_NAME" set-config -p replica_db_port "$REPLICA_PORT"
+bench --site "$SITE_NAME" set-config -p re_replica_max_lag "$MAX_LAG_SECONDS"
+
+log "Done. Read-only analytics on $SITE_NAME now use the replica on port $REPLICA_PORT."